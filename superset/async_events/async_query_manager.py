@@ -23,7 +23,6 @@ from typing import Any, Literal, Optional, Union
 import jwt
 import redis
 from flask import Flask, Request, request, Response, session
-from flask_caching.backends.base import BaseCache
 
 from superset.async_events.cache_backend import (
     RedisCacheBackend,
@@ -103,10 +102,14 @@ class AsyncQueryManager:
 
     def __init__(self) -> None:
         super().__init__()
-        self._cache: Optional[BaseCache] = None
+        self._cache: Optional[
+            Union[RedisCacheBackend, RedisSentinelCacheBackend, redis.Redis[Any]]
+        ] = None
         self._stream_prefix: str = ""
         self._stream_limit: Optional[int]
         self._stream_limit_firehose: Optional[int]
+        self._long_polling_timeout: int = 0
+        self._job_deduplication_timeout: int = 0
         self._jwt_cookie_name: str = ""
         self._jwt_cookie_secure: bool = False
         self._jwt_cookie_domain: Optional[str]
@@ -141,6 +144,10 @@ class AsyncQueryManager:
         self._stream_limit_firehose = config[
             "GLOBAL_ASYNC_QUERIES_REDIS_STREAM_LIMIT_FIREHOSE"
         ]
+        self._long_polling_timeout = config["GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT"]
+        self._job_deduplication_timeout = config[
+            "GLOBAL_ASYNC_QUERIES_JOB_DEDUPLICATION_TIMEOUT"
+        ]
         self._jwt_cookie_name = config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_NAME"]
         self._jwt_cookie_secure = config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_SECURE"]
         self._jwt_cookie_samesite = config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_SAMESITE"]
@@ -159,6 +166,13 @@ class AsyncQueryManager:
         self._load_chart_data_into_cache_job = load_chart_data_into_cache
         self._load_explore_json_into_cache_job = load_explore_json_into_cache
 
+    @property
+    def job_deduplication_enabled(self) -> bool:
+        """
+        Whether identical chart data jobs are coalesced, see `submit_chart_data_job`.
+        """
+        return bool(self._job_deduplication_timeout)
+
     def register_request_handlers(self, app: Flask) -> None:
         @app.after_request
         def validate_session(response: Response) -> Response:
@@ -239,7 +253,26 @@ class AsyncQueryManager:
         channel_id: str,
         form_data: dict[str, Any],
         user_id: Optional[int] = None,
+        job_key: Optional[str] = None,
     ) -> dict[str, Any]:
+        """
+        Submit a job loading chart data into the cache.
+
+        When job deduplication is enabled and an identical job, with the same
+        `job_key`, is already running, the job is attached to it instead: it's
+        notified of its result on its own channel once it's done.
+
+        The attached jobs are only notified by the job they're attached to. If the
+        worker running it is lost, they're never notified, unless an identical job
+        submitted once the running one timed out completes while they're still
+        attached.
+
+        :param channel_id: The channel notified of the job events
+        :param form_data: The query context
+        :param user_id: The ID of the user submitting the job
+        :param job_key: The key identifying identical jobs
+        :returns: The metadata of the job
+        """
         # pylint: disable=import-outside-toplevel
         from superset import security_manager
 
@@ -248,23 +281,124 @@ class AsyncQueryManager:
         # this way we can keep the cache key consistent between sync and async command
         # so that it can be looked up consistently
         job_metadata = self.init_job(channel_id, user_id)
+        if not self._job_deduplication_timeout:
+            job_key = None
+        elif job_key and not self._start_job(job_key):
+            if self._attach_job(job_key, job_metadata):
+                return job_metadata
+            # the running job completed meanwhile, run this one on its own
+            job_key = None
+
         self._load_chart_data_into_cache_job.delay(
             {**job_metadata, "guest_token": guest_user.guest_token}
             if (guest_user := security_manager.get_current_guest_user_if_guest())
             else job_metadata,
             form_data,
+            **({"job_key": job_key} if job_key else {}),
         )
         return job_metadata
 
+    def _get_job_names(self, job_key: str) -> tuple[str, str]:
+        """
+        Return the names of the marker of a running job and of the list of the jobs
+        attached to it.
+        """
+        name = f"{self._stream_prefix}job-{job_key}"
+        return name, f"{name}-attached"
+
+    def _start_job(self, job_key: str) -> bool:
+        """
+        Mark a job as running, unless an identical one already is.
+
+        :returns: Whether the job was marked as running
+        """
+        if not self._cache:
+            raise CacheBackendNotInitialized("Cache backend not initialized")
+
+        running_name, _ = self._get_job_names(job_key)
+        with self._cache.pipeline() as pipe:
+            pipe.set(running_name, 1, ex=self._job_deduplication_timeout, nx=True)
+            (started,) = pipe.execute()
+        return bool(started)
+
+    def _attach_job(self, job_key: str, job_metadata: dict[str, Any]) -> bool:
+        """
+        Attach a job to the identical running one.
+
+        :returns: Whether the job was attached, i.e. it'll be notified of the result
+            of the running job
+        """
+        if not self._cache:
+            raise CacheBackendNotInitialized("Cache backend not initialized")
+
+        running_name, attached_name = self._get_job_names(job_key)
+        entry = json.dumps(job_metadata)
+        with self._cache.pipeline() as pipe:
+            pipe.rpush(attached_name, entry)
+            pipe.expire(attached_name, self._job_deduplication_timeout)
+            pipe.exists(running_name)
+            _, _, running = pipe.execute()
+            if running:
+                return True
+
+            # the running job completed after the job was attached, it was notified
+            # unless it's still in the list
+            pipe.lrem(attached_name, 1, entry)
+            (removed,) = pipe.execute()
+        return not removed
+
+    def update_attached_jobs(self, job_key: str, status: str, **kwargs: Any) -> None:
+        """
+        Mark a job as completed, and notify the jobs attached to it.
+
+        :param job_key: The key identifying identical jobs
+        :param status: The status of the job
+        """
+        if not self._cache:
+            raise CacheBackendNotInitialized("Cache backend not initialized")
+
+        running_name, attached_name = self._get_job_names(job_key)
+        with self._cache.pipeline() as pipe:
+            pipe.delete(running_name)
+            pipe.lrange(attached_name, 0, -1)
+            pipe.delete(attached_name)
+            _, entries, _ = pipe.execute()
+
+        for entry in entries:
+            self.update_job(json.loads(entry), status, **kwargs)
+
     def read_events(
         self, channel: str, last_id: Optional[str]
     ) -> list[Optional[dict[str, Any]]]:
+        """
+        Read the events of a channel following the last one received by the client.
+
+        When long polling is enabled and there are no such events yet, the read
+        blocks until some are written or the timeout expires. All the events
+        available at that point are returned in a single batch.
+
+        :param channel: The channel of the client
+        :param last_id: The ID of the last event received by the client
+        :returns: The events, up to `MAX_EVENT_COUNT`
+        """
         if not self._cache:
             raise CacheBackendNotInitialized("Cache backend not initialized")
 
         stream_name = f"{self._stream_prefix}{channel}"
-        start_id = increment_id(last_id) if last_id else "-"
-        results = self._cache.xrange(stream_name, start_id, "+", self.MAX_EVENT_COUNT)
+        if self._long_polling_timeout:
+            # XREAD returns the entries following the ID, i.e. excluding it
+            streams = self._cache.xread(
+                {stream_name: last_id or "0-0"},
+                self.MAX_EVENT_COUNT,
+                self._long_polling_timeout,
+            )
+            results = streams[0][1] if streams else []
+        else:
+            start_id = increment_id(last_id) if last_id else "-"
+            results = self._cache.xrange(
+                stream_name, start_id, "+", self.MAX_EVENT_COUNT
+            )
+
         # Decode bytes to strings, decode_responses is not supported at RedisCache and RedisSentinelCache
         if isinstance(self._cache, (RedisSentinelCacheBackend, RedisCacheBackend)):
             decoded_results = [
@@ -80,6 +80,18 @@ class RedisCacheBackend(RedisCache):
         count = count or self.MAX_EVENT_COUNT
         return self._cache.xrange(stream_name, start, end, count)
 
+    def xread(
+        self,
+        streams: Dict[str, str],
+        count: Optional[int] = None,
+        block: Optional[int] = None,
+    ) -> List[Any]:
+        count = count or self.MAX_EVENT_COUNT
+        return self._cache.xread(streams, count, block)
+
+    def pipeline(self, transaction: bool = True) -> redis.client.Pipeline:
+        return self._cache.pipeline(transaction)
+
     @classmethod
     def from_config(cls, config: Dict[str, Any]) -> "RedisCacheBackend":
         kwargs = {
@@ -191,6 +203,18 @@ class RedisSentinelCacheBackend(RedisSentinelCache):
         count = count or self.MAX_EVENT_COUNT
         return self._cache.xrange(stream_name, start, end, count)
 
+    def xread(
+        self,
+        streams: Dict[str, str],
+        count: Optional[int] = None,
+        block: Optional[int] = None,
+    ) -> List[Any]:
+        count = count or self.MAX_EVENT_COUNT
+        return self._cache.xread(streams, count, block)
+
+    def pipeline(self, transaction: bool = True) -> redis.client.Pipeline:
+        return self._cache.pipeline(transaction)
+
     @classmethod
     def from_config(cls, config: Dict[str, Any]) -> "RedisSentinelCacheBackend":
         kwargs = {
@@ -46,6 +46,20 @@ class Datasource(Schema):
     )
 
 
+class Database(Schema):
+    database_name = fields.String(
+        required=True,
+        metadata={"description": "Database name"},
+    )
+    catalog = fields.String(
+        allow_none=True,
+        metadata={"description": "Catalog of the datasources, all if omitted"},
+    )
+    schema = fields.String(
+        metadata={"description": "Schema of the datasources, all if omitted"},
+    )
+
+
 class CacheInvalidationRequestSchema(Schema):
     datasource_uids = fields.List(
         fields.String(),
@@ -55,3 +69,10 @@ class CacheInvalidationRequestSchema(Schema):
         fields.Nested(Datasource),
         metadata={"description": "A list of the data source and database names"},
     )
+    databases = fields.List(
+        fields.Nested(Database),
+        metadata={
+            "description": "A list of the databases, and optionally the catalogs "
+            "and schemas, whose datasources are invalidated"
+        },
+    )
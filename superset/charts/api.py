@@ -129,6 +129,7 @@ class ChartRestApi(BaseSupersetModelRestApi):
     method_permission_name = MODEL_API_RW_METHOD_PERMISSION_MAP
     show_columns = [
         "cache_timeout",
+        "stale_cache_timeout",
         "certified_by",
         "certification_details",
         "changed_on_delta_humanized",
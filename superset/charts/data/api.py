@@ -52,7 +52,13 @@ from superset.utils.core import (
     get_user_id,
 )
 from superset.utils.decorators import logs_context
-from superset.views.base import CsvResponse, generate_download_headers, XlsxResponse
+from superset.utils.profiler import span
+from superset.views.base import (
+    ArrowResponse,
+    CsvResponse,
+    generate_download_headers,
+    XlsxResponse,
+)
 from superset.views.base_api import statsd_metrics
 
 if TYPE_CHECKING:
@@ -166,7 +172,7 @@ class ChartDataRestApi(ChartRestApi):
             and query_context.result_format == ChartDataResultFormat.JSON
             and query_context.result_type == ChartDataResultType.FULL
         ):
-            return self._run_async(json_body, command)
+            return self._run_async(json_body, command, query_context)
 
         try:
             form_data = json.loads(chart.params)
@@ -254,7 +260,7 @@ class ChartDataRestApi(ChartRestApi):
             and query_context.result_format == ChartDataResultFormat.JSON
             and query_context.result_type == ChartDataResultType.FULL
         ):
-            return self._run_async(json_body, command)
+            return self._run_async(json_body, command, query_context)
 
         form_data = json_body.get("form_data")
         return self._get_data_response(
@@ -320,7 +326,10 @@ class ChartDataRestApi(ChartRestApi):
         return self._get_data_response(command, True)
 
     def _run_async(
-        self, form_data: dict[str, Any], command: ChartDataCommand
+        self,
+        form_data: dict[str, Any],
+        command: ChartDataCommand,
+        query_context: QueryContext,
     ) -> Response:
         """
         Execute command as an async query.
@@ -340,7 +349,7 @@ class ChartDataRestApi(ChartRestApi):
         except AsyncQueryTokenException:
             return self.response_401()
 
-        result = async_command.run(form_data, get_user_id())
+        result = async_command.run(form_data, get_user_id(), query_context)
         return self.response(202, **result)
 
     def _send_chart_response(
@@ -393,17 +402,36 @@ class ChartDataRestApi(ChartRestApi):
                 mimetype="application/zip",
             )
 
+        if result_format == ChartDataResultFormat.ARROW:
+            if not result["queries"]:
+                return self.response_400(_("Empty query result"))
+
+            if len(result["queries"]) == 1:
+                return ArrowResponse(result["queries"][0]["data"])
+
+            # return multi-query results bundled as a zip file
+            files = {
+                f"query_{idx + 1}.{result_format}": query["data"]
+                for idx, query in enumerate(result["queries"])
+            }
+            return Response(
+                create_zip(files),
+                headers=generate_download_headers("zip"),
+                mimetype="application/zip",
+            )
+
         if result_format == ChartDataResultFormat.JSON:
             queries = result["queries"]
             if security_manager.is_guest_user():
                 for query in queries:
                     with contextlib.suppress(KeyError):
                         del query["query"]
-            response_data = json.dumps(
-                {"result": queries},
-                default=json.json_int_dttm_ser,
-                ignore_nan=True,
-            )
+            with span("serialization"):
+                response_data = json.dumps(
+                    {"result": queries},
+                    default=json.json_int_dttm_ser,
+                    ignore_nan=True,
+                )
             resp = make_response(response_data, 200)
             resp.headers["Content-Type"] = "application/json; charset=utf-8"
             return resp
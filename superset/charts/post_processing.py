@@ -34,6 +34,7 @@ import pandas as pd
 from flask_babel import gettext as __
 
 from superset.common.chart_data import ChartDataResultFormat
+from superset.utils import arrow
 from superset.utils.core import (
     extract_dataframe_dtypes,
     get_column_names,
@@ -328,6 +329,8 @@ def apply_post_process(
             df = pd.DataFrame.from_dict(data)
         elif query["result_format"] == ChartDataResultFormat.CSV:
             df = pd.read_csv(StringIO(data))
+        elif query["result_format"] == ChartDataResultFormat.ARROW:
+            df = arrow.arrow_ipc_to_df(data)
 
         # convert all columns to verbose (label) name
         if datasource:
@@ -363,5 +366,8 @@ def apply_post_process(
             processed_df.to_csv(buf)
             buf.seek(0)
             query["data"] = buf.getvalue()
+        elif query["result_format"] == ChartDataResultFormat.ARROW:
+            # the index holds the row headers of pivoted data
+            query["data"] = arrow.df_to_arrow_ipc(processed_df.reset_index())
 
     return result
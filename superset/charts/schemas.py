@@ -98,6 +98,11 @@ cache_timeout_description = (
     "for this chart. Note this defaults to the datasource/table"
     " timeout if undefined."
 )
+stale_cache_timeout_description = (
+    "Duration (in seconds) during which the cached data of this chart is still "
+    "returned once expired, while it's refreshed in the background. Note this "
+    "defaults to the datasource/table stale timeout if undefined."
+)
 datasource_id_description = (
     "The id of the dataset/datasource this new chart will use. "
     "A complete datasource identification needs `datasource_id` "
@@ -201,6 +206,9 @@ class ChartPostSchema(Schema):
     cache_timeout = fields.Integer(
         metadata={"description": cache_timeout_description}, allow_none=True
     )
+    stale_cache_timeout = fields.Integer(
+        metadata={"description": stale_cache_timeout_description}, allow_none=True
+    )
     datasource_id = fields.Integer(
         metadata={"description": datasource_id_description}, required=True
     )
@@ -259,6 +267,9 @@ class ChartPutSchema(Schema):
     cache_timeout = fields.Integer(
         metadata={"description": cache_timeout_description}, allow_none=True
     )
+    stale_cache_timeout = fields.Integer(
+        metadata={"description": stale_cache_timeout_description}, allow_none=True
+    )
     datasource_id = fields.Integer(
         metadata={"description": datasource_id_description}, allow_none=True
     )
@@ -1435,6 +1446,13 @@ class ChartDataResponseResult(Schema):
         required=True,
         allow_none=None,
     )
+    is_stale = fields.Boolean(
+        metadata={
+            "description": "Is the result cached, expired, and being refreshed in "
+            "the background"
+        },
+        allow_none=True,
+    )
     query = fields.String(
         metadata={"description": "The executed query statement"},
         required=True,
@@ -1545,6 +1563,7 @@ class ImportV1ChartSchema(Schema):
     params = fields.Dict()
     query_context = fields.String(allow_none=True, validate=utils.validate_json)
     cache_timeout = fields.Integer(allow_none=True)
+    stale_cache_timeout = fields.Integer(allow_none=True)
     uuid = fields.UUID(required=True)
     version = fields.String(required=True)
     dataset_uuid = fields.UUID(required=True)
@@ -0,0 +1,67 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+from typing import Any, Optional
+
+import click
+from flask.cli import with_appcontext
+
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+@with_appcontext
+@click.option(
+    "--datasource_uid",
+    "-u",
+    multiple=True,
+    help="UID of a datasource to invalidate, e.g. 3__table",
+)
+@click.option(
+    "--database_name",
+    "-d",
+    help="Name of the database whose datasources are invalidated",
+)
+@click.option("--catalog", "-c", help="Only invalidate the datasources of a catalog")
+@click.option("--schema", "-s", help="Only invalidate the datasources of a schema")
+def invalidate_cache(
+    datasource_uid: tuple[str, ...],
+    database_name: Optional[str],
+    catalog: Optional[str],
+    schema: Optional[str],
+) -> None:
+    """Invalidates the cache of datasources, or of a database or schema"""
+    # pylint: disable=import-outside-toplevel
+    from superset.commands.cache.invalidate import CacheInvalidateCommand
+
+    if (catalog or schema) and not database_name:
+        raise click.UsageError("--catalog and --schema require --database_name")
+    if not datasource_uid and not database_name:
+        raise click.UsageError("Provide --datasource_uid or --database_name")
+
+    databases: list[dict[str, Any]] = []
+    if database_name:
+        database: dict[str, Any] = {"database_name": database_name, "schema": schema}
+        if catalog:
+            database["catalog"] = catalog
+        databases.append(database)
+
+    count = CacheInvalidateCommand(
+        datasource_uids=list(datasource_uid),
+        databases=databases,
+    ).run()
+    click.secho(f"Invalidated {count} cache keys", fg="green")
@@ -0,0 +1,122 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+from functools import partial
+from typing import Any
+
+from superset import db
+from superset.commands.base import BaseCommand
+from superset.commands.cache.exceptions import CacheInvalidateFailedError
+from superset.connectors.sqla.models import SqlaTable
+from superset.extensions import cache_manager, stats_logger_manager
+from superset.models.cache import CacheKey
+from superset.models.core import Database
+from superset.utils.cache import invalidate_cache_index
+from superset.utils.decorators import on_error, transaction
+
+logger = logging.getLogger(__name__)
+
+
+class CacheInvalidateCommand(BaseCommand):
+    """
+    Invalidate the cache of datasources, given by their UIDs, their names, or the
+    database, and optionally the catalog and schema, they belong to.
+
+    The keys indexed in Redis are deleted, as well as the keys recorded in the
+    metadata database, with their records.
+    """
+
+    def __init__(
+        self,
+        datasource_uids: list[str] | None = None,
+        datasources: list[dict[str, Any]] | None = None,
+        databases: list[dict[str, Any]] | None = None,
+    ):
+        self._datasource_uids = set(datasource_uids or [])
+        self._datasources = datasources or []
+        self._databases = databases or []
+
+    @transaction(on_error=partial(on_error, reraise=CacheInvalidateFailedError))
+    def run(self) -> int:
+        """
+        Return the number of invalidated cache keys.
+        """
+        self.validate()
+        caches = [cache_manager.cache, cache_manager.data_cache]
+
+        count = sum(
+            invalidate_cache_index(cache, datasource_uid)
+            for datasource_uid in self._datasource_uids
+            for cache in caches
+        )
+
+        cache_keys = [
+            cache_key
+            for (cache_key,) in db.session.query(CacheKey.cache_key).filter(
+                CacheKey.datasource_uid.in_(self._datasource_uids)
+            )
+        ]
+        if cache_keys:
+            # the versions of the values of the worker-local caches go with them
+            versions = [f"{cache_key}-version" for cache_key in cache_keys]
+            cache_manager.data_cache.delete_many(*versions)
+            for cache in caches:
+                if not cache.delete_many(*cache_keys):
+                    # expected behavior as keys may expire and cache is not a
+                    # persistent storage
+                    logger.info(
+                        "Some of the cache keys were not deleted in the list %s",
+                        cache_keys,
+                    )
+            db.session.execute(
+                CacheKey.__table__.delete().where(  # pylint: disable=no-member
+                    CacheKey.cache_key.in_(cache_keys)
+                )
+            )
+            count += len(cache_keys)
+
+        stats_logger_manager.instance.gauge("invalidated_cache", count)
+        logger.info(
+            "Invalidated %s cache records for %s datasources",
+            count,
+            len(self._datasource_uids),
+        )
+        return count
+
+    def validate(self) -> None:
+        for datasource in self._datasources:
+            if table := SqlaTable.get_datasource_by_name(
+                datasource_name=datasource.get("datasource_name"),
+                catalog=datasource.get("catalog"),
+                schema=datasource.get("schema"),
+                database_name=datasource.get("database_name"),
+            ):
+                self._datasource_uids.add(table.uid)
+
+        for database in self._databases:
+            query = (
+                db.session.query(SqlaTable)
+                .join(Database)
+                .filter(Database.database_name == database["database_name"])
+            )
+            if "catalog" in database:
+                query = query.filter(SqlaTable.catalog == database["catalog"])
+            if schema := database.get("schema"):
+                query = query.filter(SqlaTable.schema == schema)
+            self._datasource_uids.update(table.uid for table in query)
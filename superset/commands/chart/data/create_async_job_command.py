@@ -15,11 +15,15 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
-from typing import Any, Optional
+from typing import Any, Optional, TYPE_CHECKING
 
 from flask import Request
 
 from superset.extensions import async_query_manager
+from superset.utils.cache import generate_cache_key
+
+if TYPE_CHECKING:
+    from superset.common.query_context import QueryContext
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +36,38 @@ class CreateAsyncChartDataJobCommand:
             request
         )
 
-    def run(self, form_data: dict[str, Any], user_id: Optional[int]) -> dict[str, Any]:
+    def run(
+        self,
+        form_data: dict[str, Any],
+        user_id: Optional[int],
+        query_context: Optional["QueryContext"] = None,
+    ) -> dict[str, Any]:
+        job_key = (
+            get_job_key(query_context)
+            if query_context and async_query_manager.job_deduplication_enabled
+            else None
+        )
         return async_query_manager.submit_chart_data_job(
-            self._async_channel_id, form_data, user_id
+            self._async_channel_id,
+            form_data,
+            user_id,
+            job_key=job_key,
         )
+
+
+def get_job_key(query_context: "QueryContext") -> str:
+    """
+    Return the key identifying the jobs loading the same data as the query context:
+    the key of the query context, and the cache keys of its queries, which depend on
+    the user through the row level security filters.
+    """
+    return generate_cache_key(
+        {
+            "query_context": query_context.cache_values,
+            "queries": [
+                query_context.query_cache_key(query_obj)
+                for query_obj in query_context.queries
+            ],
+        },
+        "job-",
+    )
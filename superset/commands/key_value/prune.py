@@ -0,0 +1,66 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+
+from superset import db
+from superset.commands.base import BaseCommand
+from superset.daos.key_value import KeyValueDAO
+from superset.key_value.types import KeyValueResource
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=consider-using-transaction
+class KeyValuePruneCommand(BaseCommand):
+    """
+    Command to delete the expired entries of a resource of the key-value table.
+
+    The entries are deleted in batches, each committed on its own, so that the table
+    isn't locked for the whole sweep.
+    """
+
+    def __init__(self, resource: KeyValueResource, batch_size: int = 999):
+        """
+        :param resource: The resource whose expired entries are deleted
+        :param batch_size: The number of entries deleted per transaction
+        """
+        self.resource = resource
+        self.batch_size = batch_size
+
+    def run(self) -> int:
+        """
+        Executes the prune command, returning the number of deleted entries
+        """
+        total_deleted = 0
+        while True:
+            deleted = KeyValueDAO.delete_expired_entries(
+                self.resource, limit=self.batch_size
+            )
+            db.session.commit()
+            total_deleted += deleted
+            if deleted < self.batch_size:
+                break
+
+        logger.info(
+            "Pruned %s expired entries of the %s resource",
+            total_deleted,
+            self.resource.value,
+        )
+        return total_deleted
+
+    def validate(self) -> None:
+        pass
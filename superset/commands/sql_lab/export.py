@@ -17,7 +17,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, cast, TypedDict
+import pickle
+import tempfile
+from collections.abc import Iterator
+from contextlib import closing
+from itertools import chain
+from typing import cast, IO, TypedDict
 
 import pandas as pd
 from flask_babel import gettext as __
@@ -28,9 +33,13 @@ from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetErrorException, SupersetSecurityException
 from superset.models.sql_lab import Query
 from superset.sql_parse import ParsedQuery
+from superset.sqllab.arrow_payload import is_arrow_payload, load_arrow_payload
 from superset.sqllab.limiting_factor import LimitingFactor
 from superset.utils import core as utils, csv
-from superset.views.utils import _deserialize_results_payload
+from superset.views.utils import (
+    _deserialize_results_payload,
+    _expand_results_payload,
+)
 
 config = app.config
 
@@ -39,19 +48,20 @@ logger = logging.getLogger(__name__)
 
 class SqlExportResult(TypedDict):
     query: Query
-    count: int
-    data: list[Any]
+    data: Iterator[str]
 
 
 class SqlResultExportCommand(BaseCommand):
     _client_id: str
     _query: Query
+    row_count: int
 
     def __init__(
         self,
         client_id: str,
     ) -> None:
         self._client_id = client_id
+        self.row_count = 0
 
     def validate(self) -> None:
         self._query = (
@@ -85,6 +95,16 @@ class SqlResultExportCommand(BaseCommand):
     def run(
         self,
     ) -> SqlExportResult:
+        """
+        Export the results of the query as CSV.
+
+        The CSV is generated lazily, one chunk of `SQLLAB_CSV_EXPORT_CHUNK_SIZE` rows
+        at a time, so neither the whole CSV nor all the rows are held in memory. When
+        the query is re-run, its rows are fetched and spooled to a temporary file
+        before streaming starts, so the database connection isn't held while the
+        client downloads the file. `row_count` holds the number of rows exported once
+        the data is consumed.
+        """
         self.validate()
         blob = None
         if results_backend and self._query.results_key:
@@ -92,50 +112,110 @@ class SqlResultExportCommand(BaseCommand):
                 "Fetching CSV from results backend [%s]", self._query.results_key
             )
             blob = results_backend.get(self._query.results_key)
-        if blob:
-            logger.info("Decompressing")
-            payload = utils.zlib_decompress(
-                blob, decode=not results_backend_use_msgpack
-            )
-            obj = _deserialize_results_payload(
-                payload, self._query, cast(bool, results_backend_use_msgpack)
-            )
 
-            df = pd.DataFrame(
-                data=obj["data"],
+        chunks = self._get_stored_chunks(blob) if blob else self._get_query_chunks()
+        # fetch the first chunk eagerly, so errors are raised before streaming starts
+        first_chunk = next(chunks)
+
+        return {
+            "query": self._query,
+            "data": csv.df_chunks_to_escaped_csv(
+                self._count_rows(chain([first_chunk], chunks)),
+                index=False,
+                **config["CSV_EXPORT"],
+            ),
+        }
+
+    def _count_rows(self, chunks: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        for chunk in chunks:
+            self.row_count += len(chunk.index)
+            yield chunk
+
+    def _get_stored_chunks(self, blob: bytes) -> Iterator[pd.DataFrame]:
+        chunk_size = config["SQLLAB_CSV_EXPORT_CHUNK_SIZE"]
+        if is_arrow_payload(blob):
+            # only the stored chunks and record batches of the current chunk are
+            # fetched and decompressed
+            arrow_payload = load_arrow_payload(blob, results_backend.get)
+            columns: list[str] | None = None
+            for start in range(0, max(arrow_payload.num_rows, 1), chunk_size):
+                obj = _expand_results_payload(
+                    dict(arrow_payload.metadata),
+                    arrow_payload.read(start, chunk_size),
+                    self._query,
+                )
+                columns = columns or [c["name"] for c in obj["columns"]]
+                yield pd.DataFrame(data=obj["data"], dtype=object, columns=columns)
+            return
+
+        logger.info("Decompressing")
+        payload = utils.zlib_decompress(blob, decode=not results_backend_use_msgpack)
+        obj = _deserialize_results_payload(
+            payload, self._query, cast(bool, results_backend_use_msgpack)
+        )
+        columns = [c["name"] for c in obj["columns"]]
+        data = obj["data"]
+
+        logger.info("Using pandas to convert to CSV")
+        # yield at least one chunk, so the header is always written
+        for start in range(0, max(len(data), 1), chunk_size):
+            yield pd.DataFrame(
+                data=data[start : start + chunk_size],
                 dtype=object,
-                columns=[c["name"] for c in obj["columns"]],
+                columns=columns,
             )
 
-            logger.info("Using pandas to convert to CSV")
+    def _get_query_chunks(self) -> Iterator[pd.DataFrame]:
+        logger.info("Running a query to turn into CSV")
+        if self._query.select_sql:
+            sql = self._query.select_sql
+            limit = None
         else:
-            logger.info("Running a query to turn into CSV")
-            if self._query.select_sql:
-                sql = self._query.select_sql
-                limit = None
-            else:
-                sql = self._query.executed_sql
-                limit = ParsedQuery(
-                    sql,
-                    engine=self._query.database.db_engine_spec.engine,
-                ).limit
-            if limit is not None and self._query.limiting_factor in {
-                LimitingFactor.QUERY,
-                LimitingFactor.DROPDOWN,
-                LimitingFactor.QUERY_AND_DROPDOWN,
-            }:
-                # remove extra row from `increased_limit`
-                limit -= 1
-            df = self._query.database.get_df(
+            sql = self._query.executed_sql
+            limit = ParsedQuery(
                 sql,
-                self._query.catalog,
-                self._query.schema,
-            )[:limit]
-
-        csv_data = csv.df_to_escaped_csv(df, index=False, **config["CSV_EXPORT"])
-
-        return {
-            "query": self._query,
-            "count": len(df.index),
-            "data": csv_data,
-        }
+                engine=self._query.database.db_engine_spec.engine,
+            ).limit
+        if limit is not None and self._query.limiting_factor in {
+            LimitingFactor.QUERY,
+            LimitingFactor.DROPDOWN,
+            LimitingFactor.QUERY_AND_DROPDOWN,
+        }:
+            # remove extra row from `increased_limit`
+            limit -= 1
+
+        remaining = limit
+        # the chunks are spooled to a temporary file as they're fetched, so the
+        # connection is released before streaming without holding all the rows
+        spool = tempfile.TemporaryFile()
+        try:
+            with closing(
+                self._query.database.iter_df(
+                    sql,
+                    self._query.catalog,
+                    self._query.schema,
+                    chunk_size=config["SQLLAB_CSV_EXPORT_CHUNK_SIZE"],
+                )
+            ) as chunks:
+                for chunk in chunks:
+                    if remaining is not None:
+                        chunk = chunk[:remaining]
+                        remaining -= len(chunk.index)
+                    pickle.dump(chunk, spool, protocol=pickle.HIGHEST_PROTOCOL)
+                    if remaining is not None and remaining <= 0:
+                        break
+        except BaseException:
+            spool.close()
+            raise
+
+        return self._read_spooled_chunks(spool)
+
+    @staticmethod
+    def _read_spooled_chunks(spool: IO[bytes]) -> Iterator[pd.DataFrame]:
+        with spool:
+            spool.seek(0)
+            while True:
+                try:
+                    yield pickle.load(spool)
+                except EOFError:
+                    return
@@ -27,9 +27,8 @@ from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SerializationError, SupersetErrorException
 from superset.models.sql_lab import Query
 from superset.sqllab.utils import apply_display_max_row_configuration_if_require
-from superset.utils import core as utils
 from superset.utils.dates import now_as_float
-from superset.views.utils import _deserialize_results_payload
+from superset.views.utils import _load_results_payload
 
 config = app.config
 SQLLAB_QUERY_COST_ESTIMATE_TIMEOUT = config["SQLLAB_QUERY_COST_ESTIMATE_TIMEOUT"]
@@ -41,6 +40,7 @@ logger = logging.getLogger(__name__)
 class SqlExecutionResultsCommand(BaseCommand):
     _key: str
     _rows: int | None
+    _offset: int
     _blob: Any
     _query: Query
 
@@ -48,9 +48,11 @@ class SqlExecutionResultsCommand(BaseCommand):
         self,
         key: str,
         rows: int | None = None,
+        offset: int = 0,
     ) -> None:
         self._key = key
         self._rows = rows
+        self._offset = offset
 
     def validate(self) -> None:
         if not results_backend:
@@ -103,12 +105,13 @@ class SqlExecutionResultsCommand(BaseCommand):
     ) -> dict[str, Any]:
         """Runs arbitrary sql and returns data as json"""
         self.validate()
-        payload = utils.zlib_decompress(
-            self._blob, decode=not results_backend_use_msgpack
-        )
         try:
-            obj = _deserialize_results_payload(
-                payload, self._query, cast(bool, results_backend_use_msgpack)
+            obj = _load_results_payload(
+                self._blob,
+                self._query,
+                cast(bool, results_backend_use_msgpack),
+                offset=self._offset,
+                limit=self._rows or None,
             )
         except SerializationError as ex:
             raise SupersetErrorException(
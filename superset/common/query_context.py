@@ -90,7 +90,7 @@ class QueryContext:
         self,
         df: pd.DataFrame,
         coltypes: list[GenericDataType],
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | bytes | list[dict[str, Any]]:
         return self._processor.get_data(df, coltypes)
 
     def get_payload(
@@ -112,6 +112,11 @@ class QueryContext:
             return self.datasource.database.cache_timeout
         return None
 
+    def get_stale_cache_timeout(self) -> int | None:
+        if self.slice_ and self.slice_.stale_cache_timeout is not None:
+            return self.slice_.stale_cache_timeout
+        return getattr(self.datasource, "stale_cache_timeout", None)
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         return self._processor.query_cache_key(query_obj, **kwargs)
 
@@ -14,16 +14,20 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+# pylint: disable=too-many-lines
 from __future__ import annotations
 
 import copy
 import logging
 import re
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Any, cast, ClassVar, TYPE_CHECKING, TypedDict
+from functools import partial
+from typing import Any, cast, ClassVar, ContextManager, TYPE_CHECKING, TypedDict
 
 import numpy as np
 import pandas as pd
+from flask import g, has_app_context
 from flask_babel import gettext as _
 from pandas import DateOffset
 
@@ -32,6 +36,7 @@ from superset.common.chart_data import ChartDataResultFormat
 from superset.common.db_query_status import QueryStatus
 from superset.common.query_actions import get_query_results
 from superset.common.utils import dataframe_utils
+from superset.common.utils.incremental_refresh import IncrementalRefreshManager
 from superset.common.utils.query_cache_manager import QueryCacheManager
 from superset.common.utils.time_range_utils import (
     get_since_until_from_query_object,
@@ -41,6 +46,7 @@ from superset.connectors.sqla.models import BaseDatasource
 from superset.constants import CacheRegion, TimeGrain
 from superset.daos.annotation_layer import AnnotationLayerDAO
 from superset.daos.chart import ChartDAO
+from superset.distributed_lock import SingleFlight
 from superset.exceptions import (
     InvalidPostProcessingError,
     QueryObjectValidationError,
@@ -49,8 +55,13 @@ from superset.exceptions import (
 from superset.extensions import cache_manager, security_manager
 from superset.models.helpers import QueryResult
 from superset.models.sql_lab import Query
-from superset.utils import csv, excel
+from superset.utils import arrow, csv, excel
 from superset.utils.cache import generate_cache_key, set_and_log_cache
+from superset.utils.concurrency import (
+    database_concurrency_guard,
+    preload,
+    run_concurrently,
+)
 from superset.utils.core import (
     DatasourceType,
     DateColumn,
@@ -62,12 +73,15 @@ from superset.utils.core import (
     get_column_names_from_columns,
     get_column_names_from_metrics,
     get_metric_names,
+    get_user_id,
     get_x_axis_label,
     normalize_dttm_col,
     TIME_COMPARISON,
 )
 from superset.utils.date_parser import get_past_or_future, normalize_time_delta
+from superset.utils.decorators import stats_timing
 from superset.utils.pandas_postprocessing.utils import unescape_separator
+from superset.utils.profiler import span
 from superset.views.utils import get_viz
 from superset.viz import viz_types
 
@@ -108,6 +122,16 @@ class CachedTimeOffset(TypedDict):
     cache_keys: list[str | None]
 
 
+class PendingTimeOffset(TypedDict):
+    position: int
+    offset: str
+    query_object: QueryObject
+    query_object_dict: dict[str, Any]
+    metrics_mapping: dict[str, str]
+    cache_key: str | None
+    cache: QueryCacheManager
+
+
 class QueryContextProcessor:
     """
     The query context contains the query object and additional fields necessary
@@ -138,38 +162,20 @@ class QueryContextProcessor:
             force_cached=force_cached,
         )
 
+        if query_obj and cache_key and cache.is_stale:
+            self._refresh_stale_cache(query_obj, cache_key)
+
         if query_obj and cache_key and not cache.is_loaded:
-            try:
-                if invalid_columns := [
-                    col
-                    for col in get_column_names_from_columns(query_obj.columns)
-                    + get_column_names_from_metrics(query_obj.metrics or [])
-                    if (
-                        col not in self._qc_datasource.column_names
-                        and col != DTTM_ALIAS
+            with self._single_flight(cache_key) as waited:
+                if waited:
+                    # another request may have loaded the cache meanwhile
+                    cache = QueryCacheManager.get(
+                        key=cache_key,
+                        region=CacheRegion.DATA,
+                        force_cached=force_cached,
                     )
-                ]:
-                    raise QueryObjectValidationError(
-                        _(
-                            "Columns missing in dataset: %(invalid_columns)s",
-                            invalid_columns=invalid_columns,
-                        )
-                    )
-
-                query_result = self.get_query_result(query_obj)
-                annotation_data = self.get_annotation_data(query_obj)
-                cache.set_query_result(
-                    key=cache_key,
-                    query_result=query_result,
-                    annotation_data=annotation_data,
-                    force_query=force_query,
-                    timeout=self.get_cache_timeout(),
-                    datasource_uid=self._qc_datasource.uid,
-                    region=CacheRegion.DATA,
-                )
-            except QueryObjectValidationError as ex:
-                cache.error_message = str(ex)
-                cache.status = QueryStatus.FAILED
+                if not cache.is_loaded:
+                    self._load_query_result(query_obj, cache, cache_key, force_query)
 
         # the N-dimensional DataFrame has converted into flat DataFrame
         # by `flatten operator`, "comma" in the column is escaped by `escape_separator`
@@ -193,6 +199,7 @@ class QueryContextProcessor:
             "annotation_data": cache.annotation_data,
             "error": cache.error_message,
             "is_cached": cache.is_cached,
+            "is_stale": cache.is_stale,
             "query": cache.query,
             "status": cache.status,
             "stacktrace": cache.stacktrace,
@@ -203,6 +210,95 @@ class QueryContextProcessor:
             "label_map": label_map,
         }
 
+    def _load_query_result(
+        self,
+        query_obj: QueryObject,
+        cache: QueryCacheManager,
+        cache_key: str,
+        force_query: bool,
+    ) -> None:
+        """
+        Run the query and store its result in the cache.
+        """
+        try:
+            if invalid_columns := [
+                col
+                for col in get_column_names_from_columns(query_obj.columns)
+                + get_column_names_from_metrics(query_obj.metrics or [])
+                if col not in self._qc_datasource.column_names and col != DTTM_ALIAS
+            ]:
+                raise QueryObjectValidationError(
+                    _(
+                        "Columns missing in dataset: %(invalid_columns)s",
+                        invalid_columns=invalid_columns,
+                    )
+                )
+
+            query_result = self.get_query_result(query_obj)
+            annotation_data = self.get_annotation_data(query_obj)
+            cache.set_query_result(
+                key=cache_key,
+                query_result=query_result,
+                annotation_data=annotation_data,
+                force_query=force_query,
+                timeout=self.get_cache_timeout(),
+                datasource_uid=self._qc_datasource.uid,
+                region=CacheRegion.DATA,
+                stale_timeout=self._get_stale_cache_timeout(),
+            )
+        except QueryObjectValidationError as ex:
+            cache.error_message = str(ex)
+            cache.status = QueryStatus.FAILED
+
+    def _refresh_stale_cache(self, query_obj: QueryObject, cache_key: str) -> None:
+        """
+        Refresh the stale cached result of a query in the background, unless it's
+        already being refreshed.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.tasks.async_queries import refresh_chart_data_cache
+
+        query_context = self._query_context
+        # query objects derived from the request's ones, as for samples, can't be
+        # rebuilt by the task, they're refreshed once expired
+        if query_obj not in query_context.queries:
+            return
+
+        timeout = self._get_stale_cache_timeout()
+        if timeout <= 0 or not QueryCacheManager.claim_refresh(
+            cache_key, timeout, region=CacheRegion.DATA
+        ):
+            return
+
+        user_metadata: dict[str, Any] = {"user_id": get_user_id()}
+        if guest_user := security_manager.get_current_guest_user_if_guest():
+            user_metadata["guest_token"] = guest_user.guest_token
+        form_data = {
+            **query_context.cache_values,
+            "form_data": query_context.form_data,
+            "custom_cache_timeout": query_context.custom_cache_timeout,
+        }
+        try:
+            refresh_chart_data_cache.delay(
+                user_metadata,
+                form_data,
+                query_context.queries.index(query_obj),
+                cache_key,
+            )
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Failed to schedule the refresh of %s", cache_key)
+            QueryCacheManager.release_refresh(cache_key, region=CacheRegion.DATA)
+
+    @staticmethod
+    def _single_flight(cache_key: str) -> ContextManager[bool]:
+        """
+        Return a guard ensuring that concurrent requests loading the same query into
+        the cache run it once, when `DATA_CACHE_SINGLE_FLIGHT_TIMEOUT` is set.
+        """
+        if not (timeout := config["DATA_CACHE_SINGLE_FLIGHT_TIMEOUT"]):
+            return nullcontext(False)
+        return SingleFlight("query_cache", timeout, key=cache_key)
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         """
         Returns a QueryObject cache key for objects in self.queries
@@ -231,22 +327,37 @@ class QueryContextProcessor:
         # support multiple queries from different data sources.
 
         query = ""
-        if isinstance(query_context.datasource, Query):
-            # todo(hugh): add logic to manage all sip68 models here
-            result = query_context.datasource.exc_query(query_object.to_dict())
-        else:
-            result = query_context.datasource.query(query_object.to_dict())
+        incremental_refresh_manager = IncrementalRefreshManager(
+            self, self._qc_datasource, self._query_context.force
+        )
+        incremental_refresh = incremental_refresh_manager.get_incremental_refresh(
+            query_object
+        )
+        result = (
+            incremental_refresh_manager.query_incrementally(
+                query_object, incremental_refresh
+            )
+            if incremental_refresh
+            else None
+        )
+        if result is None:
+            result = self.query_datasource(query_object.to_dict())
+            # Transform the timestamp we received from database to pandas supported
+            # datetime format. If no python_date_format is specified, the pattern
+            # will be considered as the default ISO date format
+            # If the datetime format is unix, the parse will use the corresponding
+            # parsing logic
+            if not result.df.empty:
+                result.df = self.normalize_df(result.df, query_object)
+                if incremental_refresh:
+                    incremental_refresh_manager.set_incremental_result(
+                        query_object, incremental_refresh, result
+                    )
+        if not isinstance(query_context.datasource, Query):
             query = result.query + ";\n\n"
 
         df = result.df
-        # Transform the timestamp we received from database to pandas supported
-        # datetime format. If no python_date_format is specified, the pattern will
-        # be considered as the default ISO date format
-        # If the datetime format is unix, the parse will use the corresponding
-        # parsing logic
         if not df.empty:
-            df = self.normalize_df(df, query_object)
-
             if query_object.time_offsets:
                 time_offsets = self.processing_time_offsets(df, query_object)
                 df = time_offsets["df"]
@@ -257,7 +368,8 @@ class QueryContextProcessor:
 
             # Re-raising QueryObjectValidationError
             try:
-                df = query_object.exec_post_processing(df)
+                with span("post_processing"):
+                    df = query_object.exec_post_processing(df)
             except InvalidPostProcessingError as ex:
                 raise QueryObjectValidationError(ex.message) from ex
 
@@ -267,6 +379,7 @@ class QueryContextProcessor:
         result.to_dttm = query_object.to_dttm
         return result
 
+    @span("normalize_df")
     def normalize_df(self, df: pd.DataFrame, query_object: QueryObject) -> pd.DataFrame:
         # todo: should support "python_date_format" and "get_column" in each datasource
         def _get_timestamp_format(
@@ -410,9 +523,11 @@ class QueryContextProcessor:
         query_context = self._query_context
         # ensure query_object is immutable
         query_object_clone = copy.copy(query_object)
-        queries: list[str] = []
-        cache_keys: list[str | None] = []
+        queries: list[str] = [""] * len(query_object.time_offsets)
+        cache_keys: list[str | None] = [None] * len(query_object.time_offsets)
         offset_dfs: dict[str, pd.DataFrame] = {}
+        computed_offsets: list[str] = []
+        pending_offsets: list[PendingTimeOffset] = []
 
         outer_from_dttm, outer_to_dttm = get_since_until_from_query_object(query_object)
         if not outer_from_dttm or not outer_to_dttm:
@@ -430,7 +545,7 @@ class QueryContextProcessor:
         # use columns that are not metrics as join keys
         join_keys = [col for col in df.columns if col not in metric_names]
 
-        for offset in query_object.time_offsets:
+        for position, offset in enumerate(query_object.time_offsets):
             try:
                 # pylint: disable=line-too-long
                 # Since the x-axis is also a column name for the time filter, x_axis_label will be set as granularity
@@ -501,6 +616,7 @@ class QueryContextProcessor:
             cached_time_offset_key = (
                 offset if offset == original_offset else f"{offset}_{original_offset}"
             )
+            computed_offsets.append(offset)
 
             # `offset` is added to the hash function
             cache_key = self.query_cache_key(
@@ -514,11 +630,12 @@ class QueryContextProcessor:
             # whether hit on the cache
             if cache.is_loaded:
                 offset_dfs[offset] = cache.df
-                queries.append(cache.query)
-                cache_keys.append(cache_key)
+                queries[position] = cache.query
+                cache_keys[position] = cache_key
                 continue
 
-            query_object_clone_dct = query_object_clone.to_dict()
+            # snapshot the query object, as the clone is mutated on each iteration
+            query_object_clone_dct = copy.deepcopy(query_object_clone.to_dict())
             # rename metrics: SUM(value) => SUM(value) 1 year ago
             metrics_mapping = {
                 metric: TIME_COMPARISON.join([metric, original_offset])
@@ -532,44 +649,65 @@ class QueryContextProcessor:
                 query_object_clone_dct["row_limit"] = config["ROW_LIMIT"]
                 query_object_clone_dct["row_offset"] = 0
 
-            if isinstance(self._qc_datasource, Query):
-                result = self._qc_datasource.exc_query(query_object_clone_dct)
-            else:
-                result = self._qc_datasource.query(query_object_clone_dct)
+            pending_offsets.append(
+                PendingTimeOffset(
+                    position=position,
+                    offset=offset,
+                    query_object=copy.copy(query_object_clone),
+                    query_object_dict=query_object_clone_dct,
+                    metrics_mapping=metrics_mapping,
+                    cache_key=cache_key,
+                    cache=cache,
+                )
+            )
 
-            queries.append(result.query)
-            cache_keys.append(None)
+        # the offset queries missing from the cache are independent of each other,
+        # so they are run concurrently and joined once they have all completed
+        results = self._run_time_offset_queries(
+            [pending["query_object_dict"] for pending in pending_offsets]
+        )
 
+        for pending, result in zip(pending_offsets, results):
+            queries[pending["position"]] = result.query
             offset_metrics_df = result.df
             if offset_metrics_df.empty:
                 offset_metrics_df = pd.DataFrame(
                     {
                         col: [np.NaN]
-                        for col in join_keys + list(metrics_mapping.values())
+                        for col in join_keys + list(pending["metrics_mapping"].values())
                     }
                 )
             else:
                 # 1. normalize df, set dttm column
                 offset_metrics_df = self.normalize_df(
-                    offset_metrics_df, query_object_clone
+                    offset_metrics_df, pending["query_object"]
                 )
 
                 # 2. rename extra query columns
-                offset_metrics_df = offset_metrics_df.rename(columns=metrics_mapping)
+                offset_metrics_df = offset_metrics_df.rename(
+                    columns=pending["metrics_mapping"]
+                )
 
             # cache df and query
             value = {
                 "df": offset_metrics_df,
                 "query": result.query,
             }
-            cache.set(
-                key=cache_key,
+            pending["cache"].set(
+                key=pending["cache_key"],
                 value=value,
                 timeout=self.get_cache_timeout(),
                 datasource_uid=query_context.datasource.uid,
                 region=CacheRegion.DATA,
             )
-            offset_dfs[offset] = offset_metrics_df
+            offset_dfs[pending["offset"]] = offset_metrics_df
+
+        # keep the original order of the offsets when joining the results
+        offset_dfs = {
+            offset: offset_dfs[offset]
+            for offset in computed_offsets
+            if offset in offset_dfs
+        }
 
         if offset_dfs:
             df = self.join_offset_dfs(
@@ -581,6 +719,63 @@ class QueryContextProcessor:
 
         return CachedTimeOffset(df=df, queries=queries, cache_keys=cache_keys)
 
+    def _run_time_offset_queries(
+        self, query_object_dicts: list[dict[str, Any]]
+    ) -> list[QueryResult]:
+        """
+        Run the time offset queries, concurrently if enabled.
+
+        Up to `TIME_OFFSET_QUERIES_MAX_WORKERS` queries are run at the same time.
+
+        :param query_object_dicts: The offset query objects to run
+        :returns: The query results, in the same order as the query objects
+        """
+        if not query_object_dicts:
+            return []
+
+        max_workers = config["TIME_OFFSET_QUERIES_MAX_WORKERS"]
+        if max_workers > 1 and len(query_object_dicts) > 1:
+            self._preload_query_context()
+
+        with stats_timing("time_offsets.query", stats_logger):
+            return run_concurrently(
+                [
+                    partial(self.query_datasource, query_object_dict)
+                    for query_object_dict in query_object_dicts
+                ],
+                max_workers=max_workers,
+            )
+
+    def _preload_query_context(self) -> None:
+        """
+        Load the datasource and the chart of the query context, and the roles of
+        the user, before running queries concurrently, so that the threads running
+        them don't query through the session of the request.
+        """
+        preload(self._qc_datasource, "database", "columns", "metrics", "owners")
+        preload(self._query_context.slice_)
+        if has_app_context() and (user := getattr(g, "user", None)):
+            preload(user, "roles")
+
+    def query_datasource(self, query_obj: dict[str, Any]) -> QueryResult:
+        """
+        Run a query against the datasource.
+
+        When called from a concurrent task, the number of queries in flight against
+        the database is bounded by `DATABASE_MAX_CONCURRENT_QUERIES` across the
+        whole worker process.
+
+        :param query_obj: The query object, as a dictionary
+        :returns: The query result
+        """
+        datasource = self._qc_datasource
+        database = getattr(datasource, "database", None)
+        with database_concurrency_guard(database.id if database else None):
+            if isinstance(datasource, Query):
+                # todo(hugh): add logic to manage all sip68 models here
+                return datasource.exc_query(query_obj)
+            return datasource.query(query_obj)
+
     def join_offset_dfs(
         self,
         df: pd.DataFrame,
@@ -692,9 +887,10 @@ class QueryContextProcessor:
 
         return str(value)
 
+    @span("serialization")
     def get_data(
         self, df: pd.DataFrame, coltypes: list[GenericDataType]
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | bytes | list[dict[str, Any]]:
         if self._query_context.result_format in ChartDataResultFormat.table_like():
             include_index = not isinstance(df.index, pd.RangeIndex)
             columns = list(df.columns)
@@ -712,6 +908,9 @@ class QueryContextProcessor:
                 result = excel.df_to_excel(df, **config["EXCEL_EXPORT"])
             return result or ""
 
+        if self._query_context.result_format == ChartDataResultFormat.ARROW:
+            return arrow.df_to_arrow_ipc(df, **config["ARROW_EXPORT"])
+
         return df.to_dict(orient="records")
 
     def get_payload(
@@ -721,16 +920,27 @@ class QueryContextProcessor:
     ) -> dict[str, Any]:
         """Returns the query results with both metadata and data"""
 
-        # Get all the payloads from the QueryObjects
-        query_results = [
-            get_query_results(
-                query_obj.result_type or self._query_context.result_type,
-                self._query_context,
-                query_obj,
-                force_cached,
+        # Get all the payloads from the QueryObjects; the queries are independent
+        # of each other, so they can be fanned out and gathered back in order
+        max_workers = config["CHART_DATA_QUERIES_MAX_WORKERS"]
+        queries = self._query_context.queries
+        mode = "concurrent" if max_workers > 1 and len(queries) > 1 else "sequential"
+        if mode == "concurrent":
+            self._preload_query_context()
+        with stats_timing(f"chart_data.get_payload.{mode}", stats_logger):
+            query_results = run_concurrently(
+                [
+                    partial(
+                        get_query_results,
+                        query_obj.result_type or self._query_context.result_type,
+                        self._query_context,
+                        query_obj,
+                        force_cached,
+                    )
+                    for query_obj in queries
+                ],
+                max_workers=max_workers,
             )
-            for query_obj in self._query_context.queries
-        ]
         return_value = {"queries": query_results}
 
         if cache_query_context:
@@ -764,6 +974,11 @@ class QueryContextProcessor:
             return data_cache_timeout
         return config["CACHE_DEFAULT_TIMEOUT"]
 
+    def _get_stale_cache_timeout(self) -> int:
+        if (timeout := self._query_context.get_stale_cache_timeout()) is not None:
+            return timeout
+        return config["DATA_CACHE_STALE_TIMEOUT"]
+
     def cache_key(self, **extra: Any) -> str:
         """
         The QueryContext cache key is made out of the key/values from
@@ -0,0 +1,284 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import copy
+from datetime import datetime
+from typing import Any, TYPE_CHECKING, TypedDict
+
+import pandas as pd
+from pandas import DateOffset
+
+from superset import app
+from superset.common.db_query_status import QueryStatus
+from superset.common.utils import dataframe_utils
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion, TimeGrain
+from superset.utils.core import (
+    DTTM_ALIAS,
+    FilterOperator,
+    get_base_axis_labels,
+    QueryObjectFilterClause,
+)
+
+if TYPE_CHECKING:
+    from superset.common.query_context_processor import QueryContextProcessor
+    from superset.common.query_object import QueryObject
+    from superset.connectors.sqla.models import BaseDatasource
+    from superset.models.helpers import QueryResult
+    from superset.stats_logger import BaseStatsLogger
+
+config = app.config
+stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
+
+# Length of the time grains of the queries which can be refreshed incrementally
+INCREMENTAL_REFRESH_GRAINS: dict[str, DateOffset] = {
+    TimeGrain.SECOND: DateOffset(seconds=1),
+    TimeGrain.FIVE_SECONDS: DateOffset(seconds=5),
+    TimeGrain.THIRTY_SECONDS: DateOffset(seconds=30),
+    TimeGrain.MINUTE: DateOffset(minutes=1),
+    TimeGrain.FIVE_MINUTES: DateOffset(minutes=5),
+    TimeGrain.TEN_MINUTES: DateOffset(minutes=10),
+    TimeGrain.FIFTEEN_MINUTES: DateOffset(minutes=15),
+    TimeGrain.THIRTY_MINUTES: DateOffset(minutes=30),
+    TimeGrain.HALF_HOUR: DateOffset(minutes=30),
+    TimeGrain.HOUR: DateOffset(hours=1),
+    TimeGrain.SIX_HOURS: DateOffset(hours=6),
+    TimeGrain.DAY: DateOffset(days=1),
+    TimeGrain.WEEK: DateOffset(weeks=1),
+    TimeGrain.WEEK_STARTING_SUNDAY: DateOffset(weeks=1),
+    TimeGrain.WEEK_STARTING_MONDAY: DateOffset(weeks=1),
+    TimeGrain.WEEK_ENDING_SATURDAY: DateOffset(weeks=1),
+    TimeGrain.WEEK_ENDING_SUNDAY: DateOffset(weeks=1),
+    TimeGrain.MONTH: DateOffset(months=1),
+    TimeGrain.QUARTER: DateOffset(months=3),
+    TimeGrain.QUARTER_YEAR: DateOffset(months=3),
+    TimeGrain.YEAR: DateOffset(years=1),
+}
+
+
+class IncrementalRefresh(TypedDict):
+    cache_key: str
+    time_column: str
+    label: str
+    time_grain: str
+    lookback: DateOffset
+
+
+class IncrementalRefreshManager:
+    """
+    Refreshes the time series of the datasets whose `incremental_refresh_grains`
+    extra is set incrementally.
+
+    The result of the queries with a temporal x-axis is kept, before it's post
+    processed, regardless of the time range. On the next cache miss only the latest
+    time grains are queried, the data of the previous ones being assumed not to
+    change.
+    """
+
+    def __init__(
+        self,
+        processor: QueryContextProcessor,
+        datasource: BaseDatasource,
+        force: bool,
+    ) -> None:
+        self.processor = processor
+        self.datasource = datasource
+        self.force = force
+
+    def get_incremental_refresh(
+        self, query_object: QueryObject
+    ) -> IncrementalRefresh | None:
+        """
+        Return how to refresh the result of a query incrementally, or None if it
+        can't be.
+        """
+        lookback = getattr(self.datasource, "extra_dict", {}).get(
+            "incremental_refresh_grains"
+        )
+        time_grain = self.processor.get_time_grain(query_object)
+        if not _is_refreshable(query_object, lookback, time_grain):
+            return None
+
+        if base_axis_labels := get_base_axis_labels(query_object.columns):
+            time_column = label = base_axis_labels[0]
+        elif query_object.is_timeseries and query_object.granularity:
+            time_column, label = query_object.granularity, DTTM_ALIAS
+        else:
+            return None
+        if time_column not in self.datasource.column_names:
+            return None
+
+        # the result is kept for all the time ranges, before being post processed
+        query_object_clone = copy.copy(query_object)
+        query_object_clone.time_range = None
+        query_object_clone.time_offsets = []
+        query_object_clone.post_processing = []
+        query_object_clone.filter = _without_time_range(query_object, time_column)
+        cache_key = self.processor.query_cache_key(
+            query_object_clone, incremental_refresh=True
+        )
+        if not cache_key:
+            return None
+
+        return IncrementalRefresh(
+            cache_key=cache_key,
+            time_column=time_column,
+            label=label,
+            time_grain=time_grain,
+            lookback=INCREMENTAL_REFRESH_GRAINS[time_grain] * (lookback - 1),
+        )
+
+    def query_incrementally(
+        self, query_object: QueryObject, incremental_refresh: IncrementalRefresh
+    ) -> QueryResult | None:
+        """
+        Query the time grains of the result of a query which may have changed since
+        it was kept, merged with the previous ones, or return None if the whole
+        query has to be run.
+
+        The kept result is reused if its time range starts at the same time, and
+        ends before, so that all its time grains, but the last ones, are complete.
+        """
+        if self.force:
+            return None
+
+        cache = QueryCacheManager.get(
+            incremental_refresh["cache_key"], region=CacheRegion.DATA
+        )
+        label = incremental_refresh["label"]
+        if not _is_reusable(cache, label) or not _covers_time_range(
+            cache, query_object
+        ):
+            stats_logger.incr("incremental_refresh.miss")
+            return None
+
+        start = cache.df[label].max() - incremental_refresh["lookback"]
+        query_object_clone = copy.copy(query_object)
+        query_object_clone.filter = _without_time_range(
+            query_object, incremental_refresh["time_column"]
+        ) + [
+            {
+                "col": incremental_refresh["time_column"],
+                "op": FilterOperator.TEMPORAL_RANGE.value,
+                "val": f"{start} : {query_object.to_dttm or ''}",
+                "grain": incremental_refresh["time_grain"],
+            }
+        ]
+
+        result = self.processor.query_datasource(query_object_clone.to_dict())
+        if result.status == QueryStatus.FAILED:
+            return result
+        if not result.df.empty:
+            result.df = self.processor.normalize_df(result.df, query_object)
+
+        df = pd.concat(
+            [cache.df[cache.df[label] < start], result.df],
+            ignore_index=True,
+        )
+        # the result of the whole query could have been truncated
+        if query_object.row_limit and len(df.index) >= query_object.row_limit:
+            stats_logger.incr("incremental_refresh.miss")
+            return None
+
+        stats_logger.incr("incremental_refresh.hit")
+        result.df = df
+        result.sql_rowcount = len(df.index)
+        self.set_incremental_result(query_object, incremental_refresh, result)
+        return result
+
+    def set_incremental_result(
+        self,
+        query_object: QueryObject,
+        incremental_refresh: IncrementalRefresh,
+        result: QueryResult,
+    ) -> None:
+        """
+        Keep the result of a query, before it's post processed, to refresh it
+        incrementally.
+        """
+        QueryCacheManager.set(
+            key=incremental_refresh["cache_key"],
+            value={
+                "df": result.df,
+                "query": result.query,
+                "from_dttm": _isoformat(query_object.from_dttm),
+                "to_dttm": _isoformat(query_object.to_dttm),
+            },
+            timeout=config["DATA_CACHE_INCREMENTAL_REFRESH_TIMEOUT"],
+            datasource_uid=self.datasource.uid,
+            region=CacheRegion.DATA,
+        )
+
+
+def _is_refreshable(query_object: QueryObject, lookback: Any, time_grain: Any) -> bool:
+    """
+    Whether the query is grouped by a time grain of a known length, and its result
+    isn't limited to a window which would move as new data comes in.
+    """
+    if not isinstance(lookback, int) or lookback <= 0:
+        return False
+    if time_grain not in INCREMENTAL_REFRESH_GRAINS:
+        return False
+    return not (
+        query_object.series_limit or query_object.row_offset or query_object.time_shift
+    )
+
+
+def _is_reusable(cache: QueryCacheManager, label: str) -> bool:
+    """
+    Whether a result was kept, with the time column of the query.
+    """
+    return bool(
+        cache.is_loaded
+        and cache.cache_value
+        and not cache.df.empty
+        and dataframe_utils.is_datetime_series(cache.df.get(label))
+    )
+
+
+def _covers_time_range(cache: QueryCacheManager, query_object: QueryObject) -> bool:
+    """
+    Whether the kept result starts at the same time as the query, and doesn't end
+    after it.
+    """
+    cache_value = cache.cache_value or {}
+    if cache_value.get("from_dttm") != _isoformat(query_object.from_dttm):
+        return False
+    if (to_dttm := cache_value.get("to_dttm")) is None:
+        return query_object.to_dttm is None
+    return query_object.to_dttm is None or pd.Timestamp(to_dttm) <= pd.Timestamp(
+        query_object.to_dttm
+    )
+
+
+def _without_time_range(
+    query_object: QueryObject, time_column: str
+) -> list[QueryObjectFilterClause]:
+    """
+    Return the filters of the query, but the time range of the time column.
+    """
+    return [
+        flt
+        for flt in query_object.filter
+        if flt.get("col") != time_column
+        or flt.get("op") != FilterOperator.TEMPORAL_RANGE.value
+    ]
+
+
+def _isoformat(dttm: datetime | None) -> str | None:
+    return dttm.isoformat() if dttm else None
@@ -17,6 +17,9 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
+import uuid
 from typing import Any
 
 from flask_caching import Cache
@@ -27,11 +30,13 @@ from superset.common.db_query_status import QueryStatus
 from superset.constants import CacheRegion
 from superset.exceptions import CacheLoadError
 from superset.extensions import cache_manager
+from superset.key_value.exceptions import KeyValueCodecDecodeException
 from superset.models.helpers import QueryResult
 from superset.stats_logger import BaseStatsLogger
 from superset.superset_typing import Column
-from superset.utils.cache import set_and_log_cache
+from superset.utils.cache import add_to_cache_index, set_and_log_cache
 from superset.utils.core import error_msg_from_exception, get_stacktrace
+from superset.utils.lru import LRUCache
 
 config = app.config
 stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
@@ -42,6 +47,30 @@ _cache: dict[CacheRegion, Cache] = {
     CacheRegion.DATA: cache_manager.data_cache,
 }
 
+# worker-local cache in front of the data cache, of the values by key along with
+# their version
+_l1_cache: LRUCache[str, tuple[str, dict[str, Any]]] | None = None
+_l1_cache_lock = threading.Lock()
+
+
+def get_l1_cache() -> LRUCache[str, tuple[str, dict[str, Any]]] | None:
+    """
+    Return the worker-local cache of the query results of the data cache, bounded
+    in bytes by `DATA_CACHE_L1_SIZE_MB`, or None when disabled.
+    """
+    global _l1_cache  # pylint: disable=global-statement
+    if not config["DATA_CACHE_L1_SIZE_MB"]:
+        return None
+    with _l1_cache_lock:
+        if _l1_cache is None:
+            _l1_cache = LRUCache(
+                maxsize=config["DATA_CACHE_L1_SIZE_MB"] * 1024 * 1024,
+                getsizeof=lambda entry: int(
+                    entry[1]["df"].memory_usage(index=True, deep=True).sum()
+                ),
+            )
+        return _l1_cache
+
 
 class QueryCacheManager:
     """
@@ -81,6 +110,8 @@ class QueryCacheManager:
         self.cache_dttm = cache_dttm
         self.cache_value = cache_value
         self.sql_rowcount = sql_rowcount
+        # whether the value was served after its timeout, set when it's loaded
+        self.is_stale: bool | None = None
 
     # pylint: disable=too-many-arguments
     def set_query_result(
@@ -92,9 +123,13 @@ class QueryCacheManager:
         timeout: int | None = None,
         datasource_uid: str | None = None,
         region: CacheRegion = CacheRegion.DEFAULT,
+        stale_timeout: int = 0,
     ) -> None:
         """
         Set dataframe of query-result to specific cache region
+
+        With a `stale_timeout`, the value is kept in the cache for that many seconds
+        after `timeout`, during which it's returned as stale.
         """
         try:
             self.status = query_result.status
@@ -122,6 +157,9 @@ class QueryCacheManager:
                 "annotation_data": self.annotation_data,
                 "sql_rowcount": self.sql_rowcount,
             }
+            if timeout and timeout > 0 and stale_timeout > 0:
+                value["stale_at"] = time.time() + timeout
+                timeout += stale_timeout
             if self.is_loaded and key and self.status != QueryStatus.FAILED:
                 self.set(
                     key=key,
@@ -152,7 +190,7 @@ class QueryCacheManager:
         if not key or not _cache[region] or force_query:
             return query_cache
 
-        if cache_value := _cache[region].get(key):
+        if cache_value := cls._get_cached_value(key, region):
             logger.debug("Cache key: %s", key)
             stats_logger.incr("loading_from_cache")
             try:
@@ -172,6 +210,8 @@ class QueryCacheManager:
                 query_cache.is_loaded = True
                 query_cache.is_cached = cache_value is not None
                 query_cache.sql_rowcount = cache_value.get("sql_rowcount", None)
+                stale_at = cache_value.get("stale_at")
+                query_cache.is_stale = stale_at is not None and stale_at <= time.time()
                 query_cache.cache_dttm = (
                     cache_value["dttm"] if cache_value is not None else None
                 )
@@ -204,8 +244,91 @@ class QueryCacheManager:
         """
         set value to specify cache region, proxy for `set_and_log_cache`
         """
+        if key and region == CacheRegion.DATA and get_l1_cache() is not None:
+            # a new version invalidates the value in the worker-local caches
+            version = uuid.uuid4().hex
+            value = {**value, "version": version}
+            if timeout is None:
+                timeout = config["CACHE_DEFAULT_TIMEOUT"]
+            _cache[region].set(f"{key}-version", version, timeout=timeout)
+            if datasource_uid and config["STORE_CACHE_KEYS_IN_REDIS"]:
+                add_to_cache_index(
+                    _cache[region], datasource_uid, [f"{key}-version"], timeout
+                )
         if key:
-            set_and_log_cache(_cache[region], key, value, timeout, datasource_uid)
+            set_and_log_cache(
+                _cache[region],
+                key,
+                value,
+                timeout,
+                datasource_uid,
+                codec=config["DATA_CACHE_CODEC"],
+            )
+
+    @classmethod
+    def _get_cached_value(
+        cls,
+        key: str,
+        region: CacheRegion,
+    ) -> dict[str, Any] | None:
+        """
+        Get a value from the worker-local cache, if its version is the current one,
+        otherwise from the cache.
+
+        The values of the worker-local cache are shared, their copies are returned.
+        """
+        if region != CacheRegion.DATA or (l1_cache := get_l1_cache()) is None:
+            return cls._get_value(key, region)
+
+        version = _cache[region].get(f"{key}-version")
+        if version is not None and (entry := l1_cache.get(key)) and entry[0] == version:
+            stats_logger.incr("data_cache.l1.hit")
+            return {**entry[1], "df": entry[1]["df"].copy()}
+
+        stats_logger.incr("data_cache.l1.miss")
+        value = cls._get_value(key, region)
+        stats_logger.incr("data_cache.l2.hit" if value else "data_cache.l2.miss")
+        if value and version is not None and value.get("version") == version:
+            l1_cache.set(key, (version, value))
+            return {**value, "df": value["df"].copy()}
+        return value
+
+    @staticmethod
+    def _get_value(key: str, region: CacheRegion) -> dict[str, Any] | None:
+        """
+        Get a value from the cache, decoding it if it was encoded by the codec of
+        `DATA_CACHE_CODEC`, values stored without codec being dicts.
+        """
+        value = _cache[region].get(key)
+        if not isinstance(value, bytes):
+            return value
+
+        if not (codec := config["DATA_CACHE_CODEC"]):
+            logger.warning("Cache key %s was encoded, but no codec is set", key)
+            return None
+        try:
+            return codec.decode(value)
+        except KeyValueCodecDecodeException as ex:
+            logger.warning("Could not decode cache key %s: %s", key, str(ex))
+            return None
+
+    @staticmethod
+    def claim_refresh(
+        key: str,
+        timeout: int,
+        region: CacheRegion = CacheRegion.DEFAULT,
+    ) -> bool:
+        """
+        Claim the refresh of a stale value, returning whether no one else had.
+        """
+        return bool(_cache[region].add(f"{key}-refresh", True, timeout=timeout))
+
+    @staticmethod
+    def release_refresh(
+        key: str,
+        region: CacheRegion = CacheRegion.DEFAULT,
+    ) -> None:
+        _cache[region].delete(f"{key}-refresh")
 
     @staticmethod
     def delete(
@@ -214,6 +337,9 @@ class QueryCacheManager:
     ) -> None:
         if key:
             _cache[region].delete(key)
+            if region == CacheRegion.DATA and (l1_cache := get_l1_cache()) is not None:
+                _cache[region].delete(f"{key}-version")
+                l1_cache.pop(key)
 
     @staticmethod
     def has(
@@ -54,7 +54,7 @@ from superset.advanced_data_type.plugins.internet_port import internet_port
 from superset.advanced_data_type.types import AdvancedDataType
 from superset.constants import CHANGE_ME_SECRET_KEY
 from superset.jinja_context import BaseTemplateProcessor
-from superset.key_value.types import JsonKeyValueCodec
+from superset.key_value.types import JsonKeyValueCodec, KeyValueCodec
 from superset.stats_logger import DummyStatsLogger
 from superset.superset_typing import CacheConfig
 from superset.tasks.types import ExecutorType
@@ -80,6 +80,8 @@ STATS_LOGGER = DummyStatsLogger()
 
 # By default will log events to the metadata database with `DBEventLogger`
 # Note that you can use `StdOutEventLogger` for debugging
+# Note that `BufferedDBEventLogger` writes the events in batches from a background
+# thread, instead of during the requests
 # Note that you can write your own event logger by extending `AbstractEventLogger`
 # https://github.com/apache/superset/blob/master/superset/utils/log.py
 EVENT_LOGGER = DBEventLogger()
@@ -276,6 +278,19 @@ FLASK_USE_RELOAD = True
 # to the page to see the call stack.
 PROFILING = False
 
+# The stages of the chart data pipeline (SQL generation, Jinja rendering, query
+# execution, fetch, result set, `normalize_df`, post-processing and serialization)
+# are always timed, and sent to the `STATS_LOGGER` as `profiler.<stage>`. Turn this
+# on to also return their durations in the `Server-Timing` header of the responses.
+PROFILING_SERVER_TIMING = False
+
+# Ratio of the requests whose stack is sampled every `PROFILING_SAMPLING_INTERVAL`
+# seconds, and written to a collapsed stack file in `PROFILING_SAMPLING_DIR`, for
+# flame graphs (e.g. with `flamegraph.pl` or speedscope). Set to 0 to disable.
+PROFILING_SAMPLING_RATE = 0.0
+PROFILING_SAMPLING_INTERVAL = 0.005
+PROFILING_SAMPLING_DIR = os.path.join(DATA_DIR, "profiles")
+
 # Superset allows server-side python stacktraces to be surfaced to the
 # user when this feature is on. This may have security implications
 # and it's more secure to turn it off in production settings.
@@ -772,6 +787,59 @@ CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# Maximum time, in seconds, a chart data request missing the data cache waits for
+# another request loading the same query, instead of running it as well. The requests
+# are coordinated through a lock in the key-value table of the metadata database, and
+# once the wait times out the request runs the query itself. The lock expires after
+# the same time, should the request holding it die. Set to 0 to disable.
+DATA_CACHE_SINGLE_FLIGHT_TIMEOUT = 0
+
+# Default duration, in seconds, during which chart data is still returned from the
+# data cache once its cache timeout has elapsed, flagged as stale, while a Celery
+# task refreshes it. Charts and datasets can override it with their own
+# `stale_cache_timeout`. Set to 0 to let cached data expire with its cache timeout.
+DATA_CACHE_STALE_TIMEOUT = 0
+
+# Codec of the query results stored in the data cache, which are otherwise pickled
+# as is by the cache. `ArrowKeyValueCodec` stores their DataFrames as compressed
+# Arrow IPC streams, typically 2-3 times smaller than pickled, at the cost of a few
+# milliseconds to encode and decode them, and falls back to pickle for the results
+# it can't store exactly. Results cached before a codec is set are still read.
+#
+# from superset.key_value.types import ArrowKeyValueCodec
+# DATA_CACHE_CODEC = ArrowKeyValueCodec(compression="zstd")
+DATA_CACHE_CODEC: KeyValueCodec | None = None
+
+# Size, in MB, of the worker-local cache of the query results read from the data
+# cache, so that the results of the most viewed charts aren't fetched and decoded on
+# every request. The results are stored with a version, also stored in the data
+# cache, which is checked on each read, so a result overwritten by another worker
+# (e.g. on a forced refresh) is read again. Set to 0 to disable the cache.
+DATA_CACHE_L1_SIZE_MB = 0
+
+# Time, in seconds, the results of the queries of the datasets whose
+# `incremental_refresh_grains` extra is set are kept in the data cache, before
+# they're post processed. Their time series, with a temporal x-axis, are then
+# refreshed by querying only their latest time grains, e.g. with
+# `{"incremental_refresh_grains": 2}` the last two days of a daily series, the others
+# being kept. This is meant for the tables whose data is only appended.
+DATA_CACHE_INCREMENTAL_REFRESH_TIMEOUT = int(timedelta(days=1).total_seconds())
+
+# Number of row level security filter lookups, by set of roles and table, cached in
+# each worker. The cached filters are invalidated whenever a filter is written,
+# through a version stored in the cache configured by `CACHE_CONFIG`, so the cache
+# is only used when `CACHE_CONFIG` is a backend shared by all the workers (Redis or
+# Memcached), never with a per-process or per-host one like `SimpleCache` or
+# `FileSystemCache`, nor with the metastore cache. Set to 0 to disable the cache.
+RLS_FILTERS_CACHE_SIZE = 1000
+
+# The permissions of the current user on a view menu (or the view menus of a
+# permission) are loaded once per request, the first time they're checked. Set this to
+# a number of seconds to also cache them in each worker, by set of roles. Permission
+# changes made through a worker are seen right away by that worker, but only once the
+# cached permissions expire by the other ones. Set to 0 to disable the cache.
+PERMISSIONS_CACHE_TTL = 0
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -781,9 +849,13 @@ FILTER_STATE_CACHE_CONFIG: CacheConfig = {
     "CACHE_DEFAULT_TIMEOUT": int(timedelta(days=90).total_seconds()),
     # Should the timeout be reset when retrieving a cached value?
     "REFRESH_TIMEOUT_ON_RETRIEVAL": True,
-    # The following parameter only applies to `MetastoreCache`:
+    # The following parameters only apply to `MetastoreCache`:
     # How should entries be serialized/deserialized?
     "CODEC": JsonKeyValueCodec(),
+    # How many entries should each worker keep in memory, and for how many seconds?
+    # The changes made by the other workers aren't seen until they're evicted.
+    "LOCAL_CACHE_SIZE": 0,
+    "LOCAL_CACHE_TIMEOUT": 10,
 }
 
 # Cache for explore form data state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
@@ -795,14 +867,25 @@ EXPLORE_FORM_DATA_CACHE_CONFIG: CacheConfig = {
     "CACHE_DEFAULT_TIMEOUT": int(timedelta(days=7).total_seconds()),
     # Should the timeout be reset when retrieving a cached value?
     "REFRESH_TIMEOUT_ON_RETRIEVAL": True,
-    # The following parameter only applies to `MetastoreCache`:
+    # The following parameters only apply to `MetastoreCache`:
     # How should entries be serialized/deserialized?
     "CODEC": JsonKeyValueCodec(),
+    # How many entries should each worker keep in memory, and for how many seconds?
+    # The changes made by the other workers aren't seen until they're evicted.
+    "LOCAL_CACHE_SIZE": 0,
+    "LOCAL_CACHE_TIMEOUT": 10,
 }
 
 # store cache keys by datasource UID (via CacheKey) for custom processing/invalidation
 STORE_CACHE_KEYS_IN_METADATA_DB = False
 
+# Index the cache keys by datasource UID in Redis sets, next to the cached values,
+# when the cache is backed by Redis. The cache of datasources, databases or schemas
+# is then invalidated without a scan of the keyspace, nor a flush of the whole cache,
+# through the `/api/v1/cachekey/invalidate` endpoint or the `superset
+# invalidate-cache` command.
+STORE_CACHE_KEYS_IN_REDIS = False
+
 # CORS Options
 ENABLE_CORS = False
 CORS_OPTIONS: dict[Any, Any] = {}
@@ -855,6 +938,11 @@ CSV_EXPORT = {"encoding": "utf-8"}
 # note: index option should not be overridden
 EXCEL_EXPORT: dict[str, Any] = {}
 
+# Arrow Options: key/value pairs that will be passed as argument to
+# superset.utils.arrow.df_to_arrow_ipc when the chart data is requested with the
+# `arrow` result format.
+ARROW_EXPORT: dict[str, Any] = {"max_chunksize": 65536}
+
 # ---------------------------------------------------
 # Time grain configurations
 # ---------------------------------------------------
@@ -891,6 +979,26 @@ TIME_GRAIN_ADDON_EXPRESSIONS: dict[str, dict[str, str]] = {}
 # TIME_GRAIN_JOIN_COLUMN_PRODUCERS = {"P1F": join_producer}
 TIME_GRAIN_JOIN_COLUMN_PRODUCERS: dict[str, Callable[[Series, int], str]] = {}
 
+# Maximum number of time comparison (time shift) queries of a single chart data
+# query that are run concurrently. Cached offsets are never re-queried, and the
+# results are joined once all the offset queries are done. Set to 1 to run the
+# offset queries sequentially.
+TIME_OFFSET_QUERIES_MAX_WORKERS = 1
+
+# Maximum number of query objects of a single chart data request (e.g. the
+# queries of a mixed chart, or the totals query of a table chart) that are run
+# concurrently. The payloads are returned in the same order as the queries.
+# When enabled, the time offset queries of each query object are run
+# sequentially, so that a request uses at most this number of threads. Set to 1
+# to run the queries sequentially.
+CHART_DATA_QUERIES_MAX_WORKERS = 1
+
+# Maximum number of chart data queries a single web worker process runs
+# concurrently against the same database, across all requests. This only applies
+# to queries fanned out by the concurrent execution modes above. Set to None to
+# disable the limit.
+DATABASE_MAX_CONCURRENT_QUERIES: int | None = 4
+
 # ---------------------------------------------------
 # List of viz_types not allowed in your environment
 # For example: Disable pivot table and treemap:
@@ -970,8 +1078,23 @@ SQLLAB_SAVE_WARNING_MESSAGE = None
 SQLLAB_SCHEDULE_WARNING_MESSAGE = None
 
 # Max payload size (MB) for SQL Lab to prevent browser hangs with large results.
+# The size of the results is also estimated as they're fetched, in batches of
+# SQLLAB_FETCH_BATCH_SIZE rows (10000 when it isn't set), and queries are cancelled
+# as soon as it exceeds the limit.
 SQLLAB_PAYLOAD_MAX_MB = None
 
+# Number of rows fetched from the cursor at a time when running SQL Lab queries.
+# When set, each batch of rows is converted to Arrow as soon as it's fetched, so
+# the rows of the results are never all held in memory as Python objects, which
+# roughly halves the peak memory used by the worker for large results. When not
+# set, all the rows are fetched at once, unless SQLLAB_PAYLOAD_MAX_MB is set.
+SQLLAB_FETCH_BATCH_SIZE: int | None = None
+
+# Number of rows converted to CSV at a time when exporting SQL Lab results. The
+# export is streamed to the client, so this bounds the memory used by the web
+# worker regardless of the size of the results.
+SQLLAB_CSV_EXPORT_CHUNK_SIZE = 10000
+
 # Force refresh while auto-refresh in dashboard
 DASHBOARD_AUTO_REFRESH_MODE: Literal["fetch", "force"] = "force"
 # Dashboard auto refresh intervals
@@ -1004,6 +1127,7 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
         "superset.tasks.scheduler",
         "superset.tasks.thumbnails",
         "superset.tasks.cache",
+        "superset.tasks.async_queries",
     )
     result_backend = "db+sqlite:///celery_results.sqlite"
     worker_prefetch_multiplier = 1
@@ -1023,6 +1147,11 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
             "task": "reports.prune_log",
             "schedule": crontab(minute=0, hour=0),
         },
+        # the expired entries of `SupersetMetastoreCache` aren't deleted otherwise
+        "prune_metastore_cache": {
+            "task": "prune_metastore_cache",
+            "schedule": crontab(minute=30, hour="*"),
+        },
         # Uncomment to enable pruning of the query table
         # "prune_query": {
         #     "task": "prune_query",
@@ -1137,6 +1266,25 @@ RESULTS_BACKEND: BaseCache | None = None
 # in order to disable should breaking issues be discovered.
 RESULTS_BACKEND_USE_MSGPACK = True
 
+# Store SQL Lab results in the results backend as Arrow IPC compressed with the
+# given codec ("lz4" or "zstd"), with the metadata in a separate header, rather
+# than as zlib compressed msgpack/JSON. Fetches and exports then only decompress
+# the record batches of the rows they read. Entries stored in the other formats
+# remain readable, so this can be toggled at any time.
+RESULTS_BACKEND_ARROW_COMPRESSION: Literal["lz4", "zstd"] | None = None
+
+# Maximum number of rows per record batch in the Arrow format, i.e. the unit of
+# decompression when reading a range of rows.
+RESULTS_BACKEND_ARROW_BATCH_SIZE = 10000
+
+# In the Arrow format, results larger than this number of rows are split in
+# chunks stored under separate keys, with a manifest listing them, so reading a
+# range of rows (e.g. when scrolling in SQL Lab) only fetches the chunks it spans.
+RESULTS_BACKEND_ARROW_CHUNK_SIZE: int | None = 100000
+
+# Size (MB) of the per-process LRU cache of decoded result chunks.
+RESULTS_BACKEND_CHUNK_CACHE_SIZE_MB = 64
+
 # The S3 bucket where you want to store your external hive tables created
 # from CSV files. For example, 'companyname-superset'
 CSV_TO_HIVE_UPLOAD_S3_BUCKET = None
@@ -1736,6 +1884,21 @@ GLOBAL_ASYNC_QUERIES_POLLING_DELAY = int(
     timedelta(milliseconds=500).total_seconds() * 1000
 )
 GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL = "ws://127.0.0.1:8080/"
+# Long polling timeout of the async events, in milliseconds. When a client has no new
+# events, `/api/v1/async_event/` waits up to that long for some (with Redis
+# `XREAD BLOCK`), and returns all the events written meanwhile in one response. Each
+# waiting client holds a web server connection, so use an async worker class (e.g.
+# gevent), and keep the timeout below the web server and Redis socket timeouts. Set to
+# 0 to disable.
+GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT = 0
+# Identical chart data jobs, i.e. with the same query context and query cache keys,
+# submitted while one of them is running are coalesced: only the first one runs, and the
+# others are notified of its result on their own channel. This is the maximum time, in
+# seconds, a job can be waited for; the following identical jobs run on their own, e.g.
+# if the worker running it was lost. Note that the jobs attached to a job whose worker
+# was lost aren't notified, unless one of these identical jobs completes within the
+# timeout, so their charts keep loading until they're refreshed. Set to 0 to disable.
+GLOBAL_ASYNC_QUERIES_JOB_DEDUPLICATION_TIMEOUT = 0
 
 # Global async queries cache backend configuration options:
 # - Set 'CACHE_TYPE' to 'RedisCache' for RedisCacheBackend.
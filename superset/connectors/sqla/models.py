@@ -62,6 +62,7 @@ from sqlalchemy.orm import (
     reconstructor,
     relationship,
     RelationshipProperty,
+    Session,
 )
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.schema import UniqueConstraint
@@ -203,6 +204,7 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
     filter_select_enabled = Column(Boolean, default=True)
     offset = Column(Integer, default=0)
     cache_timeout = Column(Integer)
+    stale_cache_timeout = Column(Integer)
     params = Column(String(1000))
     perm = Column(String(1000))
     schema_perm = Column(String(1000))
@@ -389,6 +391,7 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
             "schema": self.schema or None,
             "offset": self.offset,
             "cache_timeout": self.cache_timeout,
+            "stale_cache_timeout": self.stale_cache_timeout,
             "params": self.params,
             "perm": self.perm,
             "edit_url": self.url,
@@ -1201,6 +1204,7 @@ class SqlaTable(
         "database_id",
         "offset",
         "cache_timeout",
+        "stale_cache_timeout",
         "catalog",
         "schema",
         "sql",
@@ -2120,3 +2124,24 @@ class RowLevelSecurityFilter(Model, AuditMixinNullable):
         backref="row_level_security_filters",
     )
     clause = Column(utils.MediumText(), nullable=False)
+
+
+sa.event.listen(
+    RowLevelSecurityFilter, "after_insert", security_manager.rls_filters_after_change
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_update", security_manager.rls_filters_after_change
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_delete", security_manager.rls_filters_after_change
+)
+# deleting a role or a table deletes the filters' associations with it
+sa.event.listen(
+    security_manager.role_model,
+    "after_delete",
+    security_manager.rls_filters_after_change,
+)
+sa.event.listen(SqlaTable, "after_delete", security_manager.rls_filters_after_change)
+sa.event.listen(Session, "after_commit", security_manager.rls_filters_after_commit)
+sa.event.listen(Session, "after_rollback", security_manager.rls_filters_after_rollback)
+sa.event.listen(Session, "after_flush", security_manager.permissions_after_flush)
@@ -68,16 +68,106 @@ class KeyValueDAO(BaseDAO[KeyValueEntry]):
         return False
 
     @staticmethod
-    def delete_expired_entries(resource: KeyValueResource) -> None:
-        (
+    def get_entries(
+        resource: KeyValueResource,
+        keys: list[UUID],
+    ) -> list[KeyValueEntry]:
+        if not keys:
+            return []
+        return (
             db.session.query(KeyValueEntry)
             .filter(
                 and_(
                     KeyValueEntry.resource == resource.value,
-                    KeyValueEntry.expires_on <= datetime.now(),
+                    KeyValueEntry.uuid.in_(keys),
                 )
             )
-            .delete()
+            .all()
+        )
+
+    @staticmethod
+    def delete_entries(resource: KeyValueResource, keys: list[UUID]) -> int:
+        if not keys:
+            return 0
+        return (
+            db.session.query(KeyValueEntry)
+            .filter(
+                and_(
+                    KeyValueEntry.resource == resource.value,
+                    KeyValueEntry.uuid.in_(keys),
+                )
+            )
+            .delete(synchronize_session=False)
+        )
+
+    @staticmethod
+    def upsert_entries(
+        resource: KeyValueResource,
+        values: dict[UUID, Any],
+        codec: KeyValueCodec,
+        expires_on: datetime | None = None,
+    ) -> list[KeyValueEntry]:
+        """
+        Create or update the entries of several keys, the existing ones being fetched
+        in one query.
+
+        :returns: The entries, in the order of `values`
+        """
+        entries = {
+            entry.uuid: entry
+            for entry in KeyValueDAO.get_entries(resource, list(values))
+        }
+        result = []
+        for key, value in values.items():
+            try:
+                encoded_value = codec.encode(value)
+            except Exception as ex:
+                raise KeyValueCreateFailedError("Unable to encode value") from ex
+            if entry := entries.get(key):
+                entry.value = encoded_value
+                entry.expires_on = expires_on
+                entry.changed_on = datetime.now()
+                entry.changed_by_fk = get_user_id()
+            else:
+                entry = KeyValueEntry(
+                    resource=resource.value,
+                    value=encoded_value,
+                    uuid=key,
+                    created_on=datetime.now(),
+                    created_by_fk=get_user_id(),
+                    expires_on=expires_on,
+                )
+                db.session.add(entry)
+            result.append(entry)
+        return result
+
+    @staticmethod
+    def delete_expired_entries(
+        resource: KeyValueResource,
+        limit: int | None = None,
+    ) -> int:
+        """
+        Delete the expired entries of a resource, found through the index of their
+        expiry, up to `limit` of them.
+
+        :returns: The number of deleted entries
+        """
+        query = db.session.query(KeyValueEntry).filter(
+            and_(
+                KeyValueEntry.resource == resource.value,
+                KeyValueEntry.expires_on <= datetime.now(),
+            )
+        )
+        if limit is None:
+            return query.delete()
+
+        ids = [id_ for (id_,) in query.with_entities(KeyValueEntry.id).limit(limit)]
+        if not ids:
+            return 0
+        return (
+            db.session.query(KeyValueEntry)
+            .filter(KeyValueEntry.id.in_(ids))
+            .delete(synchronize_session=False)
         )
 
     @staticmethod
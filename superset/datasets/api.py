@@ -161,6 +161,7 @@ class DatasetRestApi(BaseSupersetModelRestApi):
         "offset",
         "default_endpoint",
         "cache_timeout",
+        "stale_cache_timeout",
         "is_sqllab_view",
         "template_params",
         "select_star",
@@ -242,6 +243,7 @@ class DatasetRestApi(BaseSupersetModelRestApi):
         "offset",
         "default_endpoint",
         "cache_timeout",
+        "stale_cache_timeout",
         "is_sqllab_view",
         "template_params",
         "owners",
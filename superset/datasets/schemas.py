@@ -116,6 +116,7 @@ class DatasetPutSchema(Schema):
     offset = fields.Integer(allow_none=True)
     default_endpoint = fields.String(allow_none=True)
     cache_timeout = fields.Integer(allow_none=True)
+    stale_cache_timeout = fields.Integer(allow_none=True)
     is_sqllab_view = fields.Boolean(allow_none=True)
     template_params = fields.String(allow_none=True)
     owners = fields.List(fields.Integer())
@@ -247,6 +248,7 @@ class ImportV1DatasetSchema(Schema):
     default_endpoint = fields.String(allow_none=True)
     offset = fields.Integer()
     cache_timeout = fields.Integer(allow_none=True)
+    stale_cache_timeout = fields.Integer(allow_none=True)
     schema = fields.String(allow_none=True)
     catalog = fields.String(allow_none=True)
     sql = fields.String(allow_none=True)
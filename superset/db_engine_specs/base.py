@@ -21,6 +21,7 @@ from __future__ import annotations
 import logging
 import re
 import warnings
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from re import Match, Pattern
 from typing import (
@@ -29,6 +30,7 @@ from typing import (
     cast,
     ContextManager,
     NamedTuple,
+    overload,
     TYPE_CHECKING,
     TypedDict,
     Union,
@@ -173,6 +175,75 @@ class LimitMethod:  # pylint: disable=too-few-public-methods
     FORCE_LIMIT = "force_limit"
 
 
+class FetchManyCursor:
+    """
+    DB-API cursor proxy whose `fetchall` only returns the next `size` rows.
+
+    This allows `BaseEngineSpec.fetch_data`, and its engine specific overrides, to
+    process the results of a query one chunk at a time.
+    """
+
+    def __init__(self, cursor: Any, size: int) -> None:
+        object.__setattr__(self, "_cursor", cursor)
+        object.__setattr__(self, "_size", size)
+
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        return self._cursor.fetchmany(self._size)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._cursor, name, value)
+
+
+class ColumnarRows(Sequence[tuple[Any, ...]]):
+    """
+    Rows of the results of a query, stored as columns.
+
+    Behaves as the list of tuples returned by `BaseEngineSpec.fetch_data`, so engine
+    specific overrides can still process it row by row, while `SupersetResultSet`
+    builds its Arrow arrays straight from the columns, without materializing the
+    rows.
+    """
+
+    def __init__(self, columns: list[Sequence[Any]], num_rows: int) -> None:
+        self.columns = columns
+        self.num_rows = num_rows
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[Any, ...]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ColumnarRows: ...
+
+    def __getitem__(self, index: int | slice) -> tuple[Any, ...] | ColumnarRows:
+        if isinstance(index, slice):
+            return ColumnarRows(
+                [column[index] for column in self.columns],
+                len(range(*index.indices(self.num_rows))),
+            )
+        if not -self.num_rows <= index < self.num_rows:
+            raise IndexError("row index out of range")
+        return tuple(column[index] for column in self.columns)
+
+    def __iter__(self) -> Iterator[tuple[Any, ...]]:
+        return zip(*self.columns)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class MetricType(TypedDict, total=False):
     """
     Type for metrics return by `get_metrics`.
@@ -960,7 +1031,9 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         )
 
     @classmethod
-    def fetch_data(cls, cursor: Any, limit: int | None = None) -> list[tuple[Any, ...]]:
+    def fetch_data(
+        cls, cursor: Any, limit: int | None = None
+    ) -> Sequence[tuple[Any, ...]]:
         """
 
         :param cursor: Cursor instance
@@ -974,31 +1047,61 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
                 return cursor.fetchmany(limit)
             data = cursor.fetchall()
             description = cursor.description or []
-            # Create a mapping between column name and a mutator function to normalize
-            # values with. The first two items in the description row are
+            # Create a mapping between column index and a mutator function to
+            # normalize values with. The first two items in the description row are
             # the column name and type.
             column_mutators = {
-                row[0]: func
-                for row in description
+                idx: func
+                for idx, row in enumerate(description)
                 if (
                     func := cls.column_type_mutators.get(
                         type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
                     )
                 )
             }
-            if column_mutators:
-                indexes = {row[0]: idx for idx, row in enumerate(description)}
-                for row_idx, row in enumerate(data):
-                    new_row = list(row)
-                    for col, func in column_mutators.items():
-                        col_idx = indexes[col]
-                        new_row[col_idx] = func(row[col_idx])
-                    data[row_idx] = tuple(new_row)
+            if column_mutators and data:
+                # transpose the rows once, so each mutator is mapped over a whole
+                # column rather than rebuilding every row
+                columns: list[Sequence[Any]] = list(zip(*data))
+                for idx, func in column_mutators.items():
+                    columns[idx] = list(map(func, columns[idx]))
+                return ColumnarRows(columns, len(data))
 
             return data
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
+    @classmethod
+    def fetch_data_chunks(
+        cls,
+        cursor: Any,
+        chunk_size: int,
+        limit: int | None = None,
+    ) -> Iterator[Sequence[tuple[Any, ...]]]:
+        """
+        Fetch the results of a query in chunks of at most `chunk_size` rows.
+
+        Each chunk is processed by `fetch_data`, so engine specific handling of the
+        rows (e.g. column type mutators) is applied as well. Rows are only fetched
+        from the cursor as the chunks are consumed, so the fetch stops as soon as
+        the caller stops iterating.
+
+        :param cursor: Cursor instance
+        :param chunk_size: Maximum number of rows per chunk
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Iterator over the chunks of the result of the query
+        """
+        num_rows = 0
+        while limit is None or num_rows < limit:
+            size = chunk_size if limit is None else min(chunk_size, limit - num_rows)
+            data = cls.fetch_data(FetchManyCursor(cursor, size))
+            if not data:
+                break
+            yield data
+            num_rows += len(data)
+            if len(data) < size:
+                break
+
     @classmethod
     def expand_data(
         cls, columns: list[ResultSetColumnType], data: list[dict[Any, Any]]
@@ -1994,7 +2097,7 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         return []
 
     @staticmethod
-    def pyodbc_rows_to_tuples(data: list[Any]) -> list[tuple[Any, ...]]:
+    def pyodbc_rows_to_tuples(data: Sequence[Any]) -> Sequence[tuple[Any, ...]]:
         """
         Convert pyodbc.Row objects from `fetch_data` to tuples.
 
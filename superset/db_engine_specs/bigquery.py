@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import re
 import urllib
+from collections.abc import Sequence
 from datetime import datetime
 from re import Pattern
 from typing import Any, TYPE_CHECKING, TypedDict
@@ -240,7 +241,9 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
         return None
 
     @classmethod
-    def fetch_data(cls, cursor: Any, limit: int | None = None) -> list[tuple[Any, ...]]:
+    def fetch_data(
+        cls, cursor: Any, limit: int | None = None
+    ) -> Sequence[tuple[Any, ...]]:
         data = super().fetch_data(cursor, limit)
         # Support type BigQuery Row, introduced here PR #4071
         # google.cloud.bigquery.table.Row
@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 from urllib import parse
@@ -130,7 +131,7 @@ class DrillEngineSpec(BaseEngineSpec):
         cls,
         cursor: Any,
         limit: int | None = None,
-    ) -> list[tuple[Any, ...]]:
+    ) -> Sequence[tuple[Any, ...]]:
         """
         Custom `fetch_data` for Drill.
 
@@ -21,6 +21,7 @@ import os
 import re
 import tempfile
 import time
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any, TYPE_CHECKING
 from urllib import parse
@@ -148,7 +149,9 @@ class HiveEngineSpec(PrestoEngineSpec):
         hive.ttypes = patched_ttypes
 
     @classmethod
-    def fetch_data(cls, cursor: Any, limit: int | None = None) -> list[tuple[Any, ...]]:
+    def fetch_data(
+        cls, cursor: Any, limit: int | None = None
+    ) -> Sequence[tuple[Any, ...]]:
         # pylint: disable=import-outside-toplevel
         import pyhive
         from TCLIService import ttypes
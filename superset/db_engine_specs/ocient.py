@@ -18,6 +18,7 @@
 import contextlib
 import re
 import threading
+from collections.abc import Sequence
 from re import Pattern
 from typing import Any, Callable, NamedTuple, Optional
 
@@ -312,9 +313,9 @@ class OcientEngineSpec(BaseEngineSpec):
     @classmethod
     def fetch_data(
         cls, cursor: Any, limit: Optional[int] = None
-    ) -> list[tuple[Any, ...]]:
+    ) -> Sequence[tuple[Any, ...]]:
         try:
-            rows: list[tuple[Any, ...]] = super().fetch_data(cursor, limit)
+            rows: Sequence[tuple[Any, ...]] = super().fetch_data(cursor, limit)
         except Exception:
             with OcientEngineSpec.query_id_mapping_lock:
                 del OcientEngineSpec.query_id_mapping[
@@ -18,12 +18,18 @@
 from __future__ import annotations
 
 import logging
+import time
 import uuid
 from collections.abc import Iterator
 from contextlib import contextmanager
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 
+from sqlalchemy import or_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from superset.distributed_lock.types import SingleFlightLockValue
 from superset.distributed_lock.utils import get_key
 from superset.exceptions import CreateKeyValueDistributedLockFailedException
 from superset.key_value.types import JsonKeyValueCodec, KeyValueResource
@@ -33,6 +39,7 @@ logger = logging.getLogger(__name__)
 CODEC = JsonKeyValueCodec()
 LOCK_EXPIRATION = timedelta(seconds=30)
 RESOURCE = KeyValueResource.LOCK
+SINGLE_FLIGHT_POLL_INTERVAL = 0.2
 
 
 @contextmanager
@@ -75,3 +82,127 @@ def KeyValueDistributedLock(  # pylint: disable=invalid-name
     yield key
     DeleteDistributedLock(namespace=namespace, params=kwargs).run()
     logger.debug("Removed lock on namespace %s for key %s", namespace, key)
+
+
+@contextmanager
+def SingleFlight(  # pylint: disable=invalid-name
+    namespace: str,
+    timeout: float,
+    **kwargs: Any,
+) -> Iterator[bool]:
+    """
+    KV global lock guarding the computation of a value, so that only one of the
+    concurrent callers computes it while the others wait.
+
+    The block runs while holding the lock for the given namespace and parameters,
+    which is released afterwards, even if the block raises. When the lock is taken,
+    the caller waits for it to be released, for at most `timeout` seconds; after
+    that the block runs without the lock. The lock expires after `timeout` seconds
+    too, so that a caller which died holding it only delays the others that long.
+
+    The lock is acquired, polled and released through its own session, committed
+    on each attempt, so the transaction of the caller is left untouched. Only the
+    lock acquired by the caller is released: once expired, the lock may have been
+    acquired by another caller.
+
+    :param namespace: The namespace for which the lock is to be acquired.
+    :param timeout: The maximum time to wait for the lock, in seconds.
+    :param kwargs: Additional keyword arguments.
+    :yields: Whether the lock was held by another caller meanwhile, in which case
+        the value may have been computed by it.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from superset import db
+
+    key = get_key(namespace, **kwargs)
+    value = CODEC.encode(SingleFlightLockValue(value=True, owner=uuid.uuid4().hex))
+    expiration = timedelta(seconds=timeout)
+    deadline = time.monotonic() + timeout
+    waited = False
+    with Session(bind=db.session.get_bind()) as lock_session:
+        while not _acquire_lock(lock_session, key, value, expiration):
+            waited = True
+            if time.monotonic() >= deadline:
+                logger.warning(
+                    "Lock on namespace %s for key %s still taken after %ss",
+                    namespace,
+                    key,
+                    timeout,
+                )
+                yield waited
+                return
+
+            time.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+
+        logger.debug("Acquired lock on namespace %s for key %s", namespace, key)
+        try:
+            yield waited
+        finally:
+            _release_lock(lock_session, key, value)
+            logger.debug("Removed lock on namespace %s for key %s", namespace, key)
+
+
+def _acquire_lock(
+    lock_session: Session,
+    key: uuid.UUID,
+    value: bytes,
+    expiration: timedelta,
+) -> bool:
+    """
+    Acquire the lock for the given key, unless another caller holds it.
+
+    The transaction is ended either way, so that a lock released meanwhile is seen
+    on the next attempt whatever the isolation level.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.key_value.models import KeyValueEntry
+
+    now = datetime.now()
+    entries = lock_session.query(KeyValueEntry).filter_by(resource=RESOURCE, uuid=key)
+    try:
+        if entries.filter(
+            or_(KeyValueEntry.expires_on.is_(None), KeyValueEntry.expires_on > now)
+        ).count():
+            lock_session.rollback()  # pylint: disable=consider-using-transaction
+            return False
+
+        # only the expired lock is replaced, the lock acquired by another caller
+        # since the check above makes the insert fail instead
+        entries.filter(KeyValueEntry.expires_on <= now).delete(
+            synchronize_session=False
+        )
+        lock_session.add(
+            KeyValueEntry(
+                resource=RESOURCE,
+                value=value,
+                uuid=key,
+                expires_on=now + expiration,
+            )
+        )
+        lock_session.commit()  # pylint: disable=consider-using-transaction
+    except SQLAlchemyError:
+        # acquired by another caller meanwhile
+        lock_session.rollback()  # pylint: disable=consider-using-transaction
+        return False
+
+    return True
+
+
+def _release_lock(lock_session: Session, key: uuid.UUID, value: bytes) -> None:
+    """
+    Release the lock for the given key, if it's still the one holding `value`.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.key_value.models import KeyValueEntry
+
+    try:
+        lock_session.query(KeyValueEntry).filter_by(
+            resource=RESOURCE,
+            uuid=key,
+            value=value,
+        ).delete(synchronize_session=False)
+        lock_session.commit()  # pylint: disable=consider-using-transaction
+    except SQLAlchemyError:
+        lock_session.rollback()  # pylint: disable=consider-using-transaction
+        logger.exception("Failed to remove the lock for key %s", key)
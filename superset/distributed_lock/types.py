@@ -19,3 +19,7 @@ from typing import TypedDict
 
 class LockValue(TypedDict):
     value: bool
+
+
+class SingleFlightLockValue(LockValue):
+    owner: str
@@ -36,7 +36,7 @@ from superset.utils.cache_manager import CacheManager
 from superset.utils.encrypt import EncryptedFieldFactory
 from superset.utils.feature_flag_manager import FeatureFlagManager
 from superset.utils.machine_auth import MachineAuthProviderFactory
-from superset.utils.profiler import SupersetProfiler
+from superset.utils.profiler import RequestProfiler, SupersetProfiler
 
 
 class ResultsBackendManager:
@@ -132,6 +132,7 @@ machine_auth_provider_factory = MachineAuthProviderFactory()
 manifest_processor = UIManifestProcessor(APP_DIR)
 migrate = Migrate()
 profiling = ProfilingExtension()
+request_profiler = RequestProfiler()
 results_backend_manager = ResultsBackendManager()
 security_manager: SupersetSecurityManager = LocalProxy(lambda: appbuilder.sm)
 ssh_manager_factory = SSHManagerFactory()
@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Any, Optional
 from uuid import UUID, uuid3
@@ -32,6 +33,7 @@ from superset.key_value.types import (
 )
 from superset.key_value.utils import get_uuid_namespace
 from superset.utils.decorators import transaction
+from superset.utils.lru import LRUCache
 
 RESOURCE = KeyValueResource.METASTORE_CACHE
 
@@ -39,15 +41,31 @@ logger = logging.getLogger(__name__)
 
 
 class SupersetMetastoreCache(BaseCache):
-    def __init__(
+    """
+    Cache storing its values in the key-value table of the metastore.
+
+    The expired entries are deleted by the `prune_metastore_cache` Celery task. The
+    encoded values read and written by a worker can be kept in a local LRU cache, of
+    `local_cache_size` entries, for up to `local_cache_timeout` seconds, during which
+    the changes made by the other workers aren't seen.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         namespace: UUID,
         codec: KeyValueCodec,
         default_timeout: int = 300,
+        local_cache_size: int = 0,
+        local_cache_timeout: int = 10,
     ) -> None:
         super().__init__(default_timeout)
         self.namespace = namespace
         self.codec = codec
+        self.local_cache_timeout = local_cache_timeout
+        # encoded values by key, along with the time they expire at
+        self._local_cache: Optional[LRUCache[UUID, tuple[bytes, float]]] = (
+            LRUCache(maxsize=local_cache_size) if local_cache_size > 0 else None
+        )
 
     @classmethod
     def factory(
@@ -66,6 +84,8 @@ class SupersetMetastoreCache(BaseCache):
                 "use at your own risk."
             )
         kwargs["codec"] = codec
+        kwargs["local_cache_size"] = config.get("LOCAL_CACHE_SIZE", 0)
+        kwargs["local_cache_timeout"] = config.get("LOCAL_CACHE_TIMEOUT", 10)
         return cls(*args, **kwargs)
 
     def get_key(self, key: str) -> UUID:
@@ -77,34 +97,99 @@ class SupersetMetastoreCache(BaseCache):
             return datetime.now() + timedelta(seconds=timeout)
         return None
 
+    def _cache_locally(
+        self,
+        key: UUID,
+        value: bytes,
+        expires_on: Optional[datetime],
+    ) -> None:
+        if self._local_cache is None:
+            return
+        expires_at = time.time() + self.local_cache_timeout
+        if expires_on is not None:
+            expires_at = min(expires_at, expires_on.timestamp())
+        self._local_cache.set(key, (value, expires_at))
+
+    def _get_locally(self, key: UUID) -> Optional[bytes]:
+        if self._local_cache is None or (entry := self._local_cache.get(key)) is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.time():
+            self._local_cache.pop(key)
+            return None
+        return value
+
+    def _uncache_locally(self, keys: list[UUID]) -> None:
+        if self._local_cache is None:
+            return
+        for key in keys:
+            self._local_cache.pop(key)
+
     def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
         # pylint: disable=import-outside-toplevel
         from superset.daos.key_value import KeyValueDAO
 
-        KeyValueDAO.upsert_entry(
+        uuid = self.get_key(key)
+        expires_on = self._get_expiry(timeout)
+        entry = KeyValueDAO.upsert_entry(
             resource=RESOURCE,
-            key=self.get_key(key),
+            key=uuid,
             value=value,
             codec=self.codec,
-            expires_on=self._get_expiry(timeout),
+            expires_on=expires_on,
         )
         db.session.commit()  # pylint: disable=consider-using-transaction
+        self._cache_locally(uuid, entry.value, expires_on)
         return True
 
+    def set_many(
+        self, mapping: dict[str, Any], timeout: Optional[int] = None
+    ) -> list[Any]:
+        """
+        Set several values at once, fetching the existing entries in one query and
+        committing them in one transaction.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.daos.key_value import KeyValueDAO
+
+        expires_on = self._get_expiry(timeout)
+        try:
+            entries = KeyValueDAO.upsert_entries(
+                resource=RESOURCE,
+                values={self.get_key(key): value for key, value in mapping.items()},
+                codec=self.codec,
+                expires_on=expires_on,
+            )
+            db.session.commit()  # pylint: disable=consider-using-transaction
+        except (SQLAlchemyError, KeyValueCreateFailedError):
+            db.session.rollback()  # pylint: disable=consider-using-transaction
+            return []
+        for entry in entries:
+            self._cache_locally(entry.uuid, entry.value, expires_on)
+        return list(mapping)
+
     def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
         # pylint: disable=import-outside-toplevel
         from superset.daos.key_value import KeyValueDAO
 
+        uuid = self.get_key(key)
+        expires_on = self._get_expiry(timeout)
         try:
-            KeyValueDAO.delete_expired_entries(RESOURCE)
-            KeyValueDAO.create_entry(
+            if entry := KeyValueDAO.get_entry(RESOURCE, uuid):
+                if not entry.is_expired():
+                    return False
+                # the expired entries are pruned periodically, this one is replaced
+                db.session.delete(entry)
+                db.session.flush()
+            entry = KeyValueDAO.create_entry(
                 resource=RESOURCE,
                 value=value,
                 codec=self.codec,
-                key=self.get_key(key),
-                expires_on=self._get_expiry(timeout),
+                key=uuid,
+                expires_on=expires_on,
             )
             db.session.commit()  # pylint: disable=consider-using-transaction
+            self._cache_locally(uuid, entry.value, expires_on)
             return True
         except (SQLAlchemyError, KeyValueCreateFailedError):
             db.session.rollback()  # pylint: disable=consider-using-transaction
@@ -114,7 +199,39 @@ class SupersetMetastoreCache(BaseCache):
         # pylint: disable=import-outside-toplevel
         from superset.daos.key_value import KeyValueDAO
 
-        return KeyValueDAO.get_value(RESOURCE, self.get_key(key), self.codec)
+        uuid = self.get_key(key)
+        if (value := self._get_locally(uuid)) is not None:
+            return self.codec.decode(value)
+
+        entry = KeyValueDAO.get_entry(RESOURCE, uuid)
+        if not entry or entry.is_expired():
+            return None
+        self._cache_locally(uuid, entry.value, entry.expires_on)
+        return self.codec.decode(entry.value)
+
+    def get_many(self, *keys: str) -> list[Any]:
+        """
+        Get several values at once, the ones missing from the local cache in one
+        query.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.daos.key_value import KeyValueDAO
+
+        uuids = [self.get_key(key) for key in keys]
+        values: dict[UUID, bytes] = {}
+        for uuid in uuids:
+            if (value := self._get_locally(uuid)) is not None:
+                values[uuid] = value
+        for entry in KeyValueDAO.get_entries(
+            RESOURCE, [uuid for uuid in uuids if uuid not in values]
+        ):
+            if not entry.is_expired():
+                values[entry.uuid] = entry.value
+                self._cache_locally(entry.uuid, entry.value, entry.expires_on)
+        return [
+            self.codec.decode(values[uuid]) if uuid in values else None
+            for uuid in uuids
+        ]
 
     def has(self, key: str) -> bool:
         entry = self.get(key)
@@ -127,4 +244,19 @@ class SupersetMetastoreCache(BaseCache):
         # pylint: disable=import-outside-toplevel
         from superset.daos.key_value import KeyValueDAO
 
-        return KeyValueDAO.delete_entry(RESOURCE, self.get_key(key))
+        uuid = self.get_key(key)
+        self._uncache_locally([uuid])
+        return KeyValueDAO.delete_entry(RESOURCE, uuid)
+
+    @transaction()
+    def delete_many(self, *keys: str) -> list[Any]:
+        """
+        Delete several values at once, in one query.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.daos.key_value import KeyValueDAO
+
+        uuids = [self.get_key(key) for key in keys]
+        self._uncache_locally(uuids)
+        KeyValueDAO.delete_entries(RESOURCE, uuids)
+        return list(keys)
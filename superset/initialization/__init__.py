@@ -48,6 +48,7 @@ from superset.extensions import (
     manifest_processor,
     migrate,
     profiling,
+    request_profiler,
     results_backend_manager,
     ssh_manager_factory,
     stats_logger_manager,
@@ -695,6 +696,7 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
     def enable_profiling(self) -> None:
         if self.config["PROFILING"]:
             profiling.init_app(self.superset_app)
+        request_profiler.init_app(self.superset_app)
 
 
 class SupersetIndexView(IndexView):
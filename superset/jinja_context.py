@@ -27,7 +27,7 @@ from typing import Any, Callable, cast, Optional, TYPE_CHECKING, TypedDict, Unio
 import dateutil
 from flask import current_app, g, has_request_context, request
 from flask_babel import gettext as _
-from jinja2 import DebugUndefined, Environment
+from jinja2 import DebugUndefined, Environment, Template
 from jinja2.sandbox import SandboxedEnvironment
 from sqlalchemy.engine.interfaces import Dialect
 from sqlalchemy.sql.expression import bindparam
@@ -49,6 +49,8 @@ from superset.utils.core import (
     get_username,
     merge_extra_filters,
 )
+from superset.utils.jinja_cache import get_template, memoize_in_request
+from superset.utils.profiler import span
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import SqlaTable
@@ -129,6 +131,24 @@ class ExtraCache:
         self.database = database
         self.dialect = dialect
         self.table = table
+        self._form_data: Optional[dict[str, Any]] = None
+
+    def _get_form_data(self) -> dict[str, Any]:
+        """
+        Return the form data of the request, with its legacy and extra filters
+        merged into its adhoc filters.
+
+        The form data is parsed once, as templates usually look up many filters.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.views.utils import get_form_data
+
+        if self._form_data is None:
+            form_data, _ = get_form_data()
+            convert_legacy_filters_into_adhoc(form_data)
+            merge_extra_filters(form_data)
+            self._form_data = form_data
+        return self._form_data
 
     def current_user_id(self, add_to_cache_keys: bool = True) -> Optional[int]:
         """
@@ -341,13 +361,7 @@ class ExtraCache:
             only apply to the inner query
         :return: returns a list of filters
         """
-        # pylint: disable=import-outside-toplevel
-        from superset.views.utils import get_form_data
-
-        form_data, _ = get_form_data()
-        convert_legacy_filters_into_adhoc(form_data)
-        merge_extra_filters(form_data)
-
+        form_data = self._get_form_data()
         filters: list[Filter] = []
 
         for flt in form_data.get("adhoc_filters", []):
@@ -404,12 +418,7 @@ class ExtraCache:
             only apply to the inner query.
         :return: The corresponding time filter.
         """
-        # pylint: disable=import-outside-toplevel
-        from superset.views.utils import get_form_data
-
-        form_data, _ = get_form_data()
-        convert_legacy_filters_into_adhoc(form_data)
-        merge_extra_filters(form_data)
+        form_data = self._get_form_data()
         time_range = form_data.get("time_range")
         if column:
             flt: AdhocFilterClause | None = next(
@@ -590,6 +599,13 @@ class BaseTemplateProcessor:
         self._context.update(kwargs)
         self._context.update(context_addons())
 
+    def get_template(self, sql: str) -> Template:
+        """
+        Return the template of the SQL, compiled once per processor class (which
+        sets up its environment) and source.
+        """
+        return get_template(self.env, type(self), sql)
+
     def process_template(self, sql: str, **kwargs: Any) -> str:
         """Processes a sql template
 
@@ -597,11 +613,12 @@ class BaseTemplateProcessor:
         >>> process_template(sql)
         "SELECT '2017-01-01T00:00:00'"
         """
-        template = self.env.from_string(sql)
-        kwargs.update(self._context)
+        with span("jinja_render"):
+            template = self.get_template(sql)
+            kwargs.update(self._context)
 
-        context = validate_template_context(self.engine, kwargs)
-        return template.render(context)
+            context = validate_template_context(self.engine, kwargs)
+            return template.render(context)
 
 
 class JinjaTemplateProcessor(BaseTemplateProcessor):
@@ -749,7 +766,7 @@ class SparkTemplateProcessor(HiveTemplateProcessor):
     engine = "spark"
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
-        template = self.env.from_string(sql)
+        template = self.get_template(sql)
         kwargs.update(self._context)
 
         # Backwards compatibility if migrating from Hive.
@@ -762,7 +779,7 @@ class TrinoTemplateProcessor(PrestoTemplateProcessor):
     engine = "trino"
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
-        template = self.env.from_string(sql)
+        template = self.get_template(sql)
         kwargs.update(self._context)
 
         # Backwards compatibility if migrating from Presto.
@@ -822,6 +839,23 @@ def dataset_macro(
     views, and we take them to make those properties available to jinja templates in
     the underlying dataset.
     """
+    return _get_dataset_sql(
+        dataset_id,
+        include_metrics,
+        tuple(columns) if columns else None,
+        from_dttm,
+        to_dttm,
+    )
+
+
+@memoize_in_request
+def _get_dataset_sql(
+    dataset_id: int,
+    include_metrics: bool,
+    columns: Optional[tuple[str, ...]],
+    from_dttm: Optional[datetime],
+    to_dttm: Optional[datetime],
+) -> str:
     # pylint: disable=import-outside-toplevel
     from superset.daos.dataset import DatasetDAO
 
@@ -829,13 +863,13 @@ def dataset_macro(
     if not dataset:
         raise DatasetNotFoundError(f"Dataset {dataset_id} not found!")
 
-    columns = columns or [column.column_name for column in dataset.columns]
+    columns = columns or tuple(column.column_name for column in dataset.columns)
     metrics = [metric.metric_name for metric in dataset.metrics]
     query_obj = {
         "is_timeseries": False,
         "filter": [],
         "metrics": metrics if include_metrics else None,
-        "columns": columns,
+        "columns": list(columns),
         "from_dttm": from_dttm,
         "to_dttm": to_dttm,
     }
@@ -899,19 +933,10 @@ def metric_macro(metric_key: str, dataset_id: Optional[int] = None) -> str:
     :param dataset_id: the ID for the dataset the metric is associated with.
     :returns: the macro SQL syntax.
     """
-    # pylint: disable=import-outside-toplevel
-    from superset.daos.dataset import DatasetDAO
-
     if not dataset_id:
         dataset_id = get_dataset_id_from_context(metric_key)
 
-    dataset = DatasetDAO.find_by_id(dataset_id)
-    if not dataset:
-        raise DatasetNotFoundError(f"Dataset ID {dataset_id} not found.")
-    metrics: dict[str, str] = {
-        metric.metric_name: metric.expression for metric in dataset.metrics
-    }
-    dataset_name = dataset.table_name
+    dataset_name, metrics = _get_dataset_metrics(dataset_id)
     if metric := metrics.get(metric_key):
         return metric
     raise SupersetTemplateException(
@@ -921,3 +946,19 @@ def metric_macro(metric_key: str, dataset_id: Optional[int] = None) -> str:
             dataset_name=dataset_name,
         )
     )
+
+
+@memoize_in_request
+def _get_dataset_metrics(dataset_id: int) -> tuple[str, dict[str, str]]:
+    """
+    Return the name of a dataset and the expressions of its metrics by name.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.daos.dataset import DatasetDAO
+
+    dataset = DatasetDAO.find_by_id(dataset_id)
+    if not dataset:
+        raise DatasetNotFoundError(f"Dataset ID {dataset_id} not found.")
+    return dataset.table_name, {
+        metric.metric_name: metric.expression for metric in dataset.metrics
+    }
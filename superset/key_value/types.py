@@ -18,10 +18,13 @@ from __future__ import annotations
 
 import json
 import pickle
+import struct
 from abc import ABC, abstractmethod
 from typing import Any, TypedDict, Union
 from uuid import UUID
 
+import pandas as pd
+import pyarrow as pa
 from marshmallow import Schema, ValidationError
 
 from superset.key_value.exceptions import (
@@ -99,3 +102,110 @@ class MarshmallowKeyValueCodec(JsonKeyValueCodec):
             return self.schema.load(obj)
         except ValidationError as ex:
             raise KeyValueCodecEncodeException(message=str(ex)) from ex
+
+
+class ArrowKeyValueCodec(KeyValueCodec):
+    """
+    Codec of dicts holding DataFrames, as the query results of the data cache.
+
+    The DataFrames are serialized as compressed Arrow IPC streams, and the other
+    values as JSON. Values which wouldn't round trip exactly that way, like object
+    columns of Python ints or non-JSON values, are pickled instead, and pickled
+    values are decoded as well.
+    """
+
+    MAGIC = b"SUPERSET_ARROW1"
+
+    # types of object columns which are converted back to the same Python objects
+    EXACT_OBJECT_TYPES = (
+        pa.types.is_string,
+        pa.types.is_large_string,
+        pa.types.is_binary,
+        pa.types.is_large_binary,
+        pa.types.is_decimal,
+        pa.types.is_date,
+        pa.types.is_null,
+    )
+
+    def __init__(self, compression: str | None = "zstd"):
+        self.compression = compression
+
+    def encode(self, value: dict[Any, Any]) -> bytes:
+        frames = {
+            key: item for key, item in value.items() if isinstance(item, pd.DataFrame)
+        }
+        values = {key: item for key, item in value.items() if key not in frames}
+        try:
+            streams = {key: self._encode_df(df) for key, df in frames.items()}
+            header = json.dumps(
+                {
+                    "values": values,
+                    "frames": {key: len(stream) for key, stream in streams.items()},
+                }
+            )
+            if json.loads(header)["values"] != values:
+                raise ValueError("Values don't round trip through JSON")
+        except (pa.ArrowException, TypeError, ValueError):
+            return pickle.dumps(value)
+
+        header_bytes = header.encode("utf-8")
+        return b"".join(
+            [
+                self.MAGIC,
+                struct.pack("<I", len(header_bytes)),
+                header_bytes,
+                *streams.values(),
+            ]
+        )
+
+    def decode(self, value: bytes) -> dict[Any, Any]:
+        if not value.startswith(self.MAGIC):
+            try:
+                return pickle.loads(value)
+            # the errors `pickle.loads` may raise on corrupted or truncated data
+            except (
+                pickle.UnpicklingError,
+                AttributeError,
+                EOFError,
+                ImportError,
+                IndexError,
+                TypeError,
+                ValueError,
+            ) as ex:
+                raise KeyValueCodecDecodeException(str(ex)) from ex
+
+        try:
+            buffer = pa.py_buffer(value)
+            offset = len(self.MAGIC)
+            (size,) = struct.unpack_from("<I", value, offset)
+            offset += 4
+            header = json.loads(value[offset : offset + size])
+            offset += size
+            result = header["values"]
+            for key, length in header["frames"].items():
+                with pa.ipc.open_stream(buffer.slice(offset, length)) as reader:
+                    result[key] = reader.read_pandas()
+                offset += length
+        except (pa.ArrowException, KeyError, ValueError, struct.error) as ex:
+            raise KeyValueCodecDecodeException(str(ex)) from ex
+        return result
+
+    def _encode_df(self, df: pd.DataFrame) -> bytes:
+        if not isinstance(df.index, pd.RangeIndex) or not df.columns.is_unique:
+            raise ValueError("Only range indexes and unique columns are supported")
+
+        table = pa.Table.from_pandas(df)
+        for column, dtype in df.dtypes.items():
+            if not isinstance(column, str):
+                raise ValueError("Only DataFrames with string columns are supported")
+            type_ = table.schema.field(column).type
+            if pd.api.types.is_object_dtype(dtype) and not any(
+                is_type(type_) for is_type in self.EXACT_OBJECT_TYPES
+            ):
+                raise ValueError(f"Column {column} doesn't round trip")
+
+        sink = pa.BufferOutputStream()
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
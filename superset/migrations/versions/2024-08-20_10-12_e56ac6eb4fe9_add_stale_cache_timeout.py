@@ -0,0 +1,44 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""add stale_cache_timeout to slices and tables
+
+Revision ID: e56ac6eb4fe9
+Revises: 48cbb571fa3a
+Create Date: 2024-08-20 10:12:37.418624
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e56ac6eb4fe9"
+down_revision = "48cbb571fa3a"
+
+
+def upgrade():
+    for table_name in ("slices", "tables"):
+        op.add_column(
+            table_name,
+            sa.Column("stale_cache_timeout", sa.Integer(), nullable=True),
+        )
+
+
+def downgrade():
+    for table_name in ("slices", "tables"):
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.drop_column("stale_cache_timeout")
@@ -25,6 +25,7 @@ import builtins
 import logging
 import textwrap
 from ast import literal_eval
+from collections.abc import Iterator
 from contextlib import closing, contextmanager, nullcontext, suppress
 from copy import deepcopy
 from datetime import datetime
@@ -38,6 +39,7 @@ import sqlalchemy as sqla
 import sshtunnel
 from flask import g, request
 from flask_appbuilder import Model
+from flask_babel import gettext as __
 from sqlalchemy import (
     Boolean,
     Column,
@@ -65,6 +67,7 @@ from superset.commands.database.exceptions import DatabaseInvalidError
 from superset.constants import LRU_CACHE_MAX_SIZE, PASSWORD_MASK
 from superset.databases.utils import make_url_safe
 from superset.db_engine_specs.base import MetricType, TimeGrain
+from superset.exceptions import SupersetGenericDBErrorException
 from superset.extensions import (
     cache_manager,
     encrypted_field_factory,
@@ -80,6 +83,7 @@ from superset.utils import cache as cache_util, core as utils, json
 from superset.utils.backports import StrEnum
 from superset.utils.core import DatasourceName, get_username
 from superset.utils.oauth2 import get_oauth2_access_token, OAuth2ClientConfigSchema
+from superset.utils.profiler import span
 
 config = app.config
 custom_password_store = config["SQLALCHEMY_CUSTOM_PASSWORD_STORE"]
@@ -667,14 +671,22 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
             )
         return sql_
 
-    def get_df(  # pylint: disable=too-many-locals
+    @contextmanager
+    def _execute_sql(
         self,
         sql: str,
         catalog: str | None = None,
         schema: str | None = None,
-        mutator: Callable[[pd.DataFrame], None] | None = None,
-    ) -> pd.DataFrame:
+    ) -> Iterator[Any]:
+        """
+        Execute the statements of a SQL script, yielding the cursor holding the
+        results of the last statement.
+        """
         sqls = self.db_engine_spec.parse_sql(sql)
+        if not sqls:
+            raise SupersetGenericDBErrorException(
+                __("The SQL query has no statement to execute")
+            )
         with self.get_sqla_engine(catalog=catalog, schema=schema) as engine:
             engine_url = engine.url
 
@@ -690,7 +702,6 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 
         with self.get_raw_connection(catalog=catalog, schema=schema) as conn:
             cursor = conn.cursor()
-            df = None
             for i, sql_ in enumerate(sqls):
                 sql_ = self.mutate_sql_based_on_config(sql_, is_split=True)
                 _log_query(sql_)
@@ -699,21 +710,63 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                     database=self,
                     object_ref=__name__,
                 ):
-                    self.db_engine_spec.execute(cursor, sql_, self)
+                    with span("db_execute"):
+                        self.db_engine_spec.execute(cursor, sql_, self)
                     if i < len(sqls) - 1:
                         # If it's not the last, we don't keep the results
                         cursor.fetchall()
                     else:
-                        # Last query, fetch and process the results
-                        data = self.db_engine_spec.fetch_data(cursor)
-                        result_set = SupersetResultSet(
-                            data, cursor.description, self.db_engine_spec
-                        )
-                        df = result_set.to_pandas_df()
-            if mutator:
-                df = mutator(df)
-
-            return self.post_process_df(df)
+                        # Last query, the results are processed by the caller
+                        yield cursor
+
+    def get_df(
+        self,
+        sql: str,
+        catalog: str | None = None,
+        schema: str | None = None,
+        mutator: Callable[[pd.DataFrame], None] | None = None,
+    ) -> pd.DataFrame:
+        with self._execute_sql(sql, catalog, schema) as cursor:
+            with span("fetch"):
+                data = self.db_engine_spec.fetch_data(cursor)
+            with span("result_set"):
+                result_set = SupersetResultSet(
+                    data, cursor.description, self.db_engine_spec
+                )
+                df = result_set.to_pandas_df()
+        if mutator:
+            df = mutator(df)
+
+        return self.post_process_df(df)
+
+    def iter_df(
+        self,
+        sql: str,
+        catalog: str | None = None,
+        schema: str | None = None,
+        chunk_size: int = 10000,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Run a SQL script and yield the results of the last statement in DataFrames
+        of at most `chunk_size` rows, fetching them from the cursor as they are
+        consumed.
+
+        At least one (possibly empty) DataFrame is always yielded.
+        """
+        with self._execute_sql(sql, catalog, schema) as cursor:
+            is_empty = True
+            for data in self.db_engine_spec.fetch_data_chunks(cursor, chunk_size):
+                is_empty = False
+                result_set = SupersetResultSet(
+                    data, cursor.description, self.db_engine_spec
+                )
+                yield self.post_process_df(result_set.to_pandas_df())
+
+            if is_empty:
+                result_set = SupersetResultSet(
+                    [], cursor.description, self.db_engine_spec
+                )
+                yield self.post_process_df(result_set.to_pandas_df())
 
     def compile_sqla_query(
         self,
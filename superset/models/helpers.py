@@ -94,6 +94,7 @@ from superset.utils.core import (
     remove_duplicates,
 )
 from superset.utils.dates import datetime_to_epoch
+from superset.utils.profiler import span
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import SqlMetric, TableColumn
@@ -876,12 +877,13 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         query_obj: QueryObjectDict,
         mutate: bool = True,
     ) -> QueryStringExtended:
-        sqlaq = self.get_sqla_query(**query_obj)
-        sql = self.database.compile_sqla_query(sqlaq.sqla_query)
-        sql = self._apply_cte(sql, sqlaq.cte)
+        with span("sql_generation"):
+            sqlaq = self.get_sqla_query(**query_obj)
+            sql = self.database.compile_sqla_query(sqlaq.sqla_query)
+            sql = self._apply_cte(sql, sqlaq.cte)
 
-        if mutate:
-            sql = self.database.mutate_sql_based_on_config(sql)
+            if mutate:
+                sql = self.database.mutate_sql_based_on_config(sql)
         return QueryStringExtended(
             applied_template_filters=sqlaq.applied_template_filters,
             applied_filter_columns=sqlaq.applied_filter_columns,
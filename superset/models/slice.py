@@ -81,6 +81,7 @@ class Slice(  # pylint: disable=too-many-public-methods
     query_context = Column(utils.MediumText())
     description = Column(Text)
     cache_timeout = Column(Integer)
+    stale_cache_timeout = Column(Integer)
     perm = Column(String(1000))
     schema_perm = Column(String(1000))
     catalog_perm = Column(String(1000), nullable=True, default=None)
@@ -132,6 +133,7 @@ class Slice(  # pylint: disable=too-many-public-methods
         "params",
         "query_context",
         "cache_timeout",
+        "stale_cache_timeout",
     ]
     export_parent = "table"
     extra_import_fields = ["is_managed_externally", "external_url"]
@@ -160,6 +162,7 @@ class Slice(  # pylint: disable=too-many-public-methods
             params=self.params,
             description=self.description,
             cache_timeout=self.cache_timeout,
+            stale_cache_timeout=self.stale_cache_timeout,
         )
 
     # pylint: disable=using-constant-test
@@ -228,6 +231,7 @@ class Slice(  # pylint: disable=too-many-public-methods
             data["error"] = str(ex)
         return {
             "cache_timeout": self.cache_timeout,
+            "stale_cache_timeout": self.stale_cache_timeout,
             "changed_on": self.changed_on.isoformat(),
             "changed_on_humanized": self.changed_on_humanized,
             "datasource": self.datasource_name,
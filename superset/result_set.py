@@ -18,7 +18,9 @@
 
 import datetime
 import logging
-from typing import Any, Optional
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from typing import Any, Callable, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -26,12 +28,15 @@ import pyarrow as pa
 from numpy.typing import NDArray
 
 from superset.db_engine_specs import BaseEngineSpec
+from superset.db_engine_specs.base import ColumnarRows
 from superset.superset_typing import DbapiDescription, DbapiResult, ResultSetColumnType
 from superset.utils import core as utils, json
 from superset.utils.core import GenericDataType
 
 logger = logging.getLogger(__name__)
 
+ColumnValues = Union[Sequence[Any], NDArray[Any]]
+
 
 def dedup(l: list[str], suffix: str = "__", case_sensitive: bool = True) -> list[str]:  # noqa: E741
     """De-duplicates a list of string by suffixing a counter
@@ -59,29 +64,86 @@ def dedup(l: list[str], suffix: str = "__", case_sensitive: bool = True) -> list
     return new_l
 
 
+_str = np.frompyfunc(str, 1, 1)
+
+
 def stringify(obj: Any) -> str:
     return json.dumps(obj, default=json.json_iso_dttm_ser)
 
 
+@lru_cache(maxsize=1024)
+def _get_stringify_kind(type_: type) -> str:
+    """
+    Return how values of a type are stringified:
+
+    - "str": numpy casts them to string the same way as `str`, so they can be
+      converted as a whole
+    - "json": sequences (e.g. arrays returned by Presto/Trino), which numpy can't
+      cast and are serialized to JSON
+    - "cell": anything else (e.g. bytes, which numpy decodes), converted one at a
+      time as numpy does
+    """
+    if issubclass(type_, (str, dict)):
+        return "str"
+    if issubclass(type_, (list, tuple, np.ndarray)):
+        return "json"
+    if issubclass(type_, bytes) or (
+        hasattr(type_, "__getitem__") and hasattr(type_, "__len__")
+    ):
+        return "cell"
+    return "str"
+
+
+def _stringify_cell(value: Any) -> str:
+    obj = np.empty((), dtype=object)
+    obj[()] = value
+    try:
+        # for simple string conversions
+        # this handles odd character types better
+        return obj.astype(str).item()
+    except ValueError:
+        return stringify(obj)
+
+
 def stringify_values(array: NDArray[Any]) -> NDArray[Any]:
     result = np.copy(array)
 
-    with np.nditer(result, flags=["refs_ok"], op_flags=[["readwrite"]]) as it:
-        for obj in it:
-            if na_obj := pd.isna(obj):
-                # pandas <NA> type cannot be converted to string
-                obj[na_obj] = None
-            else:
-                try:
-                    # for simple string conversions
-                    # this handles odd character types better
-                    obj[...] = obj.astype(str)
-                except ValueError:
-                    obj[...] = stringify(obj)
-
+    # pandas <NA> type cannot be converted to string
+    na_mask = np.asarray(pd.isna(result), dtype=bool)
+    result[na_mask] = None
+
+    (indices,) = np.nonzero(~na_mask)
+    values = result[indices]
+    kinds = {type_: _get_stringify_kind(type_) for type_ in set(map(type, values))}
+    if any(kind != "str" for kind in kinds.values()):
+        value_kinds = np.array([kinds[type(value)] for value in values])
+        for kind, func in (("json", stringify), ("cell", _stringify_cell)):
+            mask = value_kinds == kind
+            if mask.any():
+                result[indices[mask]] = np.array(
+                    [func(value) for value in values[mask]],
+                    dtype=object,
+                )
+        mask = value_kinds == "str"
+        indices, values = indices[mask], values[mask]
+
+    result[indices] = _str(values)
     return result
 
 
+def _to_list(values: ColumnValues) -> list[Any]:
+    if isinstance(values, np.ndarray):
+        return values.tolist()
+    return list(values)
+
+
+def _to_object_array(values: ColumnValues) -> NDArray[Any]:
+    if isinstance(values, np.ndarray):
+        return values
+    # unlike `np.array`, this never treats sequences as nested dimensions
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
 def destringify(obj: str) -> Any:
     return json.loads(obj)
 
@@ -99,6 +161,56 @@ def convert_to_string(value: Any) -> str:
     return str(value)
 
 
+def concat_tables(tables: list[pa.Table]) -> pa.Table:
+    """
+    Concatenate the Arrow tables converted from the chunks of the rows of a query.
+
+    The type of a column is inferred from the values in each chunk, so it may
+    differ between chunks: a column with only nulls in a chunk, or integers in a
+    chunk and floats in another. Those types are promoted to a common type when
+    possible, and the column is converted to strings otherwise, as is done when
+    the values of a column have incompatible types.
+    """
+    if len(tables) == 1:
+        return tables[0]
+
+    fields = []
+    for i, name in enumerate(tables[0].column_names):
+        chunk_fields = [table.schema.field(i) for table in tables]
+        try:
+            fields.append(
+                pa.unify_schemas(
+                    [pa.schema([field]) for field in chunk_fields],
+                    promote_options="permissive",
+                ).field(0)
+            )
+        except (pa.lib.ArrowInvalid, pa.lib.ArrowTypeError):
+            fields.append(pa.field(name, pa.string()))
+
+    schema = pa.schema(fields)
+    return pa.concat_tables(
+        [
+            pa.Table.from_arrays(
+                [
+                    _cast_column(column, field.type)
+                    for column, field in zip(table.columns, schema)
+                ],
+                schema=schema,
+            )
+            for table in tables
+        ]
+    )
+
+
+def _cast_column(column: pa.ChunkedArray, type_: pa.DataType) -> pa.ChunkedArray:
+    if column.type == type_:
+        return column
+    if pa.types.is_string(type_):
+        values = stringify_values(_to_object_array(column.to_pylist()))
+        return pa.chunked_array([pa.array(values.tolist(), type=type_)])
+    return column.cast(type_)
+
+
 class SupersetResultSet:
     def __init__(  # pylint: disable=too-many-locals
         self,
@@ -129,45 +241,28 @@ class SupersetResultSet:
             # generate numpy structured array dtype
             numpy_dtype = [(column_name, "object") for column_name in column_names]
 
-        # only do expensive recasting if datatype is not standard list of tuples
-        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
-            data = [tuple(row) for row in data]
-        array = np.array(data, dtype=numpy_dtype)
-        if array.size > 0:
-            for column in column_names:
-                try:
-                    pa_data.append(pa.array(array[column].tolist()))
-                except (
-                    pa.lib.ArrowInvalid,
-                    pa.lib.ArrowTypeError,
-                    pa.lib.ArrowNotImplementedError,
-                    ValueError,
-                    TypeError,  # this is super hackey,
-                    # https://issues.apache.org/jira/browse/ARROW-7855
-                ):
-                    # attempt serialization of values as strings
-                    stringified_arr = stringify_values(array[column])
-                    pa_data.append(pa.array(stringified_arr.tolist()))
+        columns = self._get_columns(data, column_names, numpy_dtype)
+        pa_data = [self._to_pa_array(values) for values in columns]
 
         if pa_data:  # pylint: disable=too-many-nested-blocks
-            for i, column in enumerate(column_names):
+            for i, values in enumerate(columns):
                 if pa.types.is_nested(pa_data[i].type):
                     # TODO: revisit nested column serialization once nested types
                     #  are added as a natively supported column type in Superset
                     #  (superset.utils.core.GenericDataType).
-                    stringified_arr = stringify_values(array[column])
+                    stringified_arr = stringify_values(_to_object_array(values))
                     pa_data[i] = pa.array(stringified_arr.tolist())
 
                 elif pa.types.is_temporal(pa_data[i].type):
                     # workaround for bug converting
                     # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
                     # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(array[column])
+                    sample = self.first_nonempty(values)
                     if sample and isinstance(sample, datetime.datetime):
                         try:
                             if sample.tzinfo:
                                 tz = sample.tzinfo
-                                series = pd.Series(array[column])
+                                series = pd.Series(_to_object_array(values))
                                 series = pd.to_datetime(series)
                                 pa_data[i] = pa.Array.from_pandas(
                                     series,
@@ -191,6 +286,80 @@ class SupersetResultSet:
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
 
+    @staticmethod
+    def _get_columns(
+        data: DbapiResult,
+        column_names: list[str],
+        numpy_dtype: list[tuple[str, ...]],
+    ) -> Sequence[ColumnValues]:
+        """
+        Return the values of each column of the rows, if any.
+        """
+        if isinstance(data, ColumnarRows):
+            # the engine spec already fetched the rows as columns
+            return data.columns if len(data) > 0 else []
+
+        # only do expensive recasting if datatype is not standard list of tuples
+        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
+            data = [tuple(row) for row in data]
+        array = np.array(data, dtype=numpy_dtype)
+        if array.size == 0:
+            return []
+        return [array[column] for column in column_names]
+
+    @staticmethod
+    def _to_pa_array(values: ColumnValues) -> pa.Array:
+        """
+        Convert the values of a column to Arrow, as strings if their type isn't
+        supported.
+        """
+        try:
+            return pa.array(_to_list(values))
+        except (
+            pa.lib.ArrowInvalid,
+            pa.lib.ArrowTypeError,
+            pa.lib.ArrowNotImplementedError,
+            ValueError,
+            TypeError,  # this is super hackey,
+            # https://issues.apache.org/jira/browse/ARROW-7855
+        ):
+            # attempt serialization of values as strings
+            stringified_arr = stringify_values(_to_object_array(values))
+            return pa.array(stringified_arr.tolist())
+
+    @classmethod
+    def from_chunks(
+        cls,
+        chunks: Iterable[DbapiResult],
+        cursor_description: DbapiDescription,
+        db_engine_spec: type[BaseEngineSpec],
+        callback: Optional[Callable[[pa.Table], None]] = None,
+    ) -> "SupersetResultSet":
+        """
+        Build a result set from the rows of a query fetched in chunks.
+
+        Each chunk is converted to Arrow as soon as it's fetched, so only one chunk
+        of rows is held in memory at a time. The types inferred for each chunk are
+        then reconciled, see `concat_tables`.
+
+        :param callback: Called with the Arrow table of each chunk once converted;
+            raising an exception stops fetching the rows
+        """
+        result_set: Optional["SupersetResultSet"] = None
+        tables: list[pa.Table] = []
+        for chunk in chunks:
+            chunk_result_set = cls(chunk, cursor_description, db_engine_spec)
+            result_set = result_set or chunk_result_set
+            tables.append(chunk_result_set.table)
+            if callback:
+                callback(chunk_result_set.table)
+
+        if result_set is None:
+            return cls([], cursor_description, db_engine_spec)
+
+        result_set.table = concat_tables(tables)
+        return result_set
+
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
         if pa.types.is_boolean(pa_dtype):
@@ -213,7 +382,7 @@ class SupersetResultSet:
             return table.to_pandas(integer_object_nulls=True, timestamp_as_object=True)
 
     @staticmethod
-    def first_nonempty(items: NDArray[Any]) -> Any:
+    def first_nonempty(items: ColumnValues) -> Any:
         return next((i for i in items if i), None)
 
     def is_temporal(self, db_type_str: Optional[str]) -> bool:
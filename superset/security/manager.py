@@ -20,15 +20,17 @@
 import logging
 import re
 import time
-from collections import defaultdict
+from collections import Counter, defaultdict
+from itertools import chain
 from typing import Any, Callable, cast, NamedTuple, Optional, TYPE_CHECKING
+from uuid import uuid4
 
-from flask import current_app, Flask, g, Request
+import flask
+from flask import current_app, Flask, g, has_app_context, Request
 from flask_appbuilder import Model
 from flask_appbuilder.security.sqla.manager import SecurityManager
 from flask_appbuilder.security.sqla.models import (
     assoc_permissionview_role,
-    assoc_user_role,
     Permission,
     PermissionView,
     Role,
@@ -48,7 +50,7 @@ from flask_login import AnonymousUserMixin, LoginManager
 from jwt.api_jwt import _jwt_global_obj
 from sqlalchemy import and_, inspect, or_
 from sqlalchemy.engine.base import Connection
-from sqlalchemy.orm import eagerload
+from sqlalchemy.orm import eagerload, object_session, Session
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.orm.query import Query as SqlaQuery
 
@@ -69,6 +71,7 @@ from superset.security.guest_token import (
 from superset.sql_parse import extract_tables_from_jinja_sql, Table
 from superset.tasks.utils import get_current_user
 from superset.utils import json
+from superset.utils.backports import StrEnum
 from superset.utils.core import (
     DatasourceName,
     DatasourceType,
@@ -76,9 +79,12 @@ from superset.utils.core import (
     RowLevelSecurityFilterType,
 )
 from superset.utils.filters import get_dataset_access_filters
+from superset.utils.lru import LRUCache
 from superset.utils.urls import get_url_host
 
 if TYPE_CHECKING:
+    from flask_caching import Cache
+
     from superset.common.query_context import QueryContext
     from superset.connectors.sqla.models import (
         BaseDatasource,
@@ -95,6 +101,20 @@ logger = logging.getLogger(__name__)
 
 DATABASE_PERM_REGEX = re.compile(r"^\[.+\]\.\(id\:(?P<id>\d+)\)$")
 
+RLS_FILTERS_VERSION_KEY = "superset_rls_filters_version"
+RLS_FILTERS_CHANGED_KEY = "rls_filters_changed"
+
+# attribute of `g` holding the permissions loaded by the current request
+PERMISSIONS_SNAPSHOTS_KEY = "_permissions_snapshots"
+# attribute of `g` counting the checks of each permission by the current request
+PERMISSION_CHECKS_KEY = "_permission_checks"
+# number of checks of a permission by a request after which the view menus it's
+# granted on are loaded, rather than the permissions on each checked view menu
+PERMISSION_CHECKS_BEFORE_INDEX = 3
+# number of view menus and permissions whose grants are cached in each worker, by set
+# of roles
+PERMISSIONS_CACHE_SIZE = 10000
+
 
 class DatabaseCatalogSchema(NamedTuple):
     database: str
@@ -102,6 +122,16 @@ class DatabaseCatalogSchema(NamedTuple):
     schema: str
 
 
+class PermissionsIndex(StrEnum):
+    """
+    How the permissions of roles are looked up: the permissions on a view menu, or
+    the view menus of a permission.
+    """
+
+    PERMISSIONS = "permissions"
+    VIEW_MENUS = "view_menus"
+
+
 class SupersetSecurityListWidget(ListWidget):  # pylint: disable=too-few-public-methods
     """
     Redeclaring to avoid circular imports
@@ -213,6 +243,15 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
     SecurityManager
 ):
     userstatschartview = None
+    _rls_filters_cache: Optional[
+        LRUCache[tuple[str, tuple[int, ...], int], list[Any]]
+    ] = None
+    _permissions_cache: Optional[
+        LRUCache[
+            tuple[Optional[tuple[int, ...]], PermissionsIndex, str],
+            tuple[float, frozenset[str]],
+        ]
+    ] = None
     READ_ONLY_MODEL_VIEWS = {"Database", "DynamicPlugin"}
 
     USER_MODEL_VIEWS = {
@@ -439,6 +478,187 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             return self.is_item_public(permission_name, view_name)
         return self._has_view_access(user, permission_name, view_name)
 
+    def _has_view_access(
+        self,
+        user: User,
+        permission_name: str,
+        view_name: str,
+    ) -> bool:
+        # builtin (statically configured) roles aren't stored in the database
+        for role in user.roles:
+            if role.name in self.builtin_roles and self._has_access_builtin_roles(
+                role, permission_name, view_name
+            ):
+                return True
+        return self._has_role_permission(user, permission_name, view_name)
+
+    def is_item_public(self, permission_name: str, view_name: str) -> bool:
+        """
+        Return True if the public role can access the FAB permission/view, False
+        otherwise.
+
+        :param permission_name: The FAB permission name
+        :param view_name: The FAB view-menu name
+        :returns: Whether the public role can access the FAB permission/view
+        """
+
+        return self._has_role_permission(
+            AnonymousUserMixin(),
+            permission_name,
+            view_name,
+        )
+
+    def _has_role_permission(
+        self,
+        user: User,
+        permission_name: str,
+        view_name: str,
+    ) -> bool:
+        """
+        Return True if the roles of the user, or the public role for anonymous users,
+        grant the permission on the view menu.
+
+        The permissions on the view menu are loaded, unless the request already
+        loaded the view menus of the permission (e.g. `user_view_menu_names`) or
+        checks the permission on many view menus, e.g. the access to each dataset
+        of a list, in which case they're loaded instead.
+        """
+        checks = flask.g.setdefault(PERMISSION_CHECKS_KEY, Counter())
+        checks[permission_name] += 1
+        if (
+            view_menus := self._get_role_permissions(
+                user,
+                PermissionsIndex.VIEW_MENUS,
+                permission_name,
+                load=checks[permission_name] > PERMISSION_CHECKS_BEFORE_INDEX,
+            )
+        ) is not None:
+            return view_name in view_menus
+
+        permissions = self._get_role_permissions(
+            user,
+            PermissionsIndex.PERMISSIONS,
+            view_name,
+        )
+        return permission_name in cast(frozenset[str], permissions)
+
+    def _get_role_permissions(
+        self,
+        user: User,
+        index: PermissionsIndex,
+        name: str,
+        load: bool = True,
+    ) -> Optional[frozenset[str]]:
+        """
+        Return the names of the permissions granted on a view menu, or of the view
+        menus a permission is granted on, to the roles of the user or to the public
+        role for anonymous users.
+
+        They're loaded once per request, set of roles and name, so that permission
+        checks are set lookups without loading permissions the request doesn't
+        check. When `PERMISSIONS_CACHE_TTL` is set they're also cached in each worker
+        for that many seconds. They are discarded whenever roles, users or
+        permissions are flushed by the worker.
+
+        :param user: The user
+        :param index: Whether `name` is a view menu or a permission
+        :param name: The name of the view menu or permission
+        :param load: Whether to load the names if the request didn't already
+        :returns: The names of the permissions or view menus
+        """
+        role_ids = (
+            None if user.is_anonymous else tuple(sorted(role.id for role in user.roles))
+        )
+        key = (role_ids, index, name)
+        # the real `g`, which tests patch in this module to set the user
+        snapshots = flask.g.setdefault(PERMISSIONS_SNAPSHOTS_KEY, {})
+        if (names := snapshots.get(key)) is None and load:
+            names = snapshots[key] = self._get_cached_role_permissions(key)
+        return names
+
+    def _get_cached_role_permissions(
+        self,
+        key: tuple[Optional[tuple[int, ...]], PermissionsIndex, str],
+    ) -> frozenset[str]:
+        """
+        Return the permissions or view menus of the roles, from the per-process cache
+        if it's enabled.
+        """
+        if not (ttl := current_app.config["PERMISSIONS_CACHE_TTL"]):
+            return self._load_role_permissions(*key)
+
+        if self._permissions_cache is None:
+            self._permissions_cache = LRUCache(maxsize=PERMISSIONS_CACHE_SIZE)
+        now = time.monotonic()
+        if (cached := self._permissions_cache.get(key)) and cached[0] > now:
+            return cached[1]
+
+        names = self._load_role_permissions(*key)
+        self._permissions_cache.set(key, (now + ttl, names))
+        return names
+
+    def _load_role_permissions(
+        self,
+        role_ids: Optional[tuple[int, ...]],
+        index: PermissionsIndex,
+        name: str,
+    ) -> frozenset[str]:
+        if role_ids is None:
+            public_role = self.get_public_role()
+            role_ids = (public_role.id,) if public_role else ()
+
+        if index == PermissionsIndex.PERMISSIONS:
+            selected, filtered = self.permission_model.name, self.viewmenu_model.name
+        else:
+            selected, filtered = self.viewmenu_model.name, self.permission_model.name
+
+        return frozenset(
+            selected_name
+            for (selected_name,) in (
+                self.get_session.query(selected)
+                .select_from(self.permissionview_model)
+                .join(self.permission_model)
+                .join(self.viewmenu_model)
+                .join(assoc_permissionview_role)
+                .filter(assoc_permissionview_role.c.role_id.in_(role_ids))
+                .filter(filtered == name)
+                .distinct()
+            )
+        )
+
+    def permissions_after_flush(  # pylint: disable=unused-argument
+        self,
+        session: Session,  # pylint: disable=disallowed-name
+        flush_context: Any,
+    ) -> None:
+        """
+        Discards the permissions loaded by the request when roles, users or
+        permissions are written, so that the following checks see the changes.
+        Triggered by SQLAlchemy after_flush events.
+
+        :param session: The SQLA session
+        :param flush_context: The SQLA flush context
+        """
+        has_snapshots = has_app_context() and PERMISSIONS_SNAPSHOTS_KEY in flask.g
+        if not (has_snapshots or self._permissions_cache):
+            return
+
+        models = (
+            self.role_model,
+            self.user_model,
+            self.permission_model,
+            self.viewmenu_model,
+            self.permissionview_model,
+        )
+        if any(
+            isinstance(instance, models)
+            for instance in chain(session.new, session.dirty, session.deleted)
+        ):
+            if has_snapshots:
+                flask.g.pop(PERMISSIONS_SNAPSHOTS_KEY)
+            if self._permissions_cache is not None:
+                self._permissions_cache.clear()
+
     def can_access_all_queries(self) -> bool:
         """
         Return True if the user can access all SQL Lab queries, False otherwise.
@@ -723,34 +943,20 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         return True
 
     def user_view_menu_names(self, permission_name: str) -> set[str]:
-        base_query = (
-            self.get_session.query(self.viewmenu_model.name)
-            .join(self.permissionview_model)
-            .join(self.permission_model)
-            .join(assoc_permissionview_role)
-            .join(self.role_model)
-        )
-
-        if not g.user.is_anonymous:
-            # filter by user id
-            view_menu_names = (
-                base_query.join(assoc_user_role)
-                .join(self.user_model)
-                .filter(self.user_model.id == get_user_id())
-                .filter(self.permission_model.name == permission_name)
-            ).all()
-            return {s.name for s in view_menu_names}
-
-        # Properly treat anonymous user
-        if public_role := self.get_public_role():
-            # filter by public role
-            view_menu_names = (
-                base_query.filter(self.role_model.id == public_role.id).filter(
-                    self.permission_model.name == permission_name
-                )
-            ).all()
-            return {s.name for s in view_menu_names}
-        return set()
+        if not g.user.is_anonymous and get_user_id() is None:
+            # guest users aren't stored in the database
+            return set()
+
+        return set(
+            cast(
+                frozenset[str],
+                self._get_role_permissions(
+                    g.user,
+                    PermissionsIndex.VIEW_MENUS,
+                    permission_name,
+                ),
+            )
+        )
 
     def get_accessible_databases(self) -> list[int]:
         """
@@ -2455,6 +2661,29 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         if not (hasattr(g, "user") and g.user is not None):
             return []
 
+        user_roles = sorted(role.id for role in self.get_user_roles(g.user))
+        cache = self._get_rls_filters_cache()
+        if (
+            cache is None
+            # filters written in the current transaction aren't committed yet
+            or self.get_session.info.get(RLS_FILTERS_CHANGED_KEY)
+            or (version := self._get_rls_filters_version()) is None
+        ):
+            return self._get_rls_filters(user_roles, table.id)
+
+        stats_logger = current_app.config["STATS_LOGGER"]
+        key = (version, tuple(user_roles), table.id)
+        if (filters := cache.get(key)) is None:
+            stats_logger.incr("rls_filters.cache_miss")
+            filters = self._get_rls_filters(user_roles, table.id)
+            cache.set(key, filters)
+        else:
+            stats_logger.incr("rls_filters.cache_hit")
+
+        # callers may sort the filters in place
+        return list(filters)
+
+    def _get_rls_filters(self, user_roles: list[int], table_id: int) -> list[Any]:
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
             RLSFilterRoles,
@@ -2462,7 +2691,6 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             RowLevelSecurityFilter,
         )
 
-        user_roles = [role.id for role in self.get_user_roles(g.user)]
         regular_filter_roles = (
             self.get_session.query(RLSFilterRoles.c.rls_filter_id)
             .join(RowLevelSecurityFilter)
@@ -2480,7 +2708,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             .filter(RLSFilterRoles.c.role_id.in_(user_roles))
         )
         filter_tables = self.get_session.query(RLSFilterTables.c.rls_filter_id).filter(
-            RLSFilterTables.c.table_id == table.id
+            RLSFilterTables.c.table_id == table_id
         )
         query = (
             self.get_session.query(
@@ -2506,6 +2734,100 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         )
         return query.all()
 
+    def _get_rls_filters_cache(
+        self,
+    ) -> Optional[LRUCache[tuple[str, tuple[int, ...], int], list[Any]]]:
+        """
+        Return the per-process cache of the row level security filters, by version,
+        roles and table, or None if it's disabled.
+        """
+        if not (size := current_app.config["RLS_FILTERS_CACHE_SIZE"]):
+            return None
+        if self._rls_filters_cache is None:
+            self._rls_filters_cache = LRUCache(maxsize=size)
+        return self._rls_filters_cache
+
+    @staticmethod
+    def _get_rls_filters_version_cache() -> Optional["Cache"]:
+        """
+        Return the cache storing the version of the row level security filters, or
+        None if it isn't shared by all the workers: a version kept in a per-process
+        cache (e.g. `SimpleCache`) wouldn't be bumped by the filters written in the
+        other workers.
+
+        The metastore cache isn't used either, as the version is bumped once the
+        session is committed, where the cache can't commit its own write.
+        """
+        # pylint: disable=import-outside-toplevel
+        from cachelib import MemcachedCache, RedisCache
+
+        from superset.extensions import cache_manager
+
+        cache = cache_manager.cache
+        backend = getattr(cache, "cache", cache)
+        if not isinstance(backend, (MemcachedCache, RedisCache)):
+            return None
+        return cache
+
+    def _get_rls_filters_version(self) -> Optional[str]:
+        """
+        Return the version of the row level security filters, shared by all the
+        workers through the cache, or None if the cache isn't shared by them.
+        """
+        if (cache := self._get_rls_filters_version_cache()) is None:
+            return None
+        if (version := cache.get(RLS_FILTERS_VERSION_KEY)) is None:
+            cache.add(RLS_FILTERS_VERSION_KEY, uuid4().hex)
+            version = cache.get(RLS_FILTERS_VERSION_KEY)
+        return version
+
+    def bump_rls_filters_version(self) -> None:
+        """
+        Invalidate the row level security filters cached by all the workers.
+        """
+        if (cache := self._get_rls_filters_version_cache()) is not None:
+            cache.set(RLS_FILTERS_VERSION_KEY, uuid4().hex)
+
+    def rls_filters_after_change(  # pylint: disable=unused-argument
+        self,
+        mapper: Mapper,
+        connection: Connection,
+        target: Model,
+    ) -> None:
+        """
+        Flags the session in which row level security filters are written, so that
+        the cached filters are invalidated once it's committed.
+        Triggered by SQLAlchemy after_insert, after_update and after_delete events
+        of filters, and after_delete events of the roles and tables they apply to.
+
+        :param mapper: The SQLA mapper
+        :param connection: The SQLA connection
+        :param target: The changed filter, role or table
+        """
+        if session := object_session(target):  # pylint: disable=disallowed-name
+            session.info[RLS_FILTERS_CHANGED_KEY] = True
+
+    def rls_filters_after_commit(
+        self,
+        session: Session,  # pylint: disable=disallowed-name
+    ) -> None:
+        """
+        Invalidates the cached row level security filters when the committed
+        session wrote some.
+        Triggered by SQLAlchemy after_commit events.
+        """
+        if session.info.pop(RLS_FILTERS_CHANGED_KEY, False):
+            self.bump_rls_filters_version()
+
+    @staticmethod
+    def rls_filters_after_rollback(
+        session: Session,  # pylint: disable=disallowed-name
+    ) -> None:
+        """
+        Triggered by SQLAlchemy after_rollback events.
+        """
+        session.info.pop(RLS_FILTERS_CHANGED_KEY, None)
+
     def get_rls_sorted(self, table: "BaseDatasource") -> list["RowLevelSecurityFilter"]:
         """
         Retrieves a list RLS filters sorted by ID for
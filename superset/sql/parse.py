@@ -28,15 +28,26 @@ from typing import Any, Generic, TypeVar
 import sqlglot
 import sqlparse
 from deprecation import deprecated
+from flask import current_app, has_app_context
 from sqlglot import exp
 from sqlglot.dialects.dialect import Dialect, Dialects
 from sqlglot.errors import ParseError
 from sqlglot.optimizer.scope import Scope, ScopeType, traverse_scope
 
 from superset.exceptions import SupersetParseError
+from superset.utils.lru import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# the same SQL is parsed many times per request (table extraction, mutation checks,
+# access checks...), so the statements parsed by sqlglot are kept in a per-process
+# LRU, by script and engine
+PARSE_CACHE_SIZE = 1000
+
+_parse_cache: LRUCache[tuple[str, str], tuple[exp.Expression, ...]] = LRUCache(
+    maxsize=PARSE_CACHE_SIZE
+)
+
 
 # mapping between DB engine specs and sqlglot dialects
 SQLGLOT_DIALECTS = {
@@ -250,7 +261,24 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
     def _parse(cls, script: str, engine: str) -> list[exp.Expression]:
         """
         Parse helper.
+
+        The statements are parsed once per script and engine; since callers may
+        modify them, copies of the cached statements are returned.
         """
+        key = (script, engine)
+        if (statements := _parse_cache.get(key)) is None:
+            _log_parse_cache("miss")
+            statements = tuple(cls._parse_uncached(script, engine))
+            _parse_cache.set(key, statements)
+        else:
+            _log_parse_cache("hit")
+
+        return [
+            statement.copy() if statement else statement for statement in statements
+        ]
+
+    @classmethod
+    def _parse_uncached(cls, script: str, engine: str) -> list[exp.Expression]:
         dialect = SQLGLOT_DIALECTS.get(engine)
         try:
             return sqlglot.parse(script, dialect=dialect)
@@ -431,6 +459,16 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         }
 
 
+def _log_parse_cache(result: str) -> None:
+    """
+    Count the hits and misses of the parse cache in the stats logger.
+
+    Parsing doesn't require an app context, outside of one nothing is counted.
+    """
+    if has_app_context():
+        current_app.config["STATS_LOGGER"].incr(f"sql_parse.cache_{result}")
+
+
 class KQLSplitState(enum.Enum):
     """
     State machine for splitting a KQL script.
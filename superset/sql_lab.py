@@ -22,10 +22,11 @@ import uuid
 from contextlib import closing
 from datetime import datetime
 from sys import getsizeof
-from typing import Any, cast, Optional, Union
+from typing import Any, Callable, cast, Optional, Union
 
 import backoff
 import msgpack
+import pyarrow as pa
 from celery.exceptions import SoftTimeLimitExceeded
 from flask import current_app
 from flask_babel import gettext as __
@@ -60,6 +61,7 @@ from superset.sql_parse import (
     insert_rls_in_predicate,
     ParsedQuery,
 )
+from superset.sqllab.arrow_payload import serialize_chunked_arrow_payload
 from superset.sqllab.limiting_factor import LimitingFactor
 from superset.sqllab.utils import write_ipc_buffer
 from superset.utils import json
@@ -80,6 +82,9 @@ SQLLAB_CTAS_NO_LIMIT = config["SQLLAB_CTAS_NO_LIMIT"]
 log_query = config["QUERY_LOGGER"]
 logger = logging.getLogger(__name__)
 BYTES_IN_MB = 1024 * 1024
+# number of rows fetched at a time when `SQLLAB_FETCH_BATCH_SIZE` isn't set, so the
+# size of the results can be checked against `SQLLAB_PAYLOAD_MAX_MB` while fetching
+PAYLOAD_CHECK_FETCH_BATCH_SIZE = 10000
 
 
 class SqlLabException(Exception):
@@ -94,6 +99,17 @@ class SqlLabQueryStoppedException(SqlLabException):
     pass
 
 
+class SqlLabPayloadTooLargeException(SupersetErrorException):
+    def __init__(self, payload_size: float, max_mb: float) -> None:
+        super().__init__(
+            SupersetError(
+                message=f"Result size ({payload_size / BYTES_IN_MB:.2f} MB) exceeds the allowed limit of {max_mb} MB.",
+                error_type=SupersetErrorType.RESULT_TOO_LARGE_ERROR,
+                level=ErrorLevel.ERROR,
+            )
+        )
+
+
 def handle_query_error(
     ex: Exception,
     query: Query,
@@ -312,12 +328,7 @@ def execute_sql_statement(  # pylint: disable=too-many-statements, too-many-loca
                     query.id,
                     str(query.to_dict()),
                 )
-                data = db_engine_spec.fetch_data(cursor, increased_limit)
-                if query.limit is None or len(data) <= query.limit:
-                    query.limiting_factor = LimitingFactor.NOT_LIMITED
-                else:
-                    # return 1 row less than increased_query
-                    data = data[:-1]
+                result_set = fetch_results(query, cursor, increased_limit)
     except SoftTimeLimitExceeded as ex:
         query.status = QueryStatus.TIMED_OUT
 
@@ -334,8 +345,9 @@ def execute_sql_statement(  # pylint: disable=too-many-statements, too-many-loca
                 level=ErrorLevel.ERROR,
             )
         ) from ex
-    except OAuth2RedirectError:
-        # user needs to authenticate with OAuth2 in order to run query
+    except (OAuth2RedirectError, SqlLabPayloadTooLargeException):
+        # user needs to authenticate with OAuth2 in order to run query, or the
+        # results are too large and fetching them was stopped
         raise
     except Exception as ex:
         # query is stopped in another thread/worker
@@ -347,9 +359,84 @@ def execute_sql_statement(  # pylint: disable=too-many-statements, too-many-loca
         logger.debug("Query %d: %s", query.id, ex)
         raise SqlLabException(db_engine_spec.extract_error_message(ex)) from ex
 
-    logger.debug("Query %d: Fetching cursor description", query.id)
-    cursor_description = cursor.description
-    return SupersetResultSet(data, cursor_description, db_engine_spec)
+    return result_set
+
+
+def fetch_results(
+    query: Query,
+    cursor: Any,
+    limit: Optional[int],
+) -> SupersetResultSet:
+    """
+    Fetch the results of a query, up to `limit` rows, dropping the extra row fetched
+    to find out whether they're limited.
+
+    With `SQLLAB_FETCH_BATCH_SIZE`, the rows are fetched in batches of that size, each
+    converted to Arrow as soon as it's fetched, rather than holding all of them in
+    memory alongside the Arrow table. When `SQLLAB_PAYLOAD_MAX_MB` is set, the rows
+    are fetched in batches even without a batch size, so their size can be checked
+    as they're fetched.
+    """
+    db_engine_spec = query.database.db_engine_spec
+    fetch_batch_size = config["SQLLAB_FETCH_BATCH_SIZE"]
+    if not fetch_batch_size and config.get("SQLLAB_PAYLOAD_MAX_MB"):
+        fetch_batch_size = PAYLOAD_CHECK_FETCH_BATCH_SIZE
+
+    if not fetch_batch_size:
+        data = db_engine_spec.fetch_data(cursor, limit)
+        if query.limit is None or len(data) <= query.limit:
+            query.limiting_factor = LimitingFactor.NOT_LIMITED
+        else:
+            # return 1 row less than increased_query
+            data = data[:-1]
+
+        logger.debug("Query %d: Fetching cursor description", query.id)
+        return SupersetResultSet(data, cursor.description, db_engine_spec)
+
+    result_set = SupersetResultSet.from_chunks(
+        db_engine_spec.fetch_data_chunks(cursor, fetch_batch_size, limit),
+        cursor.description,
+        db_engine_spec,
+        callback=get_payload_size_check(query),
+    )
+    if query.limit is None or result_set.size <= query.limit:
+        query.limiting_factor = LimitingFactor.NOT_LIMITED
+    else:
+        # return 1 row less than increased_query
+        result_set.table = result_set.table.slice(0, query.limit)
+    return result_set
+
+
+def get_payload_size_check(query: Query) -> Optional[Callable[[pa.Table], None]]:
+    """
+    Return a callback estimating the size of the payload of a query from the Arrow
+    tables of its rows as they're fetched, which cancels the query as soon as the
+    estimate exceeds `SQLLAB_PAYLOAD_MAX_MB`, rather than once all the rows are
+    fetched and serialized.
+
+    The estimate is the uncompressed size of the Arrow buffers, which is lower than
+    the size of the serialized payload in most cases.
+    """
+    if not (sql_lab_payload_max_mb := config.get("SQLLAB_PAYLOAD_MAX_MB")):
+        return None
+
+    max_bytes = sql_lab_payload_max_mb * BYTES_IN_MB
+    payload_size = 0
+
+    def check_payload_size(table: pa.Table) -> None:
+        nonlocal payload_size
+        payload_size += table.nbytes
+        if payload_size > max_bytes:
+            logger.info(
+                "Query %d: Result size exceeds the allowed limit, cancelling",
+                query.id,
+            )
+            stats_logger.incr("sqllab.query.payload_too_large")
+            if not cancel_query(query):
+                logger.warning("Query %d: Unable to cancel the query", query.id)
+            raise SqlLabPayloadTooLargeException(payload_size, sql_lab_payload_max_mb)
+
+    return check_payload_size
 
 
 def apply_limit_if_exists(
@@ -573,10 +660,21 @@ def execute_sql_statements(
         )
     query.end_time = now_as_float()
 
+    arrow_compression = config["RESULTS_BACKEND_ARROW_COMPRESSION"]
+    use_arrow_payload = bool(store_results and results_backend and arrow_compression)
     use_arrow_data = store_results and cast(bool, results_backend_use_msgpack)
-    data, selected_columns, all_columns, expanded_columns = _serialize_and_expand_data(
-        result_set, db_engine_spec, use_arrow_data, expand_data
-    )
+    if use_arrow_payload:
+        # the rows are stored separately from the metadata, as an Arrow table
+        use_arrow_data = True
+        data: Union[bytes, str, list[Any]] = []
+        selected_columns = all_columns = result_set.columns
+        expanded_columns: list[Any] = []
+    else:
+        data, selected_columns, all_columns, expanded_columns = (
+            _serialize_and_expand_data(
+                result_set, db_engine_spec, use_arrow_data, expand_data
+            )
+        )
 
     # TODO: data should be saved separately from metadata (likely in Parquet)
     payload.update(
@@ -601,34 +699,52 @@ def execute_sql_statements(
             with stats_timing(
                 "sqllab.query.results_backend_write_serialization", stats_logger
             ):
-                serialized_payload = _serialize_payload(
-                    payload, cast(bool, results_backend_use_msgpack)
-                )
+                serialized_payload: Union[bytes, str]
+                chunks: dict[str, bytes] = {}
+                if use_arrow_payload:
+                    serialized_payload, chunks = serialize_chunked_arrow_payload(
+                        key,
+                        payload,
+                        result_set.pa_table,
+                        arrow_compression,
+                        chunk_size=config["RESULTS_BACKEND_ARROW_CHUNK_SIZE"],
+                        max_chunksize=config["RESULTS_BACKEND_ARROW_BATCH_SIZE"],
+                    )
+                else:
+                    serialized_payload = _serialize_payload(
+                        payload, cast(bool, results_backend_use_msgpack)
+                    )
 
                 # Check the size of the serialized payload
                 if sql_lab_payload_max_mb := config.get("SQLLAB_PAYLOAD_MAX_MB"):
-                    serialized_payload_size = sys.getsizeof(serialized_payload)
+                    serialized_payload_size = sys.getsizeof(serialized_payload) + sum(
+                        sys.getsizeof(chunk) for chunk in chunks.values()
+                    )
                     max_bytes = sql_lab_payload_max_mb * BYTES_IN_MB
 
                     if serialized_payload_size > max_bytes:
                         logger.info("Result size exceeds the allowed limit.")
-                        raise SupersetErrorException(
-                            SupersetError(
-                                message=f"Result size ({serialized_payload_size / BYTES_IN_MB:.2f} MB) exceeds the allowed limit of {sql_lab_payload_max_mb} MB.",
-                                error_type=SupersetErrorType.RESULT_TOO_LARGE_ERROR,
-                                level=ErrorLevel.ERROR,
-                            )
+                        raise SqlLabPayloadTooLargeException(
+                            serialized_payload_size, sql_lab_payload_max_mb
                         )
 
             cache_timeout = database.cache_timeout
             if cache_timeout is None:
                 cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
 
-            compressed = zlib_compress(serialized_payload)
+            # the Arrow buffers are already compressed
+            compressed = (
+                cast(bytes, serialized_payload)
+                if use_arrow_payload
+                else zlib_compress(serialized_payload)
+            )
             logger.debug(
                 "*** serialized payload size: %i", getsizeof(serialized_payload)
             )
             logger.debug("*** compressed payload size: %i", getsizeof(compressed))
+            if chunks:
+                # the chunks are stored first, so they exist once the manifest does
+                results_backend.set_many(chunks, cache_timeout)
             results_backend.set(key, compressed, cache_timeout)
         query.results_key = key
 
@@ -664,12 +780,8 @@ def execute_sql_statements(
 
             if serialized_payload_size > max_bytes:
                 logger.info("Result size exceeds the allowed limit.")
-                raise SupersetErrorException(
-                    SupersetError(
-                        message=f"Result size ({serialized_payload_size / BYTES_IN_MB:.2f} MB) exceeds the allowed limit of {sql_lab_payload_max_mb} MB.",
-                        error_type=SupersetErrorType.RESULT_TOO_LARGE_ERROR,
-                        level=ErrorLevel.ERROR,
-                    )
+                raise SqlLabPayloadTooLargeException(
+                    serialized_payload_size, sql_lab_payload_max_mb
                 )
         return payload
 
@@ -36,6 +36,7 @@ from sqlparse.sql import (
     IdentifierList,
     Parenthesis,
     remove_quotes,
+    Statement,
     Token,
     TokenList,
     Where,
@@ -217,6 +218,8 @@ class ParsedQuery:
         self._tables: set[Table] = set()
         self._alias_names: set[str] = set()
         self._limit: int | None = None
+        self._sql_without_comments: str | None = None
+        self._parsed_without_comments: tuple[Statement, ...] | None = None
 
         logger.debug("Parsing with sqlparse statement: %s", self.sql)
         self._parsed = sqlparse.parse(self.stripped())
@@ -320,7 +323,7 @@ class ParsedQuery:
 
     def is_select(self) -> bool:
         # make sure we strip comments; prevents a bug with comments in the CTE
-        parsed = sqlparse.parse(self.strip_comments())
+        parsed = self._parse_without_comments()
         seen_select = False
 
         for statement in parsed:
@@ -386,11 +389,11 @@ class ParsedQuery:
         return None
 
     def is_valid_ctas(self) -> bool:
-        parsed = sqlparse.parse(self.strip_comments())
+        parsed = self._parse_without_comments()
         return parsed[-1].get_type() == "SELECT"
 
     def is_valid_cvas(self) -> bool:
-        parsed = sqlparse.parse(self.strip_comments())
+        parsed = self._parse_without_comments()
         return len(parsed) == 1 and parsed[0].get_type() == "SELECT"
 
     def is_explain(self) -> bool:
@@ -425,7 +428,20 @@ class ParsedQuery:
         return self.sql.strip(" \t\r\n;")
 
     def strip_comments(self) -> str:
-        return sqlparse.format(self.stripped(), strip_comments=True)
+        if self._sql_without_comments is None:
+            self._sql_without_comments = sqlparse.format(
+                self.stripped(),
+                strip_comments=True,
+            )
+        return self._sql_without_comments
+
+    def _parse_without_comments(self) -> tuple[Statement, ...]:
+        """
+        Parse the query without comments, once, since it's only read.
+        """
+        if self._parsed_without_comments is None:
+            self._parsed_without_comments = sqlparse.parse(self.strip_comments())
+        return self._parsed_without_comments
 
     def get_statements(self) -> list[str]:
         """Returns a list of SQL statements as strings, stripped"""
@@ -15,10 +15,11 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from collections.abc import Iterator
 from typing import Any, cast, Optional
 from urllib import parse
 
-from flask import request, Response
+from flask import request, Response, stream_with_context
 from flask_appbuilder import permission_name
 from flask_appbuilder.api import expose, protect, rison, safe
 from flask_appbuilder.models.sqla.interface import SQLAInterface
@@ -271,29 +272,36 @@ class SqlLabRestApi(BaseSupersetApi):
             500:
               $ref: '#/components/responses/500'
         """
-        result = SqlResultExportCommand(client_id=client_id).run()
-
-        query, data, row_count = result["query"], result["data"], result["count"]
+        command = SqlResultExportCommand(client_id=client_id)
+        result = command.run()
+        query = result["query"]
 
-        quoted_csv_name = parse.quote(query.name)
-        response = CsvResponse(
-            data, headers=generate_download_headers("csv", quoted_csv_name)
-        )
-        event_info = {
+        # read the query before streaming, so the metastore isn't queried during the
+        # download
+        event_info: dict[str, Any] = {
             "event_type": "data_export",
             "client_id": client_id,
-            "row_count": row_count,
             "database": query.database.name,
             "catalog": query.catalog,
             "schema": query.schema,
             "sql": query.sql,
             "exported_format": "csv",
         }
-        event_rep = repr(event_info)
-        logger.debug(
-            "CSV exported: %s", event_rep, extra={"superset_event": event_info}
+
+        def stream() -> Iterator[str]:
+            yield from result["data"]
+
+            event_info["row_count"] = command.row_count
+            event_rep = repr(event_info)
+            logger.debug(
+                "CSV exported: %s", event_rep, extra={"superset_event": event_info}
+            )
+
+        quoted_csv_name = parse.quote(query.name)
+        return CsvResponse(
+            stream_with_context(stream()),
+            headers=generate_download_headers("csv", quoted_csv_name),
         )
-        return response
 
     @expose("/results/")
     @protect()
@@ -339,7 +347,8 @@ class SqlLabRestApi(BaseSupersetApi):
         params = kwargs["rison"]
         key = params.get("key")
         rows = params.get("rows")
-        result = SqlExecutionResultsCommand(key=key, rows=rows).run()
+        offset = params.get("offset", 0)
+        result = SqlExecutionResultsCommand(key=key, rows=rows, offset=offset).run()
 
         # Using pessimistic json serialization since some database drivers can return
         # unserializeable types at times
@@ -0,0 +1,311 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Columnar format of the SQL Lab results stored in the results backend.
+
+A payload is laid out as::
+
+    MAGIC | header length (uint32, little endian) | JSON header | Arrow IPC file
+
+The header holds the metadata of the results (everything in the SQL Lab payload
+but the rows) and the number of rows of each record batch. The rows are stored
+as an Arrow IPC file, whose buffers are compressed with LZ4 or ZSTD. Since the
+IPC file format supports random access, a range of rows can be read by
+decompressing only the record batches it spans, without copying the payload.
+
+Large results are split in chunks of a fixed number of rows, each one stored as
+a payload under its own key, and a manifest holding the metadata and the keys of
+the chunks is stored under the key of the results. Reading a range of rows then
+only fetches the chunks it spans from the results backend; decoded chunks are
+kept in a per-process LRU cache, since results are never modified once stored.
+"""
+
+from __future__ import annotations
+
+import struct
+import threading
+from collections.abc import Iterator
+from typing import Any, Callable, Literal
+
+import pyarrow as pa
+from flask import current_app
+
+from superset.exceptions import SerializationError
+from superset.utils import json
+from superset.utils.lru import LRUCache
+
+MAGIC = b"SSARROW1"
+MANIFEST_MAGIC = b"SSCHUNK1"
+HEADER_LENGTH = struct.Struct("<I")
+
+ArrowCompression = Literal["lz4", "zstd"]
+
+_chunk_cache: LRUCache[str, pa.Table] | None = None
+_chunk_cache_lock = threading.Lock()
+
+
+def is_arrow_payload(blob: bytes | str) -> bool:
+    """
+    Return whether a results backend entry is stored in the Arrow format, as
+    opposed to zlib compressed msgpack or JSON.
+    """
+    return isinstance(blob, bytes) and blob.startswith((MAGIC, MANIFEST_MAGIC))
+
+
+def _pack(magic: bytes, header: dict[str, Any], body: bytes = b"") -> bytes:
+    encoded = json.dumps(
+        header,
+        default=json.json_iso_dttm_ser,
+        ignore_nan=True,
+    ).encode("utf-8")
+    return b"".join([magic, HEADER_LENGTH.pack(len(encoded)), encoded, body])
+
+
+def _unpack(blob: bytes, magic: bytes) -> tuple[dict[str, Any], int]:
+    """
+    Return the header of a payload and the position of its body.
+    """
+    if not blob.startswith(magic):
+        raise SerializationError("Not an Arrow results payload")
+
+    start = len(magic) + HEADER_LENGTH.size
+    try:
+        (length,) = HEADER_LENGTH.unpack_from(blob, len(magic))
+        return json.loads(blob[start : start + length]), start + length
+    except (struct.error, json.JSONDecodeError) as ex:
+        raise SerializationError("Unable to deserialize table") from ex
+
+
+def _get_metadata(payload: dict[str, Any]) -> dict[str, Any]:
+    return {name: value for name, value in payload.items() if name != "data"}
+
+
+def _iter_ranges(
+    sizes: list[int],
+    offset: int,
+    limit: int | None,
+) -> Iterator[tuple[int, int, int]]:
+    """
+    Yield the index, the relative offset and the length of the parts of the
+    consecutive blocks of rows of the given sizes spanned by a range of rows.
+    """
+    total = sum(sizes)
+    end = total if limit is None else min(offset + limit, total)
+    block_start = 0
+    for index, size in enumerate(sizes):
+        block_end = block_start + size
+        if block_start < end and block_end > offset:
+            start = max(offset, block_start)
+            yield index, start - block_start, min(end, block_end) - start
+        block_start = block_end
+
+
+def serialize_arrow_payload(
+    payload: dict[str, Any],
+    table: pa.Table,
+    compression: ArrowCompression | None = "lz4",
+    max_chunksize: int | None = None,
+) -> bytes:
+    """
+    Serialize SQL Lab results in the Arrow format.
+
+    :param payload: The SQL Lab payload; its `data` is ignored
+    :param table: The rows of the results
+    :param compression: The codec used to compress the Arrow buffers
+    :param max_chunksize: The maximum number of rows per record batch, i.e. the
+        granularity of the row ranges that can be read
+    :returns: The serialized payload
+    """
+    batches = table.to_batches(max_chunksize=max_chunksize)
+
+    # the IPC file is written on its own, since its footer holds absolute offsets
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+
+    return _pack(
+        MAGIC,
+        {
+            "metadata": _get_metadata(payload),
+            "batch_rows": [batch.num_rows for batch in batches],
+        },
+        sink.getvalue().to_pybytes(),
+    )
+
+
+def serialize_chunked_arrow_payload(  # pylint: disable=too-many-arguments
+    key: str,
+    payload: dict[str, Any],
+    table: pa.Table,
+    compression: ArrowCompression | None = "lz4",
+    chunk_size: int | None = None,
+    max_chunksize: int | None = None,
+) -> tuple[bytes, dict[str, bytes]]:
+    """
+    Serialize SQL Lab results in the Arrow format, split in chunks of at most
+    `chunk_size` rows when they're larger than that.
+
+    :param key: The results backend key of the results
+    :param payload: The SQL Lab payload; its `data` is ignored
+    :param table: The rows of the results
+    :param compression: The codec used to compress the Arrow buffers
+    :param chunk_size: The maximum number of rows per chunk
+    :param max_chunksize: The maximum number of rows per record batch
+    :returns: The payload to store under `key`, and the chunks to store by key
+    """
+    if not chunk_size or table.num_rows <= chunk_size:
+        return serialize_arrow_payload(payload, table, compression, max_chunksize), {}
+
+    slices = [
+        table.slice(start, chunk_size) for start in range(0, table.num_rows, chunk_size)
+    ]
+    chunks = {
+        f"{key}-chunk-{index}": serialize_arrow_payload(
+            {}, chunk, compression, max_chunksize
+        )
+        for index, chunk in enumerate(slices)
+    }
+    manifest = _pack(
+        MANIFEST_MAGIC,
+        {
+            "metadata": _get_metadata(payload),
+            "chunk_keys": list(chunks),
+            "chunk_rows": [chunk.num_rows for chunk in slices],
+        },
+    )
+    return manifest, chunks
+
+
+class ArrowResultsPayload:
+    """
+    SQL Lab results stored in the Arrow format.
+
+    Only the header is decoded when the payload is loaded; the rows are read on
+    demand with `read`.
+    """
+
+    def __init__(self, blob: bytes) -> None:
+        header, start = _unpack(blob, MAGIC)
+        try:
+            # the IPC file is read from a zero-copy slice of the payload
+            self._reader = pa.ipc.open_file(pa.py_buffer(blob).slice(start))
+        except pa.ArrowException as ex:
+            raise SerializationError("Unable to deserialize table") from ex
+
+        self.metadata: dict[str, Any] = header["metadata"]
+        self.batch_rows: list[int] = header["batch_rows"]
+
+    @property
+    def num_rows(self) -> int:
+        return sum(self.batch_rows)
+
+    def read(self, offset: int = 0, limit: int | None = None) -> pa.Table:
+        """
+        Read a range of rows, only decompressing the record batches it spans.
+
+        :param offset: The index of the first row
+        :param limit: The maximum number of rows, all of them if not set
+        :returns: The rows in the range
+        """
+        batches = [
+            self._reader.get_batch(index).slice(start, length)
+            for index, start, length in _iter_ranges(self.batch_rows, offset, limit)
+        ]
+        return pa.Table.from_batches(batches, schema=self._reader.schema)
+
+
+class ArrowResultsManifest:
+    """
+    SQL Lab results stored in the Arrow format, split in chunks.
+
+    :param blob: The manifest
+    :param get_blob: A callable fetching an entry of the results backend
+    """
+
+    def __init__(self, blob: bytes, get_blob: Callable[[str], Any]) -> None:
+        header, _ = _unpack(blob, MANIFEST_MAGIC)
+        self._get_blob = get_blob
+        self.metadata: dict[str, Any] = header["metadata"]
+        self.chunk_keys: list[str] = header["chunk_keys"]
+        self.chunk_rows: list[int] = header["chunk_rows"]
+
+    @property
+    def num_rows(self) -> int:
+        return sum(self.chunk_rows)
+
+    def read(self, offset: int = 0, limit: int | None = None) -> pa.Table:
+        """
+        Read a range of rows, only fetching the chunks it spans.
+
+        :param offset: The index of the first row
+        :param limit: The maximum number of rows, all of them if not set
+        :returns: The rows in the range
+        """
+        tables = [
+            self._get_chunk(self.chunk_keys[index]).slice(start, length)
+            for index, start, length in _iter_ranges(self.chunk_rows, offset, limit)
+        ]
+        if not tables:
+            return self._get_chunk(self.chunk_keys[0]).slice(0, 0)
+        return pa.concat_tables(tables)
+
+    def _get_chunk(self, key: str) -> pa.Table:
+        cache = get_chunk_cache()
+        if (table := cache.get(key)) is not None:
+            return table
+
+        blob = self._get_blob(key)
+        if not blob:
+            raise SerializationError(f"Chunk {key} of the results is missing")
+        table = ArrowResultsPayload(blob).read()
+        cache.set(key, table)
+        return table
+
+
+def get_chunk_cache() -> LRUCache[str, pa.Table]:
+    """
+    Return the per-process LRU cache of decoded chunks, bounded in bytes by
+    `RESULTS_BACKEND_CHUNK_CACHE_SIZE_MB`.
+    """
+    global _chunk_cache  # pylint: disable=global-statement
+    with _chunk_cache_lock:
+        if _chunk_cache is None:
+            _chunk_cache = LRUCache(
+                maxsize=current_app.config["RESULTS_BACKEND_CHUNK_CACHE_SIZE_MB"]
+                * 1024
+                * 1024,
+                getsizeof=lambda table: table.nbytes,
+            )
+        return _chunk_cache
+
+
+def load_arrow_payload(
+    blob: bytes,
+    get_blob: Callable[[str], Any],
+) -> ArrowResultsPayload | ArrowResultsManifest:
+    """
+    Load SQL Lab results stored in the Arrow format, chunked or not.
+
+    :param blob: The entry stored under the key of the results
+    :param get_blob: A callable fetching an entry of the results backend
+    :returns: The results, whose rows can be read with `read`
+    """
+    if blob.startswith(MANIFEST_MAGIC):
+        return ArrowResultsManifest(blob, get_blob)
+    return ArrowResultsPayload(blob)
@@ -26,6 +26,9 @@ from flask_appbuilder.security.sqla.models import User
 from marshmallow import ValidationError
 
 from superset.charts.schemas import ChartDataQueryContextSchema
+from superset.common.db_query_status import QueryStatus
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
 from superset.exceptions import SupersetVizException
 from superset.extensions import (
     async_query_manager,
@@ -83,10 +86,17 @@ def _load_user_from_job_metadata(job_metadata: dict[str, Any]) -> User:
 def load_chart_data_into_cache(
     job_metadata: dict[str, Any],
     form_data: dict[str, Any],
+    job_key: str | None = None,
 ) -> None:
     # pylint: disable=import-outside-toplevel
     from superset.commands.chart.data.get_data_command import ChartDataCommand
 
+    def update_jobs(status: str, **kwargs: Any) -> None:
+        async_query_manager.update_job(job_metadata, status, **kwargs)
+        if job_key:
+            # notify the identical jobs attached to this one
+            async_query_manager.update_attached_jobs(job_key, status, **kwargs)
+
     with override_user(_load_user_from_job_metadata(job_metadata), force=False):
         try:
             set_form_data(form_data)
@@ -95,24 +105,52 @@ def load_chart_data_into_cache(
             result = command.run(cache=True)
             cache_key = result["cache_key"]
             result_url = f"/api/v1/chart/data/{cache_key}"
-            async_query_manager.update_job(
-                job_metadata,
-                async_query_manager.STATUS_DONE,
-                result_url=result_url,
-            )
+            update_jobs(async_query_manager.STATUS_DONE, result_url=result_url)
         except SoftTimeLimitExceeded as ex:
             logger.warning("A timeout occurred while loading chart data, error: %s", ex)
+            if job_key:
+                async_query_manager.update_attached_jobs(
+                    job_key,
+                    async_query_manager.STATUS_ERROR,
+                    errors=[{"message": "A timeout occurred while loading chart data"}],
+                )
             raise
         except Exception as ex:
             # TODO: QueryContext should support SIP-40 style errors
             error = str(ex.message if hasattr(ex, "message") else ex)
             errors = [{"message": error}]
-            async_query_manager.update_job(
-                job_metadata, async_query_manager.STATUS_ERROR, errors=errors
-            )
+            update_jobs(async_query_manager.STATUS_ERROR, errors=errors)
             raise
 
 
+@celery_app.task(name="refresh_chart_data_cache", soft_time_limit=query_timeout)
+def refresh_chart_data_cache(
+    user_metadata: dict[str, Any],
+    form_data: dict[str, Any],
+    query_index: int,
+    cache_key: str,
+) -> None:
+    """
+    Refresh the stale cached result of a query, returned meanwhile by the data
+    requests, by running it again.
+    """
+    with override_user(_load_user_from_job_metadata(user_metadata), force=False):
+        try:
+            set_form_data(form_data)
+            query_context = _create_query_context_from_form(
+                {**form_data, "force": True}
+            )
+            payload = query_context.get_df_payload(query_context.queries[query_index])
+            if payload["status"] == QueryStatus.FAILED:
+                logger.warning(
+                    "Failed to refresh the cached data %s: %s",
+                    cache_key,
+                    payload["error"],
+                )
+        finally:
+            QueryCacheManager.release_refresh(cache_key, region=CacheRegion.DATA)
+
+
 @celery_app.task(name="load_explore_json_into_cache", soft_time_limit=query_timeout)
 def load_explore_json_into_cache(  # pylint: disable=too-many-locals
     job_metadata: dict[str, Any],
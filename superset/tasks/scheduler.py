@@ -19,15 +19,18 @@ from datetime import datetime, timezone
 
 from celery import Celery
 from celery.exceptions import SoftTimeLimitExceeded
+from sqlalchemy.exc import SQLAlchemyError
 
 from superset import app, is_feature_enabled
 from superset.commands.exceptions import CommandException
+from superset.commands.key_value.prune import KeyValuePruneCommand
 from superset.commands.report.exceptions import ReportScheduleUnexpectedError
 from superset.commands.report.execute import AsyncExecuteReportScheduleCommand
 from superset.commands.report.log_prune import AsyncPruneReportScheduleLogCommand
 from superset.commands.sql_lab.query import QueryPruneCommand
 from superset.daos.report import ReportScheduleDAO
 from superset.extensions import celery_app
+from superset.key_value.types import KeyValueResource
 from superset.stats_logger import BaseStatsLogger
 from superset.tasks.cron_util import cron_schedule_window
 from superset.utils.core import LoggerLevel
@@ -133,3 +136,16 @@ def prune_query() -> None:
         ).run()
     except CommandException as ex:
         logger.exception("An error occurred while pruning queries: %s", ex)
+
+
+@celery_app.task(name="prune_metastore_cache")
+def prune_metastore_cache() -> None:
+    stats_logger: BaseStatsLogger = app.config["STATS_LOGGER"]
+    stats_logger.incr("prune_metastore_cache")
+
+    try:
+        KeyValuePruneCommand(KeyValueResource.METASTORE_CACHE).run()
+    except SoftTimeLimitExceeded as ex:
+        logger.warning("A timeout occurred while pruning the metastore cache: %s", ex)
+    except SQLAlchemyError:
+        logger.exception("An error occurred while pruning the metastore cache")
@@ -0,0 +1,78 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pandas as pd
+import pyarrow as pa
+
+from superset.result_set import stringify_values
+
+ARROW_STREAM_MIMETYPE = "application/vnd.apache.arrow.stream"
+
+# Exceptions raised by pyarrow when a column can't be converted natively
+ARROW_CONVERSION_ERRORS = (
+    pa.lib.ArrowInvalid,
+    pa.lib.ArrowTypeError,
+    pa.lib.ArrowNotImplementedError,
+    ValueError,
+    TypeError,
+)
+
+
+def df_to_arrow_table(df: pd.DataFrame) -> pa.Table:
+    """
+    Convert a DataFrame to a pyarrow table.
+
+    The index is dropped, as in the JSON records format. Columns that pyarrow
+    can't convert natively (e.g. objects of mixed types) are stringified the same
+    way `SupersetResultSet` does.
+    """
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except ARROW_CONVERSION_ERRORS:
+        pass
+
+    arrays: list[pa.Array] = []
+    for _, series in df.items():
+        try:
+            arrays.append(pa.Array.from_pandas(series))
+        except ARROW_CONVERSION_ERRORS:
+            arrays.append(pa.array(stringify_values(series.to_numpy()).tolist()))
+
+    return pa.Table.from_arrays(arrays, names=[str(column) for column in df.columns])
+
+
+def df_to_arrow_ipc(df: pd.DataFrame, max_chunksize: int | None = None) -> bytes:
+    """
+    Serialize a DataFrame in the Arrow IPC streaming format.
+
+    :param df: The DataFrame to serialize
+    :param max_chunksize: The maximum number of rows per record batch, so clients
+        can start decoding the stream before it's fully received
+    :returns: The Arrow IPC stream
+    """
+    table = df_to_arrow_table(df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=max_chunksize)
+    return sink.getvalue().to_pybytes()
+
+
+def arrow_ipc_to_df(data: bytes) -> pd.DataFrame:
+    """
+    Deserialize an Arrow IPC stream into a DataFrame.
+    """
+    with pa.ipc.open_stream(data) as reader:
+        return reader.read_pandas()
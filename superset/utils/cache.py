@@ -34,24 +34,31 @@ from superset.utils.hashing import md5_sha_from_dict
 from superset.utils.json import json_int_dttm_ser
 
 if TYPE_CHECKING:
+    from superset.key_value.types import KeyValueCodec
     from superset.stats_logger import BaseStatsLogger
 
 config = app.config
 stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
 logger = logging.getLogger(__name__)
 
+# prefix of the Redis sets indexing the cache keys of each datasource
+CACHE_INDEX_PREFIX = "cache_index_"
+CACHE_INVALIDATION_BATCH_SIZE = 1000
+
 
 def generate_cache_key(values_dict: dict[str, Any], key_prefix: str = "") -> str:
     hash_str = md5_sha_from_dict(values_dict, default=json_int_dttm_ser)
     return f"{key_prefix}{hash_str}"
 
 
-def set_and_log_cache(
+def set_and_log_cache(  # pylint: disable=too-many-arguments
     cache_instance: Cache,
     cache_key: str,
     cache_value: dict[str, Any],
     cache_timeout: int | None = None,
     datasource_uid: str | None = None,
+    *,
+    codec: KeyValueCodec | None = None,
 ) -> None:
     if isinstance(cache_instance.cache, NullCache):
         return
@@ -64,9 +71,16 @@ def set_and_log_cache(
     try:
         dttm = datetime.utcnow().isoformat().split(".")[0]
         value = {**cache_value, "dttm": dttm}
-        cache_instance.set(cache_key, value, timeout=timeout)
+        cache_instance.set(
+            cache_key,
+            codec.encode(value) if codec else value,
+            timeout=timeout,
+        )
         stats_logger.incr("set_cache_key")
 
+        if datasource_uid and config["STORE_CACHE_KEYS_IN_REDIS"]:
+            add_to_cache_index(cache_instance, datasource_uid, [cache_key], timeout)
+
         if datasource_uid and config["STORE_CACHE_KEYS_IN_METADATA_DB"]:
             ck = CacheKey(
                 cache_key=cache_key,
@@ -81,6 +95,77 @@ def set_and_log_cache(
         logger.exception(ex)
 
 
+def get_cache_index_key(cache_instance: Cache, datasource_uid: str) -> str | None:
+    """
+    Return the Redis key of the set of the cache keys of a datasource, or `None` if
+    the cache isn't backed by Redis.
+    """
+    if getattr(cache_instance.cache, "_write_client", None) is None:
+        return None
+    return f"{cache_instance.cache.key_prefix}{CACHE_INDEX_PREFIX}{datasource_uid}"
+
+
+def add_to_cache_index(
+    cache_instance: Cache,
+    datasource_uid: str,
+    cache_keys: list[str],
+    cache_timeout: int,
+) -> None:
+    """
+    Add cache keys to the index of a datasource, which lives as long as its longest
+    lived key.
+    """
+    if (index_key := get_cache_index_key(cache_instance, datasource_uid)) is None:
+        return
+
+    client = cache_instance.cache._write_client  # pylint: disable=protected-access
+    pipe = client.pipeline(transaction=False)
+    pipe.exists(index_key)
+    pipe.ttl(index_key)
+    pipe.sadd(index_key, *cache_keys)
+    existed, ttl, _ = pipe.execute()
+
+    if cache_timeout <= 0:
+        if existed and ttl >= 0:
+            client.persist(index_key)
+    elif not existed or 0 <= ttl < cache_timeout:
+        client.expire(index_key, cache_timeout)
+
+
+def invalidate_cache_index(cache_instance: Cache, datasource_uid: str) -> int:
+    """
+    Delete the cache keys indexed for a datasource, in pipelined batches, and return
+    their number.
+    """
+    if (index_key := get_cache_index_key(cache_instance, datasource_uid)) is None:
+        return 0
+
+    backend = cache_instance.cache
+    client = backend._write_client  # pylint: disable=protected-access
+    count = 0
+    batch: list[str] = []
+
+    def delete(batch: list[str]) -> None:
+        pipe = client.pipeline(transaction=False)
+        pipe.delete(*(f"{backend.key_prefix}{key}" for key in batch))
+        pipe.srem(index_key, *batch)
+        pipe.execute()
+
+    # the members are removed once their keys are deleted, so that an interrupted
+    # invalidation can be resumed
+    for key in client.sscan_iter(index_key, count=CACHE_INVALIDATION_BATCH_SIZE):
+        batch.append(key.decode() if isinstance(key, bytes) else key)
+        if len(batch) == CACHE_INVALIDATION_BATCH_SIZE:
+            delete(batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        delete(batch)
+        count += len(batch)
+
+    return count
+
+
 # If a user sets `max_age` to 0, for long the browser should cache the
 # resource? Flask-Caching will cache forever, but for the HTTP header we need
 # to specify a "far future" date.
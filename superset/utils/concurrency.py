@@ -0,0 +1,199 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Helpers to run independent units of work (e.g. database queries) concurrently
+from within a request, while preserving the Flask app/request context and
+bounding the number of in-flight queries per database.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import wraps
+from typing import Any, Callable, ContextManager, TypeVar
+
+from flask import (
+    copy_current_request_context,
+    current_app,
+    g,
+    has_app_context,
+    has_request_context,
+)
+from sqlalchemy import inspect
+from sqlalchemy.orm.state import InstanceState
+
+T = TypeVar("T")
+
+_database_semaphores: dict[Any, threading.BoundedSemaphore] = {}
+_database_semaphores_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_database_semaphore(
+    database_id: Any,
+    limit: int,
+) -> threading.BoundedSemaphore:
+    """
+    Return the worker-local semaphore bounding concurrent queries for a database.
+
+    The semaphore is created lazily the first time a database is seen and shared
+    by every request handled by the current process.
+
+    :param database_id: The database identifier
+    :param limit: The maximum number of concurrent queries for the database
+    :returns: A bounded semaphore shared for the database
+    """
+    with _database_semaphores_lock:
+        if database_id not in _database_semaphores:
+            _database_semaphores[database_id] = threading.BoundedSemaphore(
+                max(limit, 1)
+            )
+        return _database_semaphores[database_id]
+
+
+def database_concurrency_guard(database_id: Any | None) -> ContextManager[Any]:
+    """
+    Return a context manager limiting concurrent queries against a database to
+    `DATABASE_MAX_CONCURRENT_QUERIES`.
+
+    The limit only applies to queries run from a task of `run_concurrently`;
+    queries issued directly by the thread handling the request are not bounded.
+    The guard should wrap a single database query, never a task that fans out
+    further, so that nested fan-outs can't exhaust the semaphore.
+
+    :param database_id: The database identifier, if known
+    :returns: The database semaphore, or a no-op context manager
+    """
+    limit = current_app.config["DATABASE_MAX_CONCURRENT_QUERIES"]
+    if database_id is None or not limit or not is_concurrent_task():
+        return nullcontext()
+    return get_database_semaphore(database_id, limit)
+
+
+def is_concurrent_task() -> bool:
+    """
+    Return whether the current thread is running a task of `run_concurrently`.
+    """
+    return getattr(_local, "concurrent_task", False)
+
+
+def copy_current_context(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Wrap a callable so it runs with a copy of the current Flask context.
+
+    Flask contexts are local to the thread that handles the request, so a callable
+    executed in a thread pool would otherwise not see `current_app`, `g` (and thus
+    the logged in user) nor the request. The request context is copied when one
+    is active, and the attributes of `g` are always propagated.
+
+    :param func: The callable to wrap
+    :returns: The wrapped callable
+    """
+    if not has_app_context():
+        return func
+
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    g_copy = dict(g.__dict__)
+
+    @wraps(func)
+    def wrapped(*args: Any, **kwargs: Any) -> T:
+        with app.app_context():
+            for key, value in g_copy.items():
+                setattr(g, key, value)
+            return func(*args, **kwargs)
+
+    if has_request_context():
+        return copy_current_request_context(wrapped)
+    return wrapped
+
+
+def preload(instance: Any, *relationships: str) -> None:
+    """
+    Load the attributes of an ORM instance, and of the instances of the given
+    relationships, before it's read from the tasks of `run_concurrently`.
+
+    An ORM instance is bound to the session of the thread that loaded it, which
+    must not be used from the other threads: reading an expired attribute, or a
+    relationship that isn't loaded yet, from a task would run a query through that
+    session. Instances that aren't bound to a session are left untouched.
+
+    :param instance: The ORM instance
+    :param relationships: The names of the relationships read by the tasks, the
+        ones the instance doesn't have being ignored
+    """
+    state = inspect(instance, raiseerr=False)
+    if not isinstance(state, InstanceState) or state.session_id is None:
+        return
+
+    if state.expired_attributes:
+        # all the expired attributes are loaded at once
+        getattr(instance, next(iter(state.expired_attributes)))
+
+    for relationship in relationships:
+        if relationship not in state.mapper.relationships:
+            continue
+        related = getattr(instance, relationship)
+        for related_instance in related if isinstance(related, list) else [related]:
+            preload(related_instance)
+
+
+def run_concurrently(
+    tasks: Sequence[Callable[[], T]],
+    max_workers: int,
+) -> list[T]:
+    """
+    Run independent tasks concurrently and return their results in order.
+
+    When `max_workers` is lower than 2 or there is a single task, the tasks are
+    run sequentially in the calling thread. Otherwise they are run in a bounded
+    thread pool, each one with a copy of the current Flask context. If any of the
+    tasks raises, the exception of the first failing task (in task order) is
+    re-raised once all tasks are done.
+
+    Tasks fanning out further (e.g. a query object with time offsets, run from a
+    chart data request running its query objects concurrently) run their own
+    tasks sequentially, so that a request never uses more than `max_workers`
+    threads of its outermost fan-out.
+
+    Tasks must not use the ORM instances loaded by the calling thread, unless they
+    were loaded beforehand with `preload`.
+
+    :param tasks: The callables to run
+    :param max_workers: The maximum number of threads to use
+    :returns: The results of the tasks, in the same order as `tasks`
+    """
+    if max_workers < 2 or len(tasks) < 2 or is_concurrent_task():
+        return [task() for task in tasks]
+
+    def _run(task: Callable[[], T]) -> T:
+        _local.concurrent_task = True
+        try:
+            return task()
+        finally:
+            # the threads of the pool may be reused by other code
+            _local.concurrent_task = False
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(tasks)),
+        thread_name_prefix="superset-query",
+    ) as executor:
+        futures = [executor.submit(copy_current_context(_run), task) for task in tasks]
+
+    return [future.result() for future in futures]
@@ -17,6 +17,7 @@
 import logging
 import re
 import urllib.request
+from collections.abc import Iterable, Iterator
 from typing import Any, Optional, Union
 from urllib.error import URLError
 
@@ -81,6 +82,23 @@ def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
     return df.to_csv(escapechar="\\", **kwargs)
 
 
+def df_chunks_to_escaped_csv(
+    chunks: Iterable[pd.DataFrame], **kwargs: Any
+) -> Iterator[str]:
+    """
+    Convert a stream of DataFrames to escaped CSV, one chunk at a time.
+
+    The header is only written for the first chunk, so the concatenation of the
+    output is the same as calling `df_to_escaped_csv` on the concatenated chunks,
+    while only a single chunk is held in memory at any time.
+    """
+    for i, chunk in enumerate(chunks):
+        yield df_to_escaped_csv(
+            chunk.reset_index(drop=True),
+            **{**kwargs, "header": i == 0 and kwargs.get("header", True)},
+        )
+
+
 def get_chart_csv_data(
     chart_url: str, auth_cookies: Optional[dict[str, str]] = None
 ) -> Optional[bytes]:
@@ -0,0 +1,70 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Caches of the Jinja templates and macros used by the template processors"""
+
+from __future__ import annotations
+
+from functools import wraps
+from types import CodeType
+from typing import Any, Callable, cast, TypeVar
+
+from flask import has_request_context, request
+from jinja2 import Environment, Template
+
+from superset.constants import LRU_CACHE_MAX_SIZE
+from superset.utils.lru import LRUCache
+
+# the templates compiled to Python code, by template processor class and source
+_template_code_cache: LRUCache[tuple[type, str], CodeType] = LRUCache(
+    maxsize=LRU_CACHE_MAX_SIZE
+)
+
+T = TypeVar("T")
+
+
+def get_template(env: Environment, processor_class: type, source: str) -> Template:
+    """
+    Return the template of the source, bound to the environment, compiled once per
+    template processor class (which sets up its environment) and source.
+    """
+    key = (processor_class, source)
+    if (code := _template_code_cache.get(key)) is None:
+        code = cast(CodeType, env.compile(source))
+        _template_code_cache.set(key, code)
+    return env.template_class.from_code(env, code, env.make_globals(None), None)
+
+
+def memoize_in_request(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Memoize the results of a macro for the duration of the request, as the templates
+    of the charts of a dashboard often call it repeatedly with the same arguments.
+
+    The arguments must be hashable; outside of a request nothing is memoized.
+    """
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        if not has_request_context():
+            return func(*args, **kwargs)
+
+        memo = request.environ.setdefault("superset.jinja_macros", {})
+        key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+        if key not in memo:
+            memo[key] = func(*args, **kwargs)
+        return memo[key]
+
+    return wrapper
@@ -16,10 +16,15 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
 import functools
 import inspect
 import logging
+import os
+import queue
 import textwrap
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from contextlib import contextmanager
@@ -409,6 +414,152 @@ class DBEventLogger(AbstractEventLogger):
             logging.exception(ex)
 
 
+class BufferedDBEventLogger(AbstractEventLogger):
+    """
+    Event logger that commits logs to Superset DB in batches, from a background
+    thread, so that requests don't wait for the write.
+
+    The logs are queued in memory, and written on their own connection when
+    `batch_size` of them are queued, or after `flush_interval` seconds. When more
+    than `max_queue_size` logs are queued, the new ones are dropped and counted in
+    the `event_logger.dropped` metric. The queue is drained on exit.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10000,
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._pid: int | None = None
+        self._queue: queue.Queue[dict[str, Any]] = queue.Queue(max_queue_size)
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._engine: Any = None
+        atexit.register(self.shutdown)
+
+    def log(  # pylint: disable=too-many-arguments
+        self,
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        self._start()
+        dttm = datetime.utcnow()
+        for record in kwargs.get("records", []):
+            json_string: str | None
+            try:
+                json_string = json.dumps(record)
+            except Exception:  # pylint: disable=broad-except
+                json_string = None
+            try:
+                self._queue.put_nowait(
+                    {
+                        "action": action,
+                        "json": json_string,
+                        "dashboard_id": dashboard_id,
+                        "slice_id": slice_id,
+                        "duration_ms": duration_ms,
+                        "referrer": referrer,
+                        "user_id": user_id,
+                        "dttm": dttm,
+                    }
+                )
+            except queue.Full:
+                self.dropped += 1
+                stats_logger_manager.instance.incr("event_logger.dropped")
+
+    def _start(self) -> None:
+        """
+        Start the flushing thread, again in the processes forked since it started.
+        """
+        if self._pid == os.getpid():
+            return
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            if self._pid is not None:
+                # the logs queued before the fork are written by the parent
+                self._queue = queue.Queue(self.max_queue_size)
+                self._stopped = threading.Event()
+            self._engine = db.engine
+            self._thread = threading.Thread(
+                target=self._run,
+                name="BufferedDBEventLogger",
+                daemon=True,
+            )
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self.flush(wait=True)
+        self.flush()
+
+    def flush(self, wait: bool = False) -> None:
+        """
+        Write the queued logs, in batches of `batch_size`.
+
+        :param wait: Whether to wait up to `flush_interval` seconds for a batch to
+            fill, writing at most one batch
+        """
+        deadline = time.monotonic() + self.flush_interval
+        batch: list[dict[str, Any]] = []
+        while True:
+            timeout = deadline - time.monotonic()
+            try:
+                batch.append(
+                    self._queue.get(timeout=timeout)
+                    if wait and timeout > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if len(batch) == self.batch_size:
+                self._write(batch)
+                if wait:
+                    return
+                batch = []
+        if batch:
+            self._write(batch)
+
+    def _write(self, batch: list[dict[str, Any]]) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset.models.core import Log
+
+        try:
+            with self._engine.begin() as connection:
+                connection.execute(
+                    Log.__table__.insert(),  # pylint: disable=no-member
+                    batch,
+                )
+        except SQLAlchemyError as ex:
+            logging.error("BufferedDBEventLogger failed to log %s event(s)", len(batch))
+            logging.exception(ex)
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """
+        Stop the flushing thread once it has written the queued logs.
+        """
+        if self._thread is None or self._pid != os.getpid():
+            return
+        self._stopped.set()
+        self._thread.join(timeout)
+
+
 class StdOutEventLogger(AbstractEventLogger):
     """Event logger that prints to stdout for debugging purposes"""
 
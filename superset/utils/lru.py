@@ -0,0 +1,94 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A thread-safe, in-process LRU cache.
+
+    The size of the cache is the sum of the sizes of its values, as returned by
+    `getsizeof` (1 per value by default); the least recently used values are
+    evicted once it exceeds `maxsize`. Values larger than `maxsize` are not
+    cached at all.
+
+    :param maxsize: The maximum size of the cache
+    :param getsizeof: A callable returning the size of a value
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        getsizeof: Callable[[V], int] | None = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.currsize = 0
+        self.hits = 0
+        self.misses = 0
+        self._getsizeof = getsizeof or (lambda value: 1)
+        self._data: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._data.move_to_end(key)
+            return self._data[key][0]
+
+    def set(self, key: K, value: V) -> None:
+        size = self._getsizeof(value)
+        with self._lock:
+            self._pop(key)
+            if size > self.maxsize:
+                return
+            self._data[key] = (value, size)
+            self.currsize += size
+            while self.currsize > self.maxsize:
+                self._pop(next(iter(self._data)))
+
+    def pop(self, key: K) -> V | None:
+        with self._lock:
+            return self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.currsize = 0
+
+    def _pop(self, key: K) -> V | None:
+        if key not in self._data:
+            return None
+        value, size = self._data.pop(key)
+        self.currsize -= size
+        return value
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -14,10 +14,24 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from __future__ import annotations
 
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import FrameType
 from typing import Any, Callable
 from unittest import mock
+from uuid import uuid4
 
+from flask import current_app, Flask, g, has_app_context, request
+from werkzeug.utils import secure_filename
 from werkzeug.wrappers import Request, Response
 
 try:
@@ -25,6 +39,8 @@ try:
 except ModuleNotFoundError:
     Profiler = None
 
+logger = logging.getLogger(__name__)
+
 
 class SupersetProfiler:  # pylint: disable=too-few-public-methods
     """
@@ -43,9 +59,9 @@ class SupersetProfiler:  # pylint: disable=too-few-public-methods
         self.interval = interval
 
     @Request.application
-    def __call__(self, request: Request) -> Response:
-        if request.args.get("_instrument") != "1":
-            return Response.from_app(self.app, request.environ)
+    def __call__(self, wsgi_request: Request) -> Response:
+        if wsgi_request.args.get("_instrument") != "1":
+            return Response.from_app(self.app, wsgi_request.environ)
 
         if Profiler is None:
             raise Exception(  # pylint: disable=broad-exception-raised
@@ -57,7 +73,146 @@ class SupersetProfiler:  # pylint: disable=too-few-public-methods
         # call original request
         fake_start_response = mock.MagicMock()
         with profiler:
-            self.app(request.environ, fake_start_response)
+            self.app(wsgi_request.environ, fake_start_response)
 
         # return HTML profiling information
         return Response(profiler.output_html(), mimetype="text/html")
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    Time a stage of the chart data pipeline.
+
+    The duration, in milliseconds, is sent to the stats logger as `profiler.<name>`,
+    and added to the `Server-Timing` header of the response when
+    `PROFILING_SERVER_TIMING` is set.
+
+    :param name: The name of the stage, e.g. `db_execute`
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if has_app_context():
+            duration = (time.perf_counter() - start) * 1000
+            current_app.config["STATS_LOGGER"].timing(f"profiler.{name}", duration)
+            # the list is shared with the threads the request fans out to
+            if (spans := g.get("profiler_spans")) is not None:
+                spans.append((name, duration))
+
+
+def get_server_timing(spans: list[tuple[str, float]]) -> str:
+    """
+    Return the value of the `Server-Timing` header for the timed stages, the
+    durations of the stages run several times being summed.
+    """
+    durations: dict[str, float] = {}
+    for name, duration in spans:
+        durations[name] = durations.get(name, 0) + duration
+    return ", ".join(
+        f"{name};dur={duration:.1f}" for name, duration in durations.items()
+    )
+
+
+class StackSampler:
+    """
+    Sample the stack of a thread from a background thread, every `interval` seconds.
+
+    The samples are counted by stack in the collapsed format read by
+    `flamegraph.pl` or speedscope, one `frame;frame;frame count` line per stack.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005) -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="StackSampler",
+            daemon=True,
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            # pylint: disable=protected-access
+            if frame := sys._current_frames().get(self.thread_id):
+                self.samples[self._collapse(frame)] += 1
+
+    @staticmethod
+    def _collapse(frame: FrameType | None) -> str:
+        stack = []
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "?")
+            stack.append(f"{module}:{frame.f_code.co_name}")
+            frame = frame.f_back
+        return ";".join(reversed(stack))
+
+    def write(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            for stack, count in self.samples.most_common():
+                file.write(f"{stack} {count}\n")
+
+
+class RequestProfiler:
+    """
+    Flask extension timing the stages of the requests, and sampling their stacks.
+
+    With `PROFILING_SERVER_TIMING`, the durations of the stages timed by `span` are
+    returned in the `Server-Timing` header of the responses. With
+    `PROFILING_SAMPLING_RATE`, that ratio of the requests have their stack sampled
+    every `PROFILING_SAMPLING_INTERVAL` seconds, and written to a collapsed stack
+    file in `PROFILING_SAMPLING_DIR`.
+    """
+
+    def init_app(self, app: Flask) -> None:
+        if (
+            app.config["PROFILING_SERVER_TIMING"]
+            or app.config["PROFILING_SAMPLING_RATE"]
+        ):
+            app.before_request(self.before_request)
+            app.after_request(self.after_request)
+            app.teardown_request(self.teardown_request)
+
+    @staticmethod
+    def before_request() -> None:
+        config = current_app.config
+        if config["PROFILING_SERVER_TIMING"]:
+            g.profiler_spans = []
+        if random.random() < config["PROFILING_SAMPLING_RATE"]:  # noqa: S311
+            g.stack_sampler = StackSampler(
+                threading.get_ident(),
+                config["PROFILING_SAMPLING_INTERVAL"],
+            )
+            g.stack_sampler.start()
+
+    @staticmethod
+    def after_request(response: Response) -> Response:
+        if spans := g.get("profiler_spans"):
+            response.headers["Server-Timing"] = get_server_timing(spans)
+        return response
+
+    @staticmethod
+    def teardown_request(_exc: BaseException | None = None) -> None:
+        if (sampler := g.pop("stack_sampler", None)) is None:
+            return
+        sampler.stop()
+        directory = current_app.config["PROFILING_SAMPLING_DIR"]
+        # the uuid keeps apart the requests sampled in the same millisecond
+        filename = secure_filename(
+            f"{int(time.time() * 1000)}-{uuid4().hex}-"
+            f"{request.endpoint or 'unknown'}.collapsed"
+        )
+        try:
+            os.makedirs(directory, exist_ok=True)
+            sampler.write(os.path.join(directory, filename))
+        except OSError:
+            logger.exception("Could not write the stack samples of the request")
@@ -70,6 +70,7 @@ from superset.reports.models import ReportRecipientType
 from superset.superset_typing import FlaskResponse
 from superset.translations.utils import get_language_pack
 from superset.utils import core as utils, json
+from superset.utils.arrow import ARROW_STREAM_MIMETYPE
 from superset.utils.filters import get_dataset_access_filters
 from superset.views.error_handling import json_error_response
 
@@ -555,6 +556,14 @@ class CsvResponse(Response):
     default_mimetype = "text/csv"
 
 
+class ArrowResponse(Response):
+    """
+    Override Response to use the Arrow IPC stream mimetype
+    """
+
+    default_mimetype = ARROW_STREAM_MIMETYPE
+
+
 class XlsxResponse(Response):
     """
     Override Response to use xlsx mimetype
@@ -29,7 +29,7 @@ from flask_babel import _
 from sqlalchemy.exc import NoResultFound
 from werkzeug.wrappers.response import Response
 
-from superset import app, dataframe, db, result_set, viz
+from superset import app, dataframe, db, result_set, results_backend, viz
 from superset.common.db_query_status import QueryStatus
 from superset.daos.datasource import DatasourceDAO
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -45,9 +45,10 @@ from superset.models.core import Database
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.models.sql_lab import Query
+from superset.sqllab.arrow_payload import is_arrow_payload, load_arrow_payload
 from superset.superset_typing import FormData
 from superset.utils import json
-from superset.utils.core import DatasourceType
+from superset.utils.core import DatasourceType, zlib_decompress
 from superset.utils.decorators import stats_timing
 from superset.viz import BaseViz
 
@@ -515,25 +516,61 @@ def _deserialize_results_payload(
             except pa.ArrowSerializationError as ex:
                 raise SerializationError("Unable to deserialize table") from ex
 
-        df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
-        ds_payload["data"] = dataframe.df_to_records(df) or []
+        return _expand_results_payload(ds_payload, pa_table, query)
 
-        for column in ds_payload["selected_columns"]:
-            if "name" in column:
-                column["column_name"] = column.get("name")
+    with stats_timing("sqllab.query.results_backend_json_deserialize", stats_logger):
+        return json.loads(payload)
 
-        db_engine_spec = query.database.db_engine_spec
-        all_columns, data, expanded_columns = db_engine_spec.expand_data(
-            ds_payload["selected_columns"], ds_payload["data"]
-        )
-        ds_payload.update(
-            {"data": data, "columns": all_columns, "expanded_columns": expanded_columns}
-        )
 
-        return ds_payload
+def _expand_results_payload(
+    ds_payload: dict[str, Any], pa_table: pa.Table, query: Query
+) -> dict[str, Any]:
+    df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
+    ds_payload["data"] = dataframe.df_to_records(df) or []
+
+    for column in ds_payload["selected_columns"]:
+        if "name" in column:
+            column["column_name"] = column.get("name")
 
-    with stats_timing("sqllab.query.results_backend_json_deserialize", stats_logger):
-        return json.loads(payload)
+    db_engine_spec = query.database.db_engine_spec
+    all_columns, data, expanded_columns = db_engine_spec.expand_data(
+        ds_payload["selected_columns"], ds_payload["data"]
+    )
+    ds_payload.update(
+        {"data": data, "columns": all_columns, "expanded_columns": expanded_columns}
+    )
+
+    return ds_payload
+
+
+def _load_results_payload(
+    blob: bytes,
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    Deserialize a range of the SQL Lab results read from the results backend.
+
+    Payloads stored in the Arrow format are read regardless of `use_msgpack`, and
+    only the chunks and record batches spanned by the range are decompressed.
+    Payloads in the other formats are fully decoded before being sliced.
+    """
+    if is_arrow_payload(blob):
+        with stats_timing(
+            "sqllab.query.results_backend_arrow_deserialize", stats_logger
+        ):
+            arrow_payload = load_arrow_payload(blob, results_backend.get)
+            pa_table = arrow_payload.read(offset, limit)
+        return _expand_results_payload(dict(arrow_payload.metadata), pa_table, query)
+
+    payload = zlib_decompress(blob, decode=not use_msgpack)
+    obj = _deserialize_results_payload(payload, query, use_msgpack)
+    if offset or limit is not None:
+        end = None if limit is None else offset + limit
+        obj["data"] = obj["data"][offset:end]
+    return obj
 
 
 def get_cta_schema_name(
@@ -171,3 +171,39 @@ def test_invalidate_existing_caches(invalidate):
         .datasource_uid
         == "X__table"
     )
+
+
+@pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+def test_invalidate_existing_caches_by_database(invalidate):
+    schema = get_example_default_schema() or ""
+    bn = SupersetTestCase.get_birth_names_dataset()
+
+    db.session.add(CacheKey(cache_key="cache_key4", datasource_uid=f"{bn.id}__table"))
+    db.session.add(CacheKey(cache_key="cache_keyX", datasource_uid="X__table"))
+    db.session.commit()
+
+    cache_manager.cache.set("cache_key4", "value")
+    cache_manager.cache.set("cache_keyX", "value")
+
+    rv = invalidate(
+        {
+            "databases": [
+                {"database_name": "examples", "schema": "does_not_exist"},
+                {"database_name": "does_not_exist"},
+            ]
+        }
+    )
+    assert rv.status_code == 201
+    assert cache_manager.cache.get("cache_key4") == "value"
+
+    rv = invalidate({"databases": [{"database_name": "examples", "schema": schema}]})
+    assert rv.status_code == 201
+    assert cache_manager.cache.get("cache_key4") is None
+    assert cache_manager.cache.get("cache_keyX") == "value"
+    assert (
+        not db.session.query(CacheKey)
+        .filter(CacheKey.cache_key == "cache_key4")
+        .first()
+    )
+    db.session.query(CacheKey).filter(CacheKey.cache_key == "cache_keyX").delete()
+    db.session.commit()
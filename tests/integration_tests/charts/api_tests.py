@@ -1047,6 +1047,7 @@ class TestChartApi(ApiOwnersTestCaseMixin, InsertChartMixin, SupersetTestCase):
         assert rv.status_code == 200
         expected_result = {
             "cache_timeout": None,
+            "stale_cache_timeout": None,
             "certified_by": None,
             "certification_details": None,
             "dashboards": [],
@@ -98,6 +98,7 @@ class TestExportChartsCommand(SupersetTestCase):
                 "viz_type": "sankey",
             },
             "cache_timeout": None,
+            "stale_cache_timeout": None,
             "dataset_uuid": str(example_chart.table.uuid),
             "uuid": str(example_chart.uuid),
             "version": "1.0.0",
@@ -149,6 +150,7 @@ class TestExportChartsCommand(SupersetTestCase):
             "params",
             "query_context",
             "cache_timeout",
+            "stale_cache_timeout",
             "uuid",
             "version",
             "dataset_uuid",
@@ -64,6 +64,7 @@ from superset.utils.core import (
     ExtraFiltersReasonType,
 )
 from superset.utils import json
+from superset.utils.arrow import arrow_ipc_to_df
 from superset.utils.database import get_example_database, get_main_database
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 
@@ -411,6 +412,33 @@ class TestPostChartDataApi(BaseTestChartDataApi):
         zipfile = ZipFile(BytesIO(rv.data), "r")
         assert zipfile.namelist() == ["query_1.xlsx", "query_2.xlsx"]
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_arrow_result_format(self):
+        """
+        Chart data API: Test chart data with Arrow result format
+        """
+        self.query_context_payload["result_format"] = "arrow"
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        assert rv.mimetype == "application/vnd.apache.arrow.stream"
+        df = arrow_ipc_to_df(rv.data)
+        assert len(df.index) > 0
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_multi_query_arrow_result_format(self):
+        """
+        Chart data API: Test chart data with multi-query Arrow result format
+        """
+        self.query_context_payload["result_format"] = "arrow"
+        self.query_context_payload["queries"].append(
+            self.query_context_payload["queries"][0]
+        )
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        assert rv.mimetype == "application/zip"
+        zipfile = ZipFile(BytesIO(rv.data), "r")
+        assert zipfile.namelist() == ["query_1.arrow", "query_2.arrow"]
+
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_with_csv_result_format_when_actor_not_permitted_for_csv__403(self):
         """
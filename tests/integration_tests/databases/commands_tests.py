@@ -182,6 +182,7 @@ class TestExportDatabasesCommand(SupersetTestCase):
         metadata["columns"].sort(key=lambda x: x["column_name"])
         expected_metadata = {
             "cache_timeout": None,
+            "stale_cache_timeout": None,
             "columns": [
                 {
                     "column_name": "ds",
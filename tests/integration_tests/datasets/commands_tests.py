@@ -95,6 +95,7 @@ class TestExportDatasetsCommand(SupersetTestCase):
 
         assert metadata == {
             "cache_timeout": None,
+            "stale_cache_timeout": None,
             "catalog": None,
             "columns": [
                 {
@@ -225,6 +226,7 @@ class TestExportDatasetsCommand(SupersetTestCase):
             "default_endpoint",
             "offset",
             "cache_timeout",
+            "stale_cache_timeout",
             "catalog",
             "schema",
             "sql",
@@ -130,3 +130,76 @@ def test_codec(
     with cm:
         cache.set(FIRST_KEY, input_)
         assert cache.get(FIRST_KEY) == expected_result
+
+
+def test_many(app_context: AppContext, cache: SupersetMetastoreCache) -> None:
+    cache.delete_many(FIRST_KEY, SECOND_KEY)
+    assert cache.get_many(FIRST_KEY, SECOND_KEY) == [None, None]
+    cache.set(FIRST_KEY, FIRST_KEY_INITIAL_VALUE)
+    assert cache.set_many(
+        {FIRST_KEY: FIRST_KEY_UPDATED_VALUE, SECOND_KEY: SECOND_VALUE}
+    ) == [FIRST_KEY, SECOND_KEY]
+    assert cache.get_many(FIRST_KEY, "missing", SECOND_KEY) == [
+        FIRST_KEY_UPDATED_VALUE,
+        None,
+        SECOND_VALUE,
+    ]
+    cache.delete_many(FIRST_KEY, SECOND_KEY)
+    assert cache.get_many(FIRST_KEY, SECOND_KEY) == [None, None]
+
+
+def test_set_many_invalid_value(app_context: AppContext) -> None:
+    cache = SupersetMetastoreCache(
+        namespace=NAMESPACE,
+        default_timeout=600,
+        codec=JsonKeyValueCodec(),
+    )
+    cache.delete_many(FIRST_KEY, SECOND_KEY)
+    assert cache.set_many({FIRST_KEY: SECOND_VALUE, SECOND_KEY: complex(1, 1)}) == []
+    assert cache.get_many(FIRST_KEY, SECOND_KEY) == [None, None]
+
+
+def test_local_cache(app_context: AppContext) -> None:
+    cache = SupersetMetastoreCache(
+        namespace=NAMESPACE,
+        default_timeout=600,
+        codec=PickleKeyValueCodec(),
+        local_cache_size=10,
+        local_cache_timeout=60,
+    )
+    other_cache = SupersetMetastoreCache(
+        namespace=NAMESPACE,
+        default_timeout=600,
+        codec=PickleKeyValueCodec(),
+    )
+    dttm = datetime(2022, 3, 18, 0, 0, 0)
+
+    with freeze_time(dttm):
+        cache.set(FIRST_KEY, FIRST_KEY_INITIAL_VALUE)
+        other_cache.set(FIRST_KEY, FIRST_KEY_UPDATED_VALUE)
+        # the value written by another worker isn't seen until it's evicted
+        assert cache.get(FIRST_KEY) == FIRST_KEY_INITIAL_VALUE
+        assert cache.get(FIRST_KEY) is not cache.get(FIRST_KEY)
+
+    with freeze_time(dttm + timedelta(seconds=61)):
+        assert cache.get(FIRST_KEY) == FIRST_KEY_UPDATED_VALUE
+        cache.delete(FIRST_KEY)
+        assert cache.get(FIRST_KEY) is None
+
+
+def test_prune(app_context: AppContext, cache: SupersetMetastoreCache) -> None:
+    from superset.commands.key_value.prune import KeyValuePruneCommand
+    from superset.key_value.types import KeyValueResource
+
+    dttm = datetime(2022, 3, 18, 0, 0, 0)
+    with freeze_time(dttm):
+        cache.set_many({f"key{i}": i for i in range(5)}, timeout=60)
+        cache.set(FIRST_KEY, FIRST_KEY_INITIAL_VALUE, timeout=600)
+
+    with freeze_time(dttm + timedelta(seconds=61)):
+        assert (
+            KeyValuePruneCommand(KeyValueResource.METASTORE_CACHE, batch_size=2).run()
+            == 5
+        )
+        assert cache.get(FIRST_KEY) == FIRST_KEY_INITIAL_VALUE
+    cache.delete(FIRST_KEY)
@@ -14,6 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import tracemalloc
 from unittest import mock
 from unittest.mock import Mock, patch
 
@@ -170,21 +171,21 @@ class TestSqlResultExportCommand(SupersetTestCase):
 
     @pytest.mark.usefixtures("create_database_and_query")
     @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
-    @patch("superset.models.core.Database.get_df")
-    def test_run_no_results_backend_select_sql(self, get_df_mock: Mock) -> None:
+    @patch("superset.models.core.Database.iter_df")
+    def test_run_no_results_backend_select_sql(self, iter_df_mock: Mock) -> None:
         command = export.SqlResultExportCommand("test")
 
-        get_df_mock.return_value = pd.DataFrame({"foo": [1, 2, 3]})
+        iter_df_mock.return_value = (df for df in [pd.DataFrame({"foo": [1, 2, 3]})])
         result = command.run()
 
-        assert result["data"] == "foo\n1\n2\n3\n"
-        assert result["count"] == 3
+        assert "".join(result["data"]) == "foo\n1\n2\n3\n"
+        assert command.row_count == 3
         assert result["query"].client_id == "test"
 
     @pytest.mark.usefixtures("create_database_and_query")
     @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
-    @patch("superset.models.core.Database.get_df")
-    def test_run_no_results_backend_executed_sql(self, get_df_mock: Mock) -> None:
+    @patch("superset.models.core.Database.iter_df")
+    def test_run_no_results_backend_executed_sql(self, iter_df_mock: Mock) -> None:
         query_obj = db.session.query(Query).filter_by(client_id="test").one()
         query_obj.executed_sql = "select * from bar limit 2"
         query_obj.select_sql = None
@@ -192,18 +193,18 @@ class TestSqlResultExportCommand(SupersetTestCase):
 
         command = export.SqlResultExportCommand("test")
 
-        get_df_mock.return_value = pd.DataFrame({"foo": [1, 2, 3]})
+        iter_df_mock.return_value = (df for df in [pd.DataFrame({"foo": [1, 2, 3]})])
         result = command.run()
 
-        assert result["data"] == "foo\n1\n2\n"
-        assert result["count"] == 2
+        assert "".join(result["data"]) == "foo\n1\n2\n"
+        assert command.row_count == 2
         assert result["query"].client_id == "test"
 
     @pytest.mark.usefixtures("create_database_and_query")
     @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
-    @patch("superset.models.core.Database.get_df")
+    @patch("superset.models.core.Database.iter_df")
     def test_run_no_results_backend_executed_sql_limiting_factor(
-        self, get_df_mock: Mock
+        self, iter_df_mock: Mock
     ) -> None:
         query_obj = db.session.query(Query).filter_by(results_key="abc_query").one()
         query_obj.executed_sql = "select * from bar limit 2"
@@ -213,14 +214,54 @@ class TestSqlResultExportCommand(SupersetTestCase):
 
         command = export.SqlResultExportCommand("test")
 
-        get_df_mock.return_value = pd.DataFrame({"foo": [1, 2, 3]})
+        iter_df_mock.return_value = (df for df in [pd.DataFrame({"foo": [1, 2, 3]})])
 
         result = command.run()
 
-        assert result["data"] == "foo\n1\n"
-        assert result["count"] == 1
+        assert "".join(result["data"]) == "foo\n1\n"
+        assert command.row_count == 1
         assert result["query"].client_id == "test"
 
+    @pytest.mark.usefixtures("create_database_and_query")
+    @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
+    @patch("superset.models.core.Database.iter_df")
+    def test_run_no_results_backend_streaming(self, iter_df_mock: Mock) -> None:
+        """
+        Test that the rows are fetched before the CSV is streamed, and that only a
+        chunk of the rows and of the CSV is held in memory during the whole export.
+        """
+        chunk_size = 1000
+        num_chunks = 200
+        fetched_chunks = []
+
+        def iter_df(*args, **kwargs):
+            for i in range(num_chunks):
+                fetched_chunks.append(i)
+                yield pd.DataFrame(
+                    {
+                        "id": range(i * chunk_size, (i + 1) * chunk_size),
+                        "name": [f"name_{j}" for j in range(chunk_size)],
+                    }
+                )
+
+        iter_df_mock.side_effect = iter_df
+        command = export.SqlResultExportCommand("test")
+
+        tracemalloc.start()
+        try:
+            result = command.run()
+            assert len(fetched_chunks) == num_chunks
+            size = 0
+            for data in result["data"]:
+                size += len(data)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert command.row_count == chunk_size * num_chunks
+        assert size > 3_000_000
+        assert peak < size / 4
+
     @pytest.mark.usefixtures("create_database_and_query")
     @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
     @patch("superset.commands.sql_lab.export.results_backend_use_msgpack", False)
@@ -240,8 +281,8 @@ class TestSqlResultExportCommand(SupersetTestCase):
 
         result = command.run()
 
-        assert result["data"] == "foo\n0\n1\n2\n3\n4\n"
-        assert result["count"] == 5
+        assert "".join(result["data"]) == "foo\n0\n1\n2\n3\n4\n"
+        assert command.row_count == 5
         assert result["query"].client_id == "test"
 
 
@@ -364,3 +405,24 @@ class TestSqlExecutionResultsCommand(SupersetTestCase):
         assert result.get("status") == "success"
         assert result["query"].get("rows") == 104
         assert result.get("data") == data
+
+    @pytest.mark.usefixtures("create_database_and_query")
+    @patch("superset.commands.sql_lab.results.results_backend_use_msgpack", False)
+    def test_run_succeeds_with_offset(self) -> None:
+        data = [{"col_0": i} for i in range(104)]
+        payload = {
+            "status": QueryStatus.SUCCESS,
+            "query": {"rows": 104},
+            "data": data,
+        }
+        serialized_payload = sql_lab._serialize_payload(payload, False)
+        compressed = utils.zlib_compress(serialized_payload)
+
+        results.results_backend = mock.Mock()
+        results.results_backend.get.return_value = compressed
+
+        command = results.SqlExecutionResultsCommand("abc_query", 10, offset=100)
+        result = command.run()
+
+        assert result["query"].get("rows") == 104
+        assert result.get("data") == data[100:]
@@ -14,9 +14,12 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import threading
+import time
 from unittest import mock
 from unittest.mock import ANY, Mock
 
+import fakeredis
 import redis
 from flask import g
 from jwt import encode
@@ -169,3 +172,158 @@ def test_submit_explore_json_job_as_guest_user(
     )
 
     assert "guest_token" not in job_meta
+
+
+@fixture(params=["RedisCacheBackend", "redis.Redis"])
+def fake_redis_query_manager(async_query_manager, request):
+    if request.param == "RedisCacheBackend":
+        cache = RedisCacheBackend(host="localhost", port=6379)
+        cache._cache = fakeredis.FakeRedis()
+    else:
+        cache = fakeredis.FakeRedis(decode_responses=True)
+
+    async_query_manager._cache = cache
+    async_query_manager._stream_prefix = "async-events-"
+    async_query_manager._stream_limit = 1000
+    async_query_manager._stream_limit_firehose = 1000
+    async_query_manager._long_polling_timeout = 5000
+    return async_query_manager
+
+
+def test_read_events_long_polling(fake_redis_query_manager):
+    job_metadata = fake_redis_query_manager.init_job("test_channel_id", 1)
+
+    def update_job():
+        time.sleep(0.2)
+        fake_redis_query_manager.update_job(job_metadata, "running")
+
+    thread = threading.Thread(target=update_job)
+    thread.start()
+    start = time.monotonic()
+    events = fake_redis_query_manager.read_events("test_channel_id", None)
+    thread.join()
+
+    # the read returned as soon as the event was written
+    assert time.monotonic() - start < 5
+    assert [event["status"] for event in events] == ["running"]
+
+    # events written meanwhile are returned in a single batch
+    fake_redis_query_manager.update_job(job_metadata, "running")
+    fake_redis_query_manager.update_job(job_metadata, "done")
+    events = fake_redis_query_manager.read_events("test_channel_id", events[0]["id"])
+    assert [event["status"] for event in events] == ["running", "done"]
+
+    fake_redis_query_manager._long_polling_timeout = 100
+    assert (
+        fake_redis_query_manager.read_events("test_channel_id", events[1]["id"]) == []
+    )
+
+
+def test_read_events_long_polling_load(fake_redis_query_manager):
+    """
+    Test that concurrent clients each receive the events of their channel, with a
+    read per batch of events rather than per polling interval.
+    """
+    clients = 50
+    reads = [0] * clients
+    received: list[list[str]] = [[] for _ in range(clients)]
+
+    def client(index: int) -> None:
+        last_id = None
+        while "done" not in received[index]:
+            events = fake_redis_query_manager.read_events(f"channel_{index}", last_id)
+            reads[index] += 1
+            if events:
+                last_id = events[-1]["id"]
+                received[index].extend(event["status"] for event in events)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+
+    for index in range(clients):
+        job_metadata = fake_redis_query_manager.init_job(f"channel_{index}", 1)
+        fake_redis_query_manager.update_job(job_metadata, "running")
+        fake_redis_query_manager.update_job(job_metadata, "done")
+
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert received == [["running", "done"]] * clients
+    assert max(reads) <= 2
+
+
+def test_submit_chart_data_job_deduplication(fake_redis_query_manager):
+    fake_redis_query_manager._job_deduplication_timeout = 60
+    job_mock = Mock()
+    fake_redis_query_manager._load_chart_data_into_cache_job = job_mock
+
+    jobs = [
+        fake_redis_query_manager.submit_chart_data_job(
+            channel_id=f"channel_{i}", form_data={}, job_key="job-key"
+        )
+        for i in range(3)
+    ]
+
+    # only the first job runs, the others are attached to it
+    job_mock.delay.assert_called_once_with(jobs[0], {}, job_key="job-key")
+
+    fake_redis_query_manager.update_attached_jobs("job-key", "done", result_url="/a")
+    for i, job in enumerate(jobs[1:], start=1):
+        events = fake_redis_query_manager.read_events(f"channel_{i}", None)
+        assert [(event["job_id"], event["status"]) for event in events] == [
+            (job["job_id"], "done")
+        ]
+
+    # the next identical job runs once the previous one completed
+    job = fake_redis_query_manager.submit_chart_data_job(
+        channel_id="channel_0", form_data={}, job_key="job-key"
+    )
+    job_mock.delay.assert_called_with(job, {}, job_key="job-key")
+    assert job_mock.delay.call_count == 2
+
+
+def test_submit_chart_data_job_deduplication_completed(fake_redis_query_manager):
+    """
+    Test that a job submitted while the identical running job completes runs on its
+    own, unless it was notified.
+    """
+    fake_redis_query_manager._job_deduplication_timeout = 60
+    job_metadata = fake_redis_query_manager.init_job("channel", None)
+
+    assert fake_redis_query_manager._start_job("job-key")
+    fake_redis_query_manager.update_attached_jobs("job-key", "done")
+    assert not fake_redis_query_manager._attach_job("job-key", job_metadata)
+
+    fake_redis_query_manager._long_polling_timeout = 0
+    assert fake_redis_query_manager.read_events("channel", None) == []
+
+
+def test_submit_chart_data_job_deduplication_concurrency(fake_redis_query_manager):
+    """
+    Test that identical jobs submitted concurrently run once.
+    """
+    fake_redis_query_manager._job_deduplication_timeout = 60
+    job_mock = Mock()
+    fake_redis_query_manager._load_chart_data_into_cache_job = job_mock
+
+    def submit(index: int) -> None:
+        fake_redis_query_manager.submit_chart_data_job(
+            channel_id=f"channel_{index}", form_data={}, job_key="job-key"
+        )
+
+    threads = [threading.Thread(target=submit, args=(i,)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert job_mock.delay.call_count == 1
+    fake_redis_query_manager.update_attached_jobs("job-key", "done")
+    fake_redis_query_manager._long_polling_timeout = 0
+    notified = [
+        index
+        for index in range(20)
+        if fake_redis_query_manager.read_events(f"channel_{index}", None)
+    ]
+    assert len(notified) == 19
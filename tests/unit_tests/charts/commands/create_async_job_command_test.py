@@ -0,0 +1,47 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.commands.chart.data.create_async_job_command import (
+    CreateAsyncChartDataJobCommand,
+)
+
+
+@pytest.mark.parametrize("enabled", [False, True])
+def test_run_job_key(mocker: MockerFixture, enabled: bool) -> None:
+    """
+    Test that the key of the job, which computes the cache keys of all the queries,
+    is only computed when job deduplication is enabled.
+    """
+    async_query_manager = mocker.patch(
+        "superset.commands.chart.data.create_async_job_command.async_query_manager",
+        job_deduplication_enabled=enabled,
+    )
+    query_context = Mock(cache_values={}, queries=[Mock()])
+    query_context.query_cache_key.return_value = "query-key"
+
+    command = CreateAsyncChartDataJobCommand()
+    command._async_channel_id = "channel"
+    command.run({}, 1, query_context)
+
+    assert query_context.query_cache_key.called == enabled
+    job_key = async_query_manager.submit_chart_data_job.call_args.kwargs["job_key"]
+    assert (job_key is not None) == enabled
@@ -23,6 +23,7 @@ from sqlalchemy.orm.session import Session
 
 from superset.charts.post_processing import apply_post_process, pivot_df, table
 from superset.common.chart_data import ChartDataResultFormat
+from superset.utils.arrow import arrow_ipc_to_df, df_to_arrow_ipc
 from superset.utils.core import GenericDataType
 
 
@@ -2056,6 +2057,44 @@ COUNT(is_software_dev)
     }
 
 
+def test_apply_post_process_arrow_format():
+    """
+    It should be able to process arrow results
+    """
+
+    result = {
+        "queries": [
+            {
+                "result_format": ChartDataResultFormat.ARROW,
+                "data": df_to_arrow_ipc(
+                    pd.DataFrame({"COUNT(is_software_dev)": [4725]})
+                ),
+            }
+        ]
+    }
+    form_data = {
+        "datasource": "19__table",
+        "viz_type": "pivot_table_v2",
+        "groupbyColumns": [],
+        "groupbyRows": [],
+        "metrics": ["COUNT(is_software_dev)"],
+        "metricsLayout": "COLUMNS",
+        "aggregateFunction": "Sum",
+        "rowOrder": "key_a_to_z",
+        "colOrder": "key_a_to_z",
+    }
+
+    processed = apply_post_process(result, form_data)["queries"][0]
+
+    assert processed["colnames"] == [("COUNT(is_software_dev)",)]
+    assert processed["indexnames"] == [("Total (Sum)",)]
+    assert processed["coltypes"] == [GenericDataType.NUMERIC]
+    assert processed["rowcount"] == 1
+    assert arrow_ipc_to_df(processed["data"]).to_dict(orient="records") == [
+        {"index": "Total (Sum)", "COUNT(is_software_dev)": 4725}
+    ]
+
+
 def test_apply_post_process_csv_format_empty_string():
     """
     It should be able to process csv results with no data
@@ -0,0 +1,119 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+from flask import Flask
+from flask_caching import Cache
+from pytest_mock import MockerFixture
+
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
+from superset.key_value.types import ArrowKeyValueCodec
+from superset.models.helpers import QueryResult
+
+
+@pytest.fixture
+def cache(mocker: MockerFixture, app: Flask) -> Cache:
+    cache = Cache()
+    cache.init_app(app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+    return cache
+
+
+def set_query_result(df: pd.DataFrame) -> None:
+    QueryCacheManager().set_query_result(
+        key="key",
+        query_result=QueryResult(df=df, query="SELECT 1", duration=timedelta(0)),
+        timeout=60,
+        region=CacheRegion.DATA,
+    )
+
+
+def test_codec(mocker: MockerFixture, cache: Cache) -> None:
+    """
+    Test that the results are encoded with the codec set, and that the results
+    encoded without codec are still read.
+    """
+    df = pd.DataFrame({"name": ["foo", "bar"], "num": [1, 2]})
+
+    set_query_result(df)
+    assert isinstance(cache.get("key"), dict)
+
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager.config",
+        {"DATA_CACHE_CODEC": ArrowKeyValueCodec()},
+    )
+    query_cache = QueryCacheManager.get("key", region=CacheRegion.DATA)
+    assert query_cache.is_loaded
+    pd.testing.assert_frame_equal(query_cache.df, df)
+
+    set_query_result(df)
+    assert cache.get("key").startswith(ArrowKeyValueCodec.MAGIC)
+    query_cache = QueryCacheManager.get("key", region=CacheRegion.DATA)
+    assert query_cache.is_loaded
+    assert query_cache.query == "SELECT 1"
+    pd.testing.assert_frame_equal(query_cache.df, df)
+
+    cache.set("key", ArrowKeyValueCodec.MAGIC + b"corrupted")
+    assert not QueryCacheManager.get("key", region=CacheRegion.DATA).is_loaded
+
+
+def test_l1_cache(mocker: MockerFixture, cache: Cache) -> None:
+    """
+    Test that the results are read from the worker-local cache, as long as their
+    version is the current one.
+    """
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager.config",
+        {"DATA_CACHE_L1_SIZE_MB": 1},
+    )
+    mocker.patch("superset.common.utils.query_cache_manager._l1_cache", None)
+    stats_logger = mocker.patch(
+        "superset.common.utils.query_cache_manager.stats_logger"
+    )
+    get_value = mocker.spy(QueryCacheManager, "_get_value")
+    df = pd.DataFrame({"name": ["foo", "bar"], "num": [1, 2]})
+
+    set_query_result(df)
+    for _ in range(3):
+        query_cache = QueryCacheManager.get("key", region=CacheRegion.DATA)
+        pd.testing.assert_frame_equal(query_cache.df, df)
+        # the cached results are copied
+        query_cache.df["num"] = 0
+    assert get_value.call_count == 1
+    assert [call.args[0] for call in stats_logger.incr.call_args_list].count(
+        "data_cache.l1.hit"
+    ) == 2
+
+    # the results are forced to refresh, by this worker or another one
+    assert not QueryCacheManager.get(
+        "key", region=CacheRegion.DATA, force_query=True
+    ).is_loaded
+    df = pd.DataFrame({"name": ["foo", "bar"], "num": [3, 4]})
+    set_query_result(df)
+    pd.testing.assert_frame_equal(
+        QueryCacheManager.get("key", region=CacheRegion.DATA).df, df
+    )
+    assert get_value.call_count == 2
+
+    QueryCacheManager.delete("key", region=CacheRegion.DATA)
+    assert not QueryCacheManager.get("key", region=CacheRegion.DATA).is_loaded
@@ -0,0 +1,312 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import time
+from datetime import timedelta
+from pathlib import Path
+from threading import Barrier, get_ident, Thread
+from typing import Any
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+from flask import Flask
+from flask_caching import Cache
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.query_context import QueryContext
+from superset.common.query_context_processor import QueryContextProcessor
+from superset.constants import CacheRegion
+from superset.models.helpers import QueryResult
+
+
+def make_processor(queries: list[Any]) -> QueryContextProcessor:
+    return QueryContextProcessor(
+        QueryContext(
+            datasource=Mock(),
+            queries=queries,
+            result_type=ChartDataResultType.FULL,
+            form_data={},
+            slice_=None,
+            result_format=ChartDataResultFormat.JSON,
+            cache_values={},
+        )
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_get_payload_keeps_query_order(
+    mocker: MockerFixture,
+    max_workers: int,
+) -> None:
+    """
+    Test that the payloads are returned in the same order as the query objects,
+    regardless of the execution mode.
+    """
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"CHART_DATA_QUERIES_MAX_WORKERS": max_workers},
+    )
+    stats_logger = mocker.patch("superset.common.query_context_processor.stats_logger")
+    threads: set[int] = set()
+    barrier = Barrier(3 if max_workers > 1 else 1, timeout=5)
+
+    def get_query_results(
+        result_type: Any,
+        query_context: Any,
+        query_obj: Any,
+        force_cached: bool,
+    ) -> dict[str, Any]:
+        threads.add(get_ident())
+        barrier.wait()
+        return {"name": query_obj.name}
+
+    mocker.patch(
+        "superset.common.query_context_processor.get_query_results",
+        side_effect=get_query_results,
+    )
+    queries = [Mock(result_type=None) for _ in range(3)]
+    for i, query in enumerate(queries):
+        query.name = f"query {i}"
+
+    payload = make_processor(queries).get_payload()
+
+    assert payload == {
+        "queries": [{"name": "query 0"}, {"name": "query 1"}, {"name": "query 2"}]
+    }
+    mode = "concurrent" if max_workers > 1 else "sequential"
+    assert stats_logger.timing.call_args[0][0] == f"chart_data.get_payload.{mode}"
+    assert (len(threads) == 3) == (max_workers > 1)
+
+
+def test_get_df_payload_single_flight(
+    mocker: MockerFixture,
+    app: Flask,
+    tmp_path: Path,
+) -> None:
+    """
+    Test that concurrent requests missing the data cache for the same query run it
+    once, the others reading its result from the cache.
+    """
+    from superset.key_value.models import KeyValueEntry
+
+    # the lock is shared through a database all the threads can see
+    engine = create_engine(f"sqlite:///{tmp_path / 'superset.db'}")
+    KeyValueEntry.__table__.create(engine)
+    mocker.patch("superset.db.session", scoped_session(sessionmaker(bind=engine)))
+    cache = Cache()
+    cache.init_app(app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"DATA_CACHE_SINGLE_FLIGHT_TIMEOUT": 10},
+    )
+    mocker.patch.object(QueryContextProcessor, "query_cache_key", return_value="key")
+    mocker.patch.object(QueryContextProcessor, "get_cache_timeout", return_value=60)
+    mocker.patch.object(
+        QueryContextProcessor, "_get_stale_cache_timeout", return_value=0
+    )
+    mocker.patch.object(QueryContextProcessor, "get_annotation_data", return_value={})
+
+    def get_query_result(query_obj: Any) -> QueryResult:
+        time.sleep(0.5)
+        return QueryResult(
+            df=pd.DataFrame({"a": [1, 2]}),
+            query="SELECT a FROM t",
+            duration=timedelta(0),
+        )
+
+    get_query_result_mock = mocker.patch.object(
+        QueryContextProcessor,
+        "get_query_result",
+        side_effect=get_query_result,
+    )
+    query_obj = Mock(columns=[], metrics=[], from_dttm=None, to_dttm=None)
+    payloads: list[dict[str, Any]] = []
+
+    def request() -> None:
+        with app.app_context():
+            payloads.append(make_processor([query_obj]).get_df_payload(query_obj))
+
+    threads = [Thread(target=request) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert get_query_result_mock.call_count == 1
+    assert len(payloads) == 5
+    assert [payload["is_cached"] for payload in payloads].count(True) == 4
+    assert all(payload["df"]["a"].tolist() == [1, 2] for payload in payloads)
+
+
+def test_get_df_payload_stale(mocker: MockerFixture, app: Flask) -> None:
+    """
+    Test that expired results are returned as stale during the stale timeout, while
+    they're refreshed in the background once.
+    """
+    cache = Cache()
+    cache.init_app(app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+    mocker.patch.object(QueryContextProcessor, "query_cache_key", return_value="key")
+    mocker.patch.object(QueryContextProcessor, "get_cache_timeout", return_value=60)
+    mocker.patch.object(
+        QueryContextProcessor, "_get_stale_cache_timeout", return_value=600
+    )
+    mocker.patch.object(QueryContextProcessor, "get_annotation_data", return_value={})
+    get_query_result = mocker.patch.object(
+        QueryContextProcessor,
+        "get_query_result",
+        return_value=QueryResult(
+            df=pd.DataFrame({"a": [1, 2]}),
+            query="SELECT a FROM t",
+            duration=timedelta(0),
+        ),
+    )
+    refresh = mocker.patch("superset.tasks.async_queries.refresh_chart_data_cache")
+    query_obj = Mock(columns=[], metrics=[], from_dttm=None, to_dttm=None)
+
+    with freeze_time("2024-01-01 00:00:00"):
+        payload = make_processor([query_obj]).get_df_payload(query_obj)
+        assert payload["is_stale"] is None
+        payload = make_processor([query_obj]).get_df_payload(query_obj)
+        assert payload["is_cached"] is True
+        assert payload["is_stale"] is False
+    refresh.delay.assert_not_called()
+
+    with freeze_time("2024-01-01 00:02:00"):
+        for _ in range(2):
+            payload = make_processor([query_obj]).get_df_payload(query_obj)
+            assert payload["is_cached"] is True
+            assert payload["is_stale"] is True
+            assert payload["df"]["a"].tolist() == [1, 2]
+    refresh.delay.assert_called_once_with(
+        {"user_id": None},
+        {"form_data": {}, "custom_cache_timeout": None},
+        0,
+        "key",
+    )
+
+    with freeze_time("2024-01-01 00:12:00"):
+        payload = make_processor([query_obj]).get_df_payload(query_obj)
+        assert payload["is_cached"] is None
+    assert get_query_result.call_count == 2
+
+
+def test_get_query_result_incremental_refresh(
+    mocker: MockerFixture,
+    app: Flask,
+) -> None:
+    """
+    Test that the time series of the datasets set to be refreshed incrementally
+    query only their latest time grains, merged with the kept result.
+    """
+    from datetime import datetime
+
+    from superset.common.query_object import QueryObject
+
+    cache = Cache()
+    cache.init_app(app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+    mocker.patch.object(QueryContextProcessor, "query_cache_key", return_value="key")
+    mocker.patch.object(
+        QueryContextProcessor, "normalize_df", side_effect=lambda df, _: df
+    )
+    query_datasource = mocker.patch.object(
+        QueryContextProcessor,
+        "query_datasource",
+        side_effect=[
+            QueryResult(
+                df=pd.DataFrame(
+                    {"ds": pd.date_range("2024-01-01", periods=3), "sum": [1, 2, 3]}
+                ),
+                query="SELECT ds, sum FROM t",
+                duration=timedelta(0),
+            ),
+            QueryResult(
+                df=pd.DataFrame(
+                    {"ds": pd.date_range("2024-01-02", periods=3), "sum": [20, 30, 4]}
+                ),
+                query="SELECT ds, sum FROM t WHERE ds >= '2024-01-02'",
+                duration=timedelta(0),
+            ),
+        ],
+    )
+    processor = make_processor([])
+    processor._qc_datasource = Mock(
+        extra_dict={"incremental_refresh_grains": 2},
+        column_names=["ds"],
+        uid="1__table",
+    )
+
+    def query_object(to_dttm: datetime) -> QueryObject:
+        return QueryObject(
+            columns=[
+                {
+                    "label": "ds",
+                    "sqlExpression": "ds",
+                    "columnType": "BASE_AXIS",
+                    "timeGrain": "P1D",
+                }
+            ],
+            metrics=["sum"],
+            filters=[
+                {"col": "ds", "op": "TEMPORAL_RANGE", "val": "2024-01-01 : today"}
+            ],
+            row_limit=100,
+            from_dttm=datetime(2024, 1, 1),
+            to_dttm=to_dttm,
+        )
+
+    result = processor.get_query_result(query_object(datetime(2024, 1, 4)))
+    assert result.df["sum"].tolist() == [1, 2, 3]
+
+    result = processor.get_query_result(query_object(datetime(2024, 1, 5)))
+    assert result.df["ds"].tolist() == list(pd.date_range("2024-01-01", periods=4))
+    assert result.df["sum"].tolist() == [1, 20, 30, 4]
+    assert query_datasource.call_args[0][0]["filter"] == [
+        {
+            "col": "ds",
+            "op": "TEMPORAL_RANGE",
+            "val": "2024-01-02 00:00:00 : 2024-01-05 00:00:00",
+            "grain": "P1D",
+        }
+    ]
+
+    # the kept result doesn't cover the beginning of the time range
+    query_datasource.side_effect = None
+    query_datasource.return_value = QueryResult(
+        df=pd.DataFrame({"ds": [], "sum": []}),
+        query="SELECT ds, sum FROM t",
+        duration=timedelta(0),
+    )
+    query_obj = query_object(datetime(2024, 1, 5))
+    query_obj.from_dttm = datetime(2023, 12, 1)
+    processor.get_query_result(query_obj)
+    assert query_datasource.call_args[0][0]["filter"] == query_obj.filter
@@ -14,13 +14,19 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from threading import Barrier
+from typing import Any
+from unittest.mock import Mock
+
 from pandas import DataFrame, Series, Timestamp
 from pandas.testing import assert_frame_equal
 from pytest import fixture, mark
+from pytest_mock import MockerFixture
 
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.query_context import QueryContext
 from superset.common.query_context_processor import QueryContextProcessor
+from superset.common.query_object import QueryObject
 from superset.connectors.sqla.models import BaseDatasource
 from superset.constants import TimeGrain
 
@@ -185,3 +191,99 @@ def test_join_offset_dfs_with_month_granularity():
     )
 
     assert_frame_equal(expected, result)
+
+
+def test_run_time_offset_queries_concurrently(mocker: MockerFixture) -> None:
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"TIME_OFFSET_QUERIES_MAX_WORKERS": 4},
+    )
+    datasource = Mock()
+    datasource.database.id = 1
+    barrier = Barrier(3, timeout=5)
+
+    def query(query_obj: dict[str, Any]) -> Mock:
+        # all the offset queries must be in flight at the same time
+        barrier.wait()
+        return Mock(query=query_obj["name"])
+
+    datasource.query.side_effect = query
+    processor = QueryContextProcessor(
+        QueryContext(
+            datasource=datasource,
+            queries=[],
+            result_type=ChartDataResultType.FULL,
+            form_data={},
+            slice_=None,
+            result_format=ChartDataResultFormat.JSON,
+            cache_values={},
+        )
+    )
+
+    results = processor._run_time_offset_queries(
+        [{"name": "1 week ago"}, {"name": "1 year ago"}, {"name": "inherit"}]
+    )
+
+    assert [result.query for result in results] == [
+        "1 week ago",
+        "1 year ago",
+        "inherit",
+    ]
+
+
+def test_processing_time_offsets_keeps_order(mocker: MockerFixture) -> None:
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"TIME_OFFSET_QUERIES_MAX_WORKERS": 4},
+    )
+    datasource = Mock(offset=0)
+    datasource.get_column.return_value = None
+    datasource.query.side_effect = lambda query_obj: Mock(
+        query=f"SELECT {query_obj['from_dttm'].year}",
+        df=DataFrame(),
+    )
+    processor = QueryContextProcessor(
+        QueryContext(
+            datasource=datasource,
+            queries=[],
+            result_type=ChartDataResultType.FULL,
+            form_data={},
+            slice_=None,
+            result_format=ChartDataResultFormat.JSON,
+            cache_values={},
+        )
+    )
+    mocker.patch.object(
+        processor,
+        "query_cache_key",
+        side_effect=lambda query_obj, time_offset, **kwargs: time_offset,
+    )
+    cached = Mock(
+        is_loaded=True,
+        query="SELECT cached",
+        df=DataFrame({"ds": ["2020"], "B": [1]}),
+    )
+    mocker.patch(
+        "superset.common.query_context_processor.QueryCacheManager.get",
+        side_effect=lambda key, *args: (
+            cached if key == "2 years ago" else Mock(is_loaded=False)
+        ),
+    )
+    query_object = QueryObject(
+        metrics=["count"],
+        time_range="2020-01-01 : 2021-01-01",
+        time_offsets=["1 year ago", "2 years ago", "3 years ago"],
+    )
+    df = DataFrame({"ds": ["2020"], "count": [1]})
+
+    result = processor.processing_time_offsets(df, query_object)
+
+    assert result["queries"] == ["SELECT 2019", "SELECT cached", "SELECT 2017"]
+    assert result["cache_keys"] == [None, "2 years ago", None]
+    assert list(result["df"].columns) == [
+        "ds",
+        "count",
+        "count__1 year ago",
+        "B",
+        "count__3 years ago",
+    ]
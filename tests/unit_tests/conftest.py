@@ -61,6 +61,7 @@ def get_session(mocker: MockerFixture) -> Callable[[], Session]:
         get_session.get_bind.return_value = engine
         # Allow for queries on security manager
         get_session.query = in_memory_session.query
+        get_session.info = in_memory_session.info
 
         mocker.patch("superset.db.session", in_memory_session)
         return in_memory_session
@@ -366,6 +366,46 @@ def test_upsert_missing_entry(
     assert JSON_CODEC.decode(entry.value) == NEW_VALUE
 
 
+def test_upsert_entries(
+    app_context: AppContext,
+    key_value_entry: KeyValueEntry,  # noqa: F811
+    admin_user: User,  # noqa: F811
+    after_each: None,  # noqa: F811
+) -> None:
+    from superset.daos.key_value import KeyValueDAO
+
+    new_key = UUID("9dd4f1f9-2a4b-4cda-a3b8-d4bd1c4e5b9f")
+    with override_user(admin_user):
+        entries = KeyValueDAO.upsert_entries(
+            resource=RESOURCE,
+            values={UUID_KEY: NEW_VALUE, new_key: JSON_VALUE},
+            codec=JSON_CODEC,
+        )
+        db.session.flush()
+        assert [entry.uuid for entry in entries] == [UUID_KEY, new_key]
+        assert entries[0].id == ID_KEY
+        assert entries[0].changed_by_fk == admin_user.id
+        assert entries[1].created_by_fk == admin_user.id
+        assert {
+            entry.uuid: JSON_CODEC.decode(entry.value)
+            for entry in KeyValueDAO.get_entries(RESOURCE, [UUID_KEY, new_key])
+        } == {UUID_KEY: NEW_VALUE, new_key: JSON_VALUE}
+
+
+def test_upsert_entries_invalid_value(
+    app_context: AppContext,
+    after_each: None,  # noqa: F811
+) -> None:
+    from superset.daos.key_value import KeyValueDAO
+
+    with pytest.raises(KeyValueCreateFailedError):
+        KeyValueDAO.upsert_entries(
+            resource=RESOURCE,
+            values={UUID_KEY: PICKLE_VALUE},
+            codec=JSON_CODEC,
+        )
+
+
 def test_delete_id_entry(
     app_context: AppContext,
     key_value_entry: KeyValueEntry,
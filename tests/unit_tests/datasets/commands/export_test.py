@@ -111,6 +111,7 @@ description: This is the description
 default_endpoint: null
 offset: -8
 cache_timeout: 3600
+stale_cache_timeout: null
 catalog: public
 schema: my_schema
 sql: null
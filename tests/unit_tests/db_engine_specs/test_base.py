@@ -380,3 +380,76 @@ def test_unmask_encrypted_extra() -> None:
             },
         }
     )
+
+
+def test_fetch_data_chunks(mocker: MockerFixture) -> None:
+    """
+    Test that results are fetched in chunks, going through `fetch_data`.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    rows = [(i,) for i in range(5)]
+    cursor = mocker.MagicMock()
+    cursor.fetchmany.side_effect = lambda size: [rows.pop(0) for _ in rows[:size]]
+    fetch_data = mocker.spy(BaseEngineSpec, "fetch_data")
+
+    chunks = list(BaseEngineSpec.fetch_data_chunks(cursor, 2))
+
+    assert chunks == [[(0,), (1,)], [(2,), (3,)], [(4,)]]
+    assert fetch_data.call_count == 3
+    cursor.fetchall.assert_not_called()
+
+
+def test_fetch_data_column_type_mutators(mocker: MockerFixture) -> None:
+    """
+    Test that column type mutators are applied to every column of their type.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec, ColumnarRows
+    from superset.result_set import SupersetResultSet
+
+    class MutatingEngineSpec(BaseEngineSpec):
+        column_type_mutators = {types.Integer: lambda value: value * 10}
+
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "INTEGER"), ("b", "VARCHAR"), ("a", "INTEGER")]
+    cursor.fetchall.return_value = [(1, "x", 2), (3, "y", 0)]
+
+    data = MutatingEngineSpec.fetch_data(cursor)
+    assert data == [(10, "x", 20), (30, "y", 0)]
+    assert len(data) == 2
+    assert data[1] == (30, "y", 0)
+    assert data[-1:] == [(30, "y", 0)]
+
+    # the columns are handed to the result set as is
+    assert isinstance(data, ColumnarRows)
+    assert data.columns == [[10, 30], ("x", "y"), [20, 0]]
+    result_set = SupersetResultSet(data, cursor.description, MutatingEngineSpec)
+    assert result_set.to_pandas_df().to_dict("list") == {
+        "a": [10, 30],
+        "b": ["x", "y"],
+        "a__1": [20, 0],
+    }
+
+    cursor.fetchall.return_value = []
+    assert MutatingEngineSpec.fetch_data(cursor) == []
+
+
+def test_fetch_data_chunks_limit(mocker: MockerFixture) -> None:
+    """
+    Test that fetching results in chunks stops once the limit is reached.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    rows = [(i,) for i in range(10)]
+    cursor = mocker.MagicMock()
+    cursor.fetchmany.side_effect = lambda size: [rows.pop(0) for _ in rows[:size]]
+
+    chunks = list(BaseEngineSpec.fetch_data_chunks(cursor, 2, limit=5))
+
+    assert chunks == [[(0,), (1,)], [(2,), (3,)], [(4,)]]
+    assert [call.args for call in cursor.fetchmany.call_args_list] == [
+        (2,),
+        (2,),
+        (1,),
+    ]
+    assert rows == [(i,) for i in range(5, 10)]
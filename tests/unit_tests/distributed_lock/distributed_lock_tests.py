@@ -17,15 +17,18 @@
 
 # pylint: disable=invalid-name
 
+from pathlib import Path
 from typing import Any
 from uuid import UUID
 
 import pytest
 from freezegun import freeze_time
-from sqlalchemy.orm import Session, sessionmaker
+from pytest_mock import MockerFixture
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, Session, sessionmaker
 
 from superset import db
-from superset.distributed_lock import KeyValueDistributedLock
+from superset.distributed_lock import KeyValueDistributedLock, SingleFlight
 from superset.distributed_lock.types import LockValue
 from superset.distributed_lock.utils import get_key
 from superset.exceptions import CreateKeyValueDistributedLockFailedException
@@ -99,3 +102,63 @@ def test_key_value_distributed_lock_expired() -> None:
                 assert _get_lock(MAIN_KEY, session) is None
 
         assert _get_lock(MAIN_KEY, session) is None
+
+
+def test_single_flight() -> None:
+    """
+    Test that the single flight lock is released after the block, even if it raises,
+    and that the block runs without the lock once the wait times out.
+    """
+    session = _get_other_session()
+
+    with freeze_time("2021-01-01"):
+        with SingleFlight("ns", 10, a=1, b=2) as waited:
+            assert waited is False
+            assert _get_lock(MAIN_KEY, session)["value"] is True
+            # the lock expires after the timeout
+            with freeze_time("2021-01-01 00:00:10"):
+                assert _get_lock(MAIN_KEY, session) is None
+        assert _get_lock(MAIN_KEY, session) is None
+
+    with pytest.raises(ValueError):
+        with SingleFlight("ns", 10, a=1, b=2):
+            raise ValueError()
+    assert _get_lock(MAIN_KEY, session) is None
+
+    with KeyValueDistributedLock("ns", a=1, b=2):
+        with SingleFlight("ns", 0, a=1, b=2) as waited:
+            assert waited is True
+        assert _get_lock(MAIN_KEY, session) == LOCK_VALUE
+
+
+def test_single_flight_other_caller(mocker: MockerFixture, tmp_path: Path) -> None:
+    """
+    Test that waiting for the single flight lock doesn't touch the transaction of the
+    caller, and that an expired lock, acquired by another caller since, isn't
+    released by the caller which held it first.
+    """
+    from superset.key_value.models import KeyValueEntry
+
+    # the lock is shared through a database all the sessions can see
+    engine = create_engine(f"sqlite:///{tmp_path / 'superset.db'}")
+    KeyValueEntry.__table__.create(engine)
+    mocker.patch.object(db, "session", scoped_session(sessionmaker(bind=engine)))
+    mocker.patch("superset.distributed_lock.SINGLE_FLIGHT_POLL_INTERVAL", 0.01)
+    other_session = sessionmaker(bind=engine)()
+    other_lock_value = {"value": True, "owner": "other"}
+
+    entry = KeyValueEntry(resource="app", value=b"{}")
+    db.session.add(entry)
+
+    with SingleFlight("ns", 10, a=1, b=2) as waited:
+        assert waited is False
+        with SingleFlight("ns", 0.05, a=1, b=2) as waited:
+            assert waited is True
+
+        # the lock expires, and is acquired by another caller
+        lock = other_session.query(KeyValueEntry).filter_by(uuid=MAIN_KEY).one()
+        lock.value = JsonKeyValueCodec().encode(other_lock_value)
+        other_session.commit()
+
+    assert entry in db.session.new
+    assert _get_lock(MAIN_KEY, other_session) == other_lock_value
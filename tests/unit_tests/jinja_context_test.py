@@ -32,7 +32,9 @@ from superset.exceptions import SupersetTemplateException
 from superset.jinja_context import (
     dataset_macro,
     ExtraCache,
+    JinjaTemplateProcessor,
     metric_macro,
+    PrestoTemplateProcessor,
     safe_proxy,
     TimeFilter,
     WhereInMacro,
@@ -1118,3 +1120,81 @@ def test_get_time_filter(
         assert cache.get_time_filter(*args, **kwargs) == time_filter, description
         assert cache.removed_filters == removed_filters
         assert cache.applied_filters == applied_filters
+
+
+def test_process_template_compiled_once(mocker: MockerFixture) -> None:
+    """
+    Test that templates are compiled once per processor class and source.
+    """
+    database = Database(database_name="my_database", sqlalchemy_uri="sqlite://")
+    processor = JinjaTemplateProcessor(database=database)
+    compile_ = mocker.spy(processor.env, "compile")
+    sql = "SELECT '{{ 1 + 1 }}' AS two"
+
+    assert processor.process_template(sql) == "SELECT '2' AS two"
+    assert processor.process_template(sql) == "SELECT '2' AS two"
+    assert JinjaTemplateProcessor(database=database).process_template(sql) == (
+        "SELECT '2' AS two"
+    )
+    assert compile_.call_count == 1
+
+    # the environments of other processors may differ
+    presto = PrestoTemplateProcessor(database=database)
+    compile_ = mocker.spy(presto.env, "compile")
+    assert presto.process_template(sql) == "SELECT '2' AS two"
+    assert compile_.call_count == 1
+
+
+def test_macros_memoized_in_request(mocker: MockerFixture) -> None:
+    """
+    Test that the dataset of the ``dataset`` and ``metric`` macros is looked up once
+    per request and arguments.
+    """
+    DatasetDAO = mocker.patch("superset.daos.dataset.DatasetDAO")
+    DatasetDAO.find_by_id().get_query_str_extended().sql = "SELECT 1"
+    DatasetDAO.find_by_id().metrics = [
+        SqlMetric(metric_name="count", expression="COUNT(*)"),
+    ]
+    DatasetDAO.find_by_id.reset_mock()
+
+    with app.test_request_context():
+        for _ in range(2):
+            assert dataset_macro(1, columns=["ds"]) == "(\nSELECT 1\n) AS dataset_1"
+            assert metric_macro("count", 1) == "COUNT(*)"
+        assert DatasetDAO.find_by_id.call_count == 2
+
+        dataset_macro(1, columns=["ds", "name"])
+        assert DatasetDAO.find_by_id.call_count == 3
+
+    with app.test_request_context():
+        dataset_macro(1, columns=["ds"])
+        assert DatasetDAO.find_by_id.call_count == 4
+
+
+def test_filter_values_form_data_parsed_once(mocker: MockerFixture) -> None:
+    """
+    Test that the form data is parsed once for all the filters of a template.
+    """
+    get_form_data = mocker.patch(
+        "superset.views.utils.get_form_data",
+        return_value=(
+            {
+                "adhoc_filters": [
+                    {
+                        "clause": "WHERE",
+                        "comparator": "foo",
+                        "expressionType": "SIMPLE",
+                        "operator": "in",
+                        "subject": "name",
+                    }
+                ],
+            },
+            None,
+        ),
+    )
+    cache = ExtraCache()
+
+    assert cache.filter_values("name") == ["foo"]
+    assert cache.filter_values("gender") == []
+    assert cache.get_filters("name") == [{"op": "IN", "col": "name", "val": ["foo"]}]
+    get_form_data.assert_called_once()
@@ -14,15 +14,23 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import pickle
 from contextlib import nullcontext
+from datetime import date, datetime
+from decimal import Decimal
 from typing import Any
 
+import pandas as pd
 import pytest
 from marshmallow import Schema
 
 from superset.dashboards.permalink.schemas import DashboardPermalinkSchema
-from superset.key_value.exceptions import KeyValueCodecEncodeException
+from superset.key_value.exceptions import (
+    KeyValueCodecDecodeException,
+    KeyValueCodecEncodeException,
+)
 from superset.key_value.types import (
+    ArrowKeyValueCodec,
     JsonKeyValueCodec,
     MarshmallowKeyValueCodec,
     PickleKeyValueCodec,
@@ -120,3 +128,65 @@ def test_pickle_codec(input_: Any, expected_result: Any):
     codec = PickleKeyValueCodec()
     encoded_value = codec.encode(input_)
     assert expected_result == codec.decode(encoded_value)
+
+
+@pytest.mark.parametrize(
+    "df,values,is_arrow",
+    [
+        (
+            pd.DataFrame(
+                {
+                    "ds": [datetime(2020, 1, 1), datetime(2021, 1, 1), None],
+                    "name": ["foo", None, "bar"],
+                    "num": [1, 2, 3],
+                    "avg": [1.5, None, 2.5],
+                    "price": [Decimal("1.10"), None, Decimal("2.20")],
+                    "day": [date(2020, 1, 1), date(2021, 1, 1), None],
+                    "empty": [None, None, None],
+                }
+            ),
+            {"query": "SELECT 1", "annotation_data": {"foo": [1, 2]}},
+            True,
+        ),
+        # ints would be loaded as floats, because of the null
+        (pd.DataFrame({"num": [1, None, 3]}, dtype=object), {}, False),
+        # lists would be loaded as arrays
+        (pd.DataFrame({"tags": [["a", "b"], [], None]}), {}, False),
+        (pd.DataFrame({"name": ["foo", "bar"]}, index=["a", "b"]), {}, False),
+        (pd.DataFrame([[1, 2]], columns=["a", "a"]), {}, False),
+        (pd.DataFrame({1: [1, 2]}), {}, False),
+        # tuples would be loaded as lists
+        (pd.DataFrame({"name": ["foo"]}), {"filters": ("a", "b")}, False),
+        (pd.DataFrame({"name": ["foo"]}), {"dttm": datetime(2020, 1, 1)}, False),
+    ],
+)
+def test_arrow_codec(df: pd.DataFrame, values: dict[str, Any], is_arrow: bool):
+    codec = ArrowKeyValueCodec()
+    encoded_value = codec.encode({"df": df, **values})
+    assert encoded_value.startswith(ArrowKeyValueCodec.MAGIC) == is_arrow
+
+    decoded_value = codec.decode(encoded_value)
+    pd.testing.assert_frame_equal(decoded_value.pop("df"), df)
+    assert decoded_value == values
+
+
+def test_arrow_codec_decode_error():
+    codec = ArrowKeyValueCodec()
+    encoded_value = codec.encode({"df": pd.DataFrame({"name": ["foo"]})})
+
+    with pytest.raises(KeyValueCodecDecodeException):
+        codec.decode(encoded_value[:-10])
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        b"corrupted",
+        pickle.dumps({"name": "foo"})[:-5],
+    ],
+)
+def test_arrow_codec_decode_pickle_error(value: bytes):
+    codec = ArrowKeyValueCodec()
+
+    with pytest.raises(KeyValueCodecDecodeException):
+        codec.decode(value)
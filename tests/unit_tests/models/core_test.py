@@ -27,7 +27,11 @@ from sqlalchemy.orm.session import Session
 
 from superset.connectors.sqla.models import SqlaTable, TableColumn
 from superset.errors import SupersetErrorType
-from superset.exceptions import OAuth2Error, OAuth2RedirectError
+from superset.exceptions import (
+    OAuth2Error,
+    OAuth2RedirectError,
+    SupersetGenericDBErrorException,
+)
 from superset.models.core import Database
 from superset.sql_parse import Table
 from superset.utils import json
@@ -606,6 +610,21 @@ def test_engine_context_manager(mocker: MockerFixture) -> None:
     )
 
 
+def test_get_df_no_statements(mocker: MockerFixture) -> None:
+    """
+    Test that running a SQL script without statements raises an error, instead of
+    failing to return a cursor.
+    """
+    get_raw_connection = mocker.patch.object(Database, "get_raw_connection")
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+
+    with pytest.raises(SupersetGenericDBErrorException):
+        database.get_df("")
+    with pytest.raises(SupersetGenericDBErrorException):
+        next(database.iter_df(""))
+    get_raw_connection.assert_not_called()
+
+
 def test_purge_oauth2_tokens(session: Session) -> None:
     """
     Test the `purge_oauth2_tokens` method.
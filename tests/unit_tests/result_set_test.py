@@ -18,6 +18,8 @@
 # pylint: disable=import-outside-toplevel, unused-argument
 
 from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import UUID
 
 import numpy as np
 import pandas as pd
@@ -164,3 +166,96 @@ def test_timezone_series(mocker: MockerFixture) -> None:
         [pd.Timestamp("2023-01-01 00:00:00+0000", tz="UTC")]
     ]
     logger.exception.assert_not_called()
+
+
+def test_stringify_values_mixed_types():
+    """
+    Test that values are stringified as they were one cell at a time: sequences are
+    serialized to JSON, and everything else is cast to string by numpy.
+    """
+    values = [
+        [1, 2],
+        ("a", "b"),
+        [{"a": [1, None]}],
+        np.array([1, 2]),
+        [],
+        {"a": 1},
+        "ü",
+        1,
+        1.5,
+        True,
+        Decimal("1.1"),
+        datetime(2020, 1, 1),
+        b"ab",
+        UUID(int=1),
+        None,
+        pd.NA,
+        pd.NaT,
+        float("nan"),
+    ]
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+
+    assert stringify_values(column).tolist() == [
+        "[1, 2]",
+        '["a", "b"]',
+        '[{"a": [1, null]}]',
+        "[1, 2]",
+        "[]",
+        "{'a': 1}",
+        "ü",
+        "1",
+        "1.5",
+        "True",
+        "1.1",
+        "2020-01-01 00:00:00",
+        "ab",
+        "00000000-0000-0000-0000-000000000001",
+        None,
+        None,
+        None,
+        None,
+    ]
+    # the input is left untouched
+    assert column[0] == [1, 2]
+
+
+def test_from_chunks() -> None:
+    """
+    Test that the types inferred for each chunk of rows are reconciled.
+    """
+    description = [
+        ("null_then_int", "int"),
+        ("int_then_float", "float"),
+        ("int_then_str", "varchar"),
+        ("str", "varchar"),
+    ]
+    chunks = [
+        [(None, 1, 1, "a"), (None, 2, 2, "b")],
+        [(3, 2.5, "c", "c")],
+    ]
+
+    result_set = SupersetResultSet.from_chunks(chunks, description, BaseEngineSpec)
+
+    assert result_set.size == 3
+    assert [str(field.type) for field in result_set.table.schema] == [
+        "int64",
+        "double",
+        "string",
+        "string",
+    ]
+    assert result_set.to_pandas_df().to_dict("list") == {
+        "null_then_int": [None, None, 3],
+        "int_then_float": [1.0, 2.0, 2.5],
+        "int_then_str": ["1", "2", "c"],
+        "str": ["a", "b", "c"],
+    }
+    assert (
+        result_set.columns
+        == SupersetResultSet(
+            [row for chunk in chunks for row in chunk], description, BaseEngineSpec
+        ).columns
+    )
+
+    result_set = SupersetResultSet.from_chunks([], description, BaseEngineSpec)
+    assert result_set.size == 0
@@ -19,6 +19,7 @@
 
 import json
 
+import fakeredis
 import pytest
 from flask_appbuilder.security.sqla.models import Role, User
 from pytest_mock import MockerFixture
@@ -29,6 +30,7 @@ from superset.exceptions import SupersetSecurityException
 from superset.extensions import appbuilder
 from superset.models.slice import Slice
 from superset.security.manager import (
+    PermissionsIndex,
     query_context_modified,
     SupersetSecurityManager,
 )
@@ -1169,3 +1171,285 @@ def test_get_catalogs_accessible_by_user_schema_access(
     catalogs = {"catalog1", "catalog2"}
 
     assert sm.get_catalogs_accessible_by_user(database, catalogs) == {"catalog2"}
+
+
+def test_get_rls_filters_cache(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that the row level security filters are cached by roles and table, until a
+    filter is written.
+    """
+    from flask import current_app
+    from flask_caching.backends import RedisCache
+
+    from superset.connectors.sqla.models import RowLevelSecurityFilter
+    from superset.extensions import cache_manager
+    from superset.utils.core import RowLevelSecurityFilterType
+
+    mocker.patch.object(cache_manager, "_cache", RedisCache(fakeredis.FakeRedis()))
+    stats_logger = mocker.MagicMock()
+    mocker.patch.dict(current_app.config, {"STATS_LOGGER": stats_logger})
+
+    sm = SupersetSecurityManager(appbuilder)
+    session = sm.get_session
+    engine = session.get_bind()
+    SqlaTable.metadata.create_all(engine)  # pylint: disable=no-member
+
+    role = Role(name="Gamma")
+    user = User(
+        first_name="Alice",
+        last_name="Doe",
+        email="adoe@example.org",
+        username="adoe",
+        roles=[role],
+    )
+    table = SqlaTable(
+        table_name="test_table",
+        database=Database(database_name="my_database", sqlalchemy_uri="sqlite://"),
+    )
+    rls_filter = RowLevelSecurityFilter(
+        name="filter",
+        filter_type=RowLevelSecurityFilterType.REGULAR,
+        clause="a = 1",
+        roles=[role],
+        tables=[table],
+    )
+    session.add_all([user, table, rls_filter])
+    session.commit()
+
+    get_rls_filters = mocker.spy(sm, "_get_rls_filters")
+    with override_user(user):
+        assert [f.clause for f in sm.get_rls_filters(table)] == ["a = 1"]
+        assert [f.clause for f in sm.get_rls_filters(table)] == ["a = 1"]
+        assert get_rls_filters.call_count == 1
+        stats_logger.incr.assert_has_calls(
+            [
+                mocker.call("rls_filters.cache_miss"),
+                mocker.call("rls_filters.cache_hit"),
+            ]
+        )
+
+        # uncommitted changes bypass the cache
+        rls_filter.clause = "a = 2"
+        session.flush()
+        assert [f.clause for f in sm.get_rls_filters(table)] == ["a = 2"]
+        assert get_rls_filters.call_count == 2
+
+        # committed changes invalidate it
+        session.commit()
+        assert [f.clause for f in sm.get_rls_filters(table)] == ["a = 2"]
+        assert [f.clause for f in sm.get_rls_filters(table)] == ["a = 2"]
+        assert get_rls_filters.call_count == 3
+
+
+def test_get_rls_filters_cache_other_worker(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that the row level security filters cached by a worker are invalidated by
+    a filter written in another worker, and aren't cached at all when the version
+    can't be shared by the workers.
+    """
+    from flask_caching.backends import RedisCache, SimpleCache
+
+    from superset.connectors.sqla.models import RowLevelSecurityFilter
+    from superset.extensions import cache_manager
+    from superset.utils.core import RowLevelSecurityFilterType
+
+    # each worker has its own connection to the same Redis server
+    server = fakeredis.FakeServer()
+    worker_cache = RedisCache(fakeredis.FakeRedis(server=server))
+    other_worker_cache = RedisCache(fakeredis.FakeRedis(server=server))
+    mocker.patch.object(cache_manager, "_cache", worker_cache)
+
+    sm = SupersetSecurityManager(appbuilder)
+    session = sm.get_session
+    engine = session.get_bind()
+    SqlaTable.metadata.create_all(engine)  # pylint: disable=no-member
+
+    role = Role(name="Analyst")
+    user = User(
+        first_name="Carol",
+        last_name="Doe",
+        email="cdoe@example.org",
+        username="cdoe",
+        roles=[role],
+    )
+    table = SqlaTable(
+        table_name="other_table",
+        database=Database(database_name="other_database", sqlalchemy_uri="sqlite://"),
+    )
+    rls_filter = RowLevelSecurityFilter(
+        name="other_filter",
+        filter_type=RowLevelSecurityFilterType.REGULAR,
+        clause="a = 1",
+        roles=[role],
+        tables=[table],
+    )
+    session.add_all([user, table, rls_filter])
+    session.commit()
+
+    get_rls_filters = mocker.spy(sm, "_get_rls_filters")
+    with override_user(user):
+        assert [f.clause for f in sm.get_rls_filters(table)] == ["a = 1"]
+        assert [f.clause for f in sm.get_rls_filters(table)] == ["a = 1"]
+        assert get_rls_filters.call_count == 1
+
+        # the filter is written by the other worker, which bumps the shared version
+        mocker.patch.object(cache_manager, "_cache", other_worker_cache)
+        rls_filter.clause = "a = 2"
+        session.commit()
+
+        mocker.patch.object(cache_manager, "_cache", worker_cache)
+        assert [f.clause for f in sm.get_rls_filters(table)] == ["a = 2"]
+        assert get_rls_filters.call_count == 2
+
+        # a version in a per-process cache wouldn't see the other workers' writes
+        mocker.patch.object(cache_manager, "_cache", SimpleCache())
+        assert [f.clause for f in sm.get_rls_filters(table)] == ["a = 2"]
+        assert [f.clause for f in sm.get_rls_filters(table)] == ["a = 2"]
+        assert get_rls_filters.call_count == 4
+
+
+def test_get_rls_filters_cache_metastore(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that the row level security filters can be written, and aren't cached, when
+    the cache is stored in the metastore.
+    """
+    from uuid import uuid4
+
+    from superset.connectors.sqla.models import RowLevelSecurityFilter
+    from superset.extensions import cache_manager
+    from superset.extensions.metastore_cache import SupersetMetastoreCache
+    from superset.key_value.models import KeyValueEntry
+    from superset.key_value.types import PickleKeyValueCodec
+    from superset.utils.core import RowLevelSecurityFilterType
+
+    cache = SupersetMetastoreCache(namespace=uuid4(), codec=PickleKeyValueCodec())
+    mocker.patch.object(cache_manager, "_cache", cache)
+
+    sm = SupersetSecurityManager(appbuilder)
+    session = sm.get_session
+    engine = session.get_bind()
+    SqlaTable.metadata.create_all(engine)  # pylint: disable=no-member
+    KeyValueEntry.metadata.create_all(engine)  # pylint: disable=no-member
+
+    role = Role(name="Alpha")
+    user = User(
+        first_name="Dave",
+        last_name="Doe",
+        email="ddoe@example.org",
+        username="ddoe",
+        roles=[role],
+    )
+    table = SqlaTable(
+        table_name="metastore_table",
+        database=Database(
+            database_name="metastore_database",
+            sqlalchemy_uri="sqlite://",
+        ),
+    )
+    rls_filter = RowLevelSecurityFilter(
+        name="metastore_filter",
+        filter_type=RowLevelSecurityFilterType.REGULAR,
+        clause="a = 1",
+        roles=[role],
+        tables=[table],
+    )
+    session.add_all([user, table, rls_filter])
+    session.commit()
+
+    get_rls_filters = mocker.spy(sm, "_get_rls_filters")
+    with override_user(user):
+        assert [f.clause for f in sm.get_rls_filters(table)] == ["a = 1"]
+
+        rls_filter.clause = "a = 2"
+        session.commit()
+        assert [f.clause for f in sm.get_rls_filters(table)] == ["a = 2"]
+        assert get_rls_filters.call_count == 2
+
+    assert not cache.has("superset_rls_filters_version")
+
+
+def test_permissions_snapshot(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that the permissions of the user are loaded once per request and view menu
+    or permission, until roles or permissions are written.
+    """
+    sm = SupersetSecurityManager(appbuilder)
+    session = sm.get_session
+    engine = session.get_bind()
+    SqlaTable.metadata.create_all(engine)  # pylint: disable=no-member
+
+    role = Role(name="Viewer")
+    user = User(
+        first_name="Bob",
+        last_name="Doe",
+        email="bdoe@example.org",
+        username="bdoe",
+        roles=[role],
+    )
+    session.add(user)
+    session.flush()
+    sm.add_permission_role(role, sm.add_permission_view_menu("can_read", "Chart"))
+    sm.add_permission_role(role, sm.add_permission_view_menu("can_read", "Dashboard"))
+    sm.add_permission_role(
+        role,
+        sm.add_permission_view_menu("datasource_access", "[db].[table](id:1)"),
+    )
+
+    load_role_permissions = mocker.spy(sm, "_load_role_permissions")
+    with override_user(user):
+        # only the permissions on the checked view menu are loaded
+        assert sm.can_access("can_read", "Chart")
+        assert not sm.can_access("can_write", "Chart")
+        assert load_role_permissions.call_count == 1
+        assert load_role_permissions.call_args[0][1:] == (
+            PermissionsIndex.PERMISSIONS,
+            "Chart",
+        )
+
+        assert sm.user_view_menu_names("datasource_access") == {"[db].[table](id:1)"}
+        assert sm.user_view_menu_names("schema_access") == set()
+        assert load_role_permissions.call_count == 3
+
+        # answered from the view menus of the permission
+        assert sm.can_access("datasource_access", "[db].[table](id:1)")
+        assert not sm.can_access("datasource_access", "[db].[table](id:2)")
+        assert load_role_permissions.call_count == 3
+
+        sm.add_permission_role(role, sm.add_permission_view_menu("can_write", "Chart"))
+        assert sm.can_access("can_write", "Chart")
+        assert load_role_permissions.call_count == 4
+
+
+def test_permissions_snapshot_ttl(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that the permissions are cached across requests when
+    `PERMISSIONS_CACHE_TTL` is set.
+    """
+    from flask import current_app, g
+
+    from superset.security.manager import PERMISSIONS_SNAPSHOTS_KEY
+
+    mocker.patch.dict(current_app.config, {"PERMISSIONS_CACHE_TTL": 60})
+    sm = SupersetSecurityManager(appbuilder)
+    load_role_permissions = mocker.patch.object(
+        sm,
+        "_load_role_permissions",
+        return_value=frozenset({"can_read"}),
+    )
+    user = mocker.MagicMock(is_anonymous=False, roles=[mocker.MagicMock(id=1)])
+
+    assert sm._has_role_permission(user, "can_read", "Chart")
+    g.pop(PERMISSIONS_SNAPSHOTS_KEY)
+    assert sm._has_role_permission(user, "can_read", "Chart")
+    assert load_role_permissions.call_count == 1
+
+    mocker.patch("superset.security.manager.time.monotonic", return_value=1e12)
+    g.pop(PERMISSIONS_SNAPSHOTS_KEY)
+    assert sm._has_role_permission(user, "can_read", "Chart")
+    assert load_role_permissions.call_count == 2
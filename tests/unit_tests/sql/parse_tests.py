@@ -18,10 +18,13 @@
 
 
 import pytest
+from flask import current_app
+from pytest_mock import MockerFixture
 from sqlglot import Dialects
 
 from superset.exceptions import SupersetParseError
 from superset.sql.parse import (
+    _parse_cache,
     extract_tables_from_statement,
     KustoKQLStatement,
     split_kql,
@@ -1070,3 +1073,34 @@ def test_is_mutating(engine: str) -> None:
         "with source as ( select 1 as one ) select * from source",
         engine=engine,
     ).is_mutating()
+
+
+def test_parse_cache(mocker: MockerFixture) -> None:
+    """
+    Test that scripts are parsed once per engine, returning copies of the cached
+    statements.
+    """
+    _parse_cache.clear()
+    parse = mocker.spy(SQLStatement, "_parse_uncached")
+    stats_logger = mocker.MagicMock()
+    mocker.patch.dict(current_app.config, {"STATS_LOGGER": stats_logger})
+    sql = "SELECT * FROM some_table WHERE id = 1"
+
+    statement = SQLStatement(sql, "postgresql")
+    statement._parsed.set("where", None)
+    assert SQLScript(sql, "postgresql").statements[0].format() == (
+        "SELECT\n  *\nFROM some_table\nWHERE\n  id = 1"
+    )
+    assert SQLStatement(sql, "postgresql").tables == {Table("some_table")}
+    assert parse.call_count == 1
+
+    SQLStatement(sql, "mysql")
+    assert parse.call_count == 2
+    stats_logger.incr.assert_has_calls(
+        [
+            mocker.call("sql_parse.cache_miss"),
+            mocker.call("sql_parse.cache_hit"),
+            mocker.call("sql_parse.cache_hit"),
+            mocker.call("sql_parse.cache_miss"),
+        ]
+    )
@@ -17,6 +17,7 @@
 # pylint: disable=import-outside-toplevel, invalid-name, unused-argument, too-many-locals
 
 import json
+from typing import Optional
 from unittest import mock
 from uuid import UUID
 
@@ -75,6 +76,104 @@ def test_execute_sql_statement(mocker: MockerFixture, app: None) -> None:
     SupersetResultSet.assert_called_with([(42,)], cursor.description, db_engine_spec)
 
 
+@mock.patch.dict(
+    "superset.sql_lab.config",
+    {"SQLLAB_FETCH_BATCH_SIZE": 2},
+)
+def test_execute_sql_statement_fetch_batches(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that `execute_sql_statement` converts the rows to Arrow batch by batch.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.sql_lab import execute_sql_statement
+
+    query = mocker.MagicMock()
+    query.limit = 2
+    query.select_as_cta_used = False
+    database = query.database
+    database.allow_dml = False
+    database.mutate_sql_based_on_config.return_value = "SELECT * FROM t LIMIT 3"
+    db_engine_spec = database.db_engine_spec
+    db_engine_spec.is_select_query.return_value = True
+    db_engine_spec.get_datatype = BaseEngineSpec.get_datatype
+    db_engine_spec.fetch_data_chunks.return_value = iter([[(1,), (2,)], [(3,)]])
+
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "INTEGER")]
+
+    result_set = execute_sql_statement(
+        "SELECT * FROM t",
+        query,
+        cursor=cursor,
+        log_params={},
+        apply_ctas=False,
+    )
+
+    db_engine_spec.fetch_data_chunks.assert_called_with(cursor, 2, 3)
+    db_engine_spec.fetch_data.assert_not_called()
+    # the extra row, fetched to find out if the results are limited, is dropped
+    assert result_set.to_pandas_df().to_dict("list") == {"a": [1, 2]}
+
+
+@pytest.mark.parametrize(
+    "fetch_batch_size,expected_fetch_batch_size",
+    [(2, 2), (None, 10000)],
+)
+def test_execute_sql_statement_payload_limit_during_fetch(
+    mocker: MockerFixture,
+    app: None,
+    fetch_batch_size: Optional[int],
+    expected_fetch_batch_size: int,
+) -> None:
+    """
+    Test that `execute_sql_statement` cancels a query as soon as its results exceed
+    the payload limit while they're fetched, batching the fetch even when
+    `SQLLAB_FETCH_BATCH_SIZE` isn't set.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.sql_lab import (
+        execute_sql_statement,
+        SqlLabPayloadTooLargeException,
+    )
+
+    query = mocker.MagicMock()
+    query.limit = None
+    query.select_as_cta_used = False
+    database = query.database
+    database.allow_dml = False
+    database.mutate_sql_based_on_config.return_value = "SELECT * FROM t"
+    db_engine_spec = database.db_engine_spec
+    db_engine_spec.is_select_query.return_value = True
+    db_engine_spec.get_datatype = BaseEngineSpec.get_datatype
+    chunks = iter([[("x" * 1000,), ("y" * 1000,)] for _ in range(10)])
+    db_engine_spec.fetch_data_chunks.return_value = chunks
+    cancel_query = mocker.patch("superset.sql_lab.cancel_query", return_value=True)
+    mocker.patch.dict(
+        "superset.sql_lab.config",
+        {"SQLLAB_FETCH_BATCH_SIZE": fetch_batch_size, "SQLLAB_PAYLOAD_MAX_MB": 0.001},
+    )
+
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "VARCHAR")]
+
+    with pytest.raises(SqlLabPayloadTooLargeException) as excinfo:
+        execute_sql_statement(
+            "SELECT * FROM t",
+            query,
+            cursor=cursor,
+            log_params={},
+            apply_ctas=False,
+        )
+
+    assert excinfo.value.error.error_type == SupersetErrorType.RESULT_TOO_LARGE_ERROR
+    db_engine_spec.fetch_data_chunks.assert_called_with(
+        cursor, expected_fetch_batch_size, None
+    )
+    cancel_query.assert_called_once_with(query)
+    # the fetch stopped after the first chunk, about 2 KB
+    assert len(list(chunks)) == 9
+
+
 def test_execute_sql_statement_with_rls(
     mocker: MockerFixture,
 ) -> None:
@@ -236,6 +335,59 @@ def test_execute_sql_statement_within_payload_limit(mocker: MockerFixture) -> No
         )
 
 
+@mock.patch.dict(
+    "superset.sql_lab.config",
+    {
+        "RESULTS_BACKEND_ARROW_COMPRESSION": "zstd",
+        "RESULTS_BACKEND_ARROW_BATCH_SIZE": 2,
+    },
+)
+def test_execute_sql_statements_arrow_payload(mocker: MockerFixture) -> None:
+    """
+    Test that results are stored in the Arrow format when it's enabled.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+    from superset.sqllab.arrow_payload import ArrowResultsPayload
+
+    query = mocker.MagicMock()
+    query.limit = 5
+    query.database.db_engine_spec = BaseEngineSpec
+    query.database.cache_timeout = 100
+    query.database.allow_run_async = True
+    query.select_as_cta = False
+    query.to_dict.return_value = {"rows": 5}
+    mocker.patch("superset.sql_lab.get_query", return_value=query)
+    mocker.patch("superset.sql_lab.db")
+    mocker.patch(
+        "superset.sql_lab.execute_sql_statement",
+        return_value=SupersetResultSet(
+            [(i,) for i in range(5)],
+            [("answer", "int")],
+            BaseEngineSpec,
+        ),
+    )
+    results_backend = mocker.patch("superset.sql_lab.results_backend")
+
+    payload = execute_sql_statements(
+        query_id=1,
+        rendered_query="SELECT answer FROM t",
+        return_results=True,
+        store_results=True,
+        start_time=None,
+        expand_data=False,
+        log_params={},
+    )
+
+    assert payload["data"] == [{"answer": i} for i in range(5)]
+    key, blob, _ = results_backend.set.call_args.args
+    assert payload["query"]["resultsKey"] == key
+    arrow_payload = ArrowResultsPayload(blob)
+    assert arrow_payload.batch_rows == [2, 2, 1]
+    assert arrow_payload.metadata["query"]["resultsKey"] == key
+    assert arrow_payload.read(3).column("answer").to_pylist() == [3, 4]
+
+
 def test_sql_lab_insert_rls_as_subquery(
     mocker: MockerFixture,
     session: Session,
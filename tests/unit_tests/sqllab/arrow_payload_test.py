@@ -0,0 +1,209 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pyarrow as pa
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.db_engine_specs.base import BaseEngineSpec
+from superset.exceptions import SerializationError
+from superset.sqllab.arrow_payload import (
+    ArrowResultsPayload,
+    is_arrow_payload,
+    serialize_arrow_payload,
+)
+from superset.utils.core import zlib_compress
+
+PAYLOAD = {
+    "status": "success",
+    "data": b"ignored",
+    "columns": [{"name": "id"}, {"name": "name"}],
+    "selected_columns": [{"name": "id"}, {"name": "name"}],
+    "expanded_columns": [],
+    "query": {"rows": 25},
+}
+
+TABLE = pa.table(
+    {
+        "id": list(range(25)),
+        "name": [f"name_{i}" for i in range(25)],
+    }
+)
+
+
+@pytest.mark.parametrize("compression", ["lz4", "zstd", None])
+def test_arrow_payload_roundtrip(compression: str | None) -> None:
+    """
+    Test that the metadata and the rows are stored and read back.
+    """
+    blob = serialize_arrow_payload(PAYLOAD, TABLE, compression, max_chunksize=10)
+
+    assert is_arrow_payload(blob)
+    payload = ArrowResultsPayload(blob)
+    assert payload.metadata == {
+        key: value for key, value in PAYLOAD.items() if key != "data"
+    }
+    assert payload.batch_rows == [10, 10, 5]
+    assert payload.num_rows == 25
+    assert payload.read().equals(TABLE)
+
+
+@pytest.mark.parametrize(
+    "offset, limit, batches",
+    [
+        (0, None, [0, 1, 2]),
+        (0, 5, [0]),
+        (8, 4, [0, 1]),
+        (20, 10, [2]),
+        (25, 10, []),
+    ],
+)
+def test_arrow_payload_read_range(
+    offset: int,
+    limit: int | None,
+    batches: list[int],
+) -> None:
+    """
+    Test that reading a range of rows only decodes the batches it spans.
+    """
+    blob = serialize_arrow_payload(PAYLOAD, TABLE, "lz4", max_chunksize=10)
+    payload = ArrowResultsPayload(blob)
+    reader = payload._reader
+    read_batches: list[int] = []
+
+    class Reader:
+        schema = reader.schema
+
+        def get_batch(self, index: int) -> pa.RecordBatch:
+            read_batches.append(index)
+            return reader.get_batch(index)
+
+    payload._reader = Reader()
+
+    table = payload.read(offset, limit)
+
+    end = 25 if limit is None else offset + limit
+    assert table.equals(TABLE.slice(offset, end - offset))
+    assert read_batches == batches
+
+
+def test_arrow_payload_legacy_format() -> None:
+    """
+    Test that payloads in the other formats are not mistaken for Arrow ones.
+    """
+    assert not is_arrow_payload(zlib_compress(b"\x82\xa4data\xc0"))
+    assert not is_arrow_payload('{"data": []}')
+
+    with pytest.raises(SerializationError):
+        ArrowResultsPayload(zlib_compress("{}"))
+
+    with pytest.raises(SerializationError):
+        ArrowResultsPayload(b"SSARROW1\x02\x00\x00\x00{}garbage")
+
+
+def test_load_results_payload(mocker: MockerFixture) -> None:
+    """
+    Test that Arrow payloads are loaded regardless of `RESULTS_BACKEND_USE_MSGPACK`.
+    """
+    from superset.views.utils import _load_results_payload
+
+    mocker.patch("superset.views.utils.results_backend")
+    query = mocker.MagicMock()
+    query.database.db_engine_spec = BaseEngineSpec
+    blob = serialize_arrow_payload(PAYLOAD, TABLE, "zstd", max_chunksize=10)
+
+    obj = _load_results_payload(blob, query, use_msgpack=False, limit=3)
+
+    assert obj["query"] == {"rows": 25}
+    assert obj["data"] == [{"id": i, "name": f"name_{i}"} for i in range(3)]
+    assert obj["columns"] == [
+        {"name": "id", "column_name": "id"},
+        {"name": "name", "column_name": "name"},
+    ]
+
+
+def test_chunked_arrow_payload() -> None:
+    """
+    Test that large results are split in chunks, and that reading a range of rows
+    only fetches the chunks it spans, once.
+    """
+    from superset.sqllab.arrow_payload import (
+        get_chunk_cache,
+        load_arrow_payload,
+        serialize_chunked_arrow_payload,
+    )
+
+    manifest, chunks = serialize_chunked_arrow_payload(
+        "abc",
+        PAYLOAD,
+        TABLE,
+        "lz4",
+        chunk_size=10,
+        max_chunksize=4,
+    )
+    assert list(chunks) == ["abc-chunk-0", "abc-chunk-1", "abc-chunk-2"]
+    assert is_arrow_payload(manifest)
+
+    fetched: list[str] = []
+
+    def get_blob(key: str) -> bytes:
+        fetched.append(key)
+        return chunks[key]
+
+    get_chunk_cache().clear()
+    payload = load_arrow_payload(manifest, get_blob)
+    assert payload.num_rows == 25
+    assert payload.metadata["query"] == {"rows": 25}
+
+    assert payload.read(8, 4).equals(TABLE.slice(8, 4))
+    assert fetched == ["abc-chunk-0", "abc-chunk-1"]
+
+    assert payload.read(5, 10).equals(TABLE.slice(5, 10))
+    assert payload.read().equals(TABLE)
+    assert fetched == ["abc-chunk-0", "abc-chunk-1", "abc-chunk-2"]
+
+    assert payload.read(30, 10).num_rows == 0
+
+
+def test_chunked_arrow_payload_small_results() -> None:
+    """
+    Test that results smaller than a chunk are stored in a single payload.
+    """
+    from superset.sqllab.arrow_payload import serialize_chunked_arrow_payload
+
+    blob, chunks = serialize_chunked_arrow_payload(
+        "abc", PAYLOAD, TABLE, "lz4", chunk_size=25
+    )
+
+    assert chunks == {}
+    assert ArrowResultsPayload(blob).read().equals(TABLE)
+
+
+def test_chunked_arrow_payload_missing_chunk() -> None:
+    """
+    Test that an expired chunk is reported as a deserialization error.
+    """
+    from superset.sqllab.arrow_payload import (
+        load_arrow_payload,
+        serialize_chunked_arrow_payload,
+    )
+
+    manifest, _ = serialize_chunked_arrow_payload(
+        "missing", PAYLOAD, TABLE, "lz4", chunk_size=10
+    )
+
+    with pytest.raises(SerializationError):
+        load_arrow_payload(manifest, lambda key: None).read(12, 1)
@@ -20,6 +20,7 @@ import pytest
 from flask_babel import lazy_gettext as _
 
 from superset.commands.chart.exceptions import ChartDataQueryFailedError
+from superset.constants import CacheRegion
 
 
 @mock.patch("superset.tasks.async_queries.security_manager")
@@ -53,3 +54,62 @@ def test_load_chart_data_into_cache_with_error(
     mock_async_query_manager.update_job.assert_called_once_with(
         job_metadata, "error", errors=expected_errors
     )
+
+
+@mock.patch("superset.tasks.async_queries.security_manager")
+@mock.patch("superset.tasks.async_queries.async_query_manager")
+@mock.patch("superset.tasks.async_queries.ChartDataQueryContextSchema")
+def test_load_chart_data_into_cache_attached_jobs(
+    mock_query_context_schema_cls, mock_async_query_manager, mock_security_manager
+):
+    """Test that the jobs attached to the task are notified of its result"""
+    from superset.tasks.async_queries import load_chart_data_into_cache
+
+    job_metadata = {"user_id": 1}
+    mock_async_query_manager.STATUS_DONE = "done"
+
+    with mock.patch(
+        "superset.commands.chart.data.get_data_command.ChartDataCommand"
+    ) as mock_command_cls:
+        mock_command_cls.return_value.run.return_value = {"cache_key": "abc"}
+        load_chart_data_into_cache(job_metadata, {}, job_key="job-key")
+
+    mock_async_query_manager.update_job.assert_called_once_with(
+        job_metadata, "done", result_url="/api/v1/chart/data/abc"
+    )
+    mock_async_query_manager.update_attached_jobs.assert_called_once_with(
+        "job-key", "done", result_url="/api/v1/chart/data/abc"
+    )
+
+
+@mock.patch("superset.tasks.async_queries.security_manager")
+@mock.patch("superset.tasks.async_queries.QueryCacheManager")
+@mock.patch("superset.tasks.async_queries.ChartDataQueryContextSchema")
+def test_refresh_chart_data_cache(
+    mock_query_context_schema_cls, mock_query_cache_manager, mock_security_manager
+):
+    """Test that the query is forced to run again, and the refresh released"""
+    from superset.tasks.async_queries import refresh_chart_data_cache
+
+    mock_query_context_schema = mock_query_context_schema_cls.return_value
+    query_context = mock_query_context_schema.load.return_value
+    query_context.queries = [mock.MagicMock(), mock.MagicMock()]
+    query_context.get_df_payload.return_value = {"status": "success"}
+
+    refresh_chart_data_cache({"user_id": 1}, {"queries": []}, 1, "abc")
+
+    mock_query_context_schema.load.assert_called_once_with(
+        {"queries": [], "force": True}
+    )
+    query_context.get_df_payload.assert_called_once_with(query_context.queries[1])
+    mock_query_cache_manager.release_refresh.assert_called_once_with(
+        "abc", region=CacheRegion.DATA
+    )
+
+    mock_query_cache_manager.reset_mock()
+    query_context.get_df_payload.side_effect = Exception("Something went wrong")
+    with pytest.raises(Exception, match="Something went wrong"):
+        refresh_chart_data_cache({"user_id": 1}, {"queries": []}, 1, "abc")
+    mock_query_cache_manager.release_refresh.assert_called_once_with(
+        "abc", region=CacheRegion.DATA
+    )
@@ -0,0 +1,68 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+
+from superset.utils.arrow import arrow_ipc_to_df, df_to_arrow_ipc, df_to_arrow_table
+
+
+def test_df_to_arrow_ipc_roundtrip() -> None:
+    """
+    Test that a DataFrame survives the Arrow IPC serialization.
+    """
+    df = pd.DataFrame(
+        {
+            "ds": [datetime(2023, 1, 1), datetime(2023, 1, 2), None],
+            "name": ["a", None, "c"],
+            "num": [1.0, 2.5, None],
+        }
+    )
+
+    assert arrow_ipc_to_df(df_to_arrow_ipc(df)).equals(df)
+
+
+def test_df_to_arrow_ipc_chunks() -> None:
+    """
+    Test that the stream is split into record batches of bounded size.
+    """
+    df = pd.DataFrame({"num": range(10)})
+
+    with pa.ipc.open_stream(df_to_arrow_ipc(df, max_chunksize=4)) as reader:
+        assert [batch.num_rows for batch in reader] == [4, 4, 2]
+
+
+def test_df_to_arrow_table_drops_index() -> None:
+    """
+    Test that the index is dropped, as in the JSON records format.
+    """
+    df = pd.DataFrame({"num": [1, 2]}, index=["a", "b"])
+
+    assert df_to_arrow_table(df).column_names == ["num"]
+
+
+def test_df_to_arrow_table_mixed_types() -> None:
+    """
+    Test that columns pyarrow can't convert natively are stringified.
+    """
+    df = pd.DataFrame({"mixed": [1, "a", {"b": 2}], "num": [1, 2, 3]})
+
+    table = df_to_arrow_table(df)
+
+    assert table.column("mixed").to_pylist() == ["1", "a", "{'b': 2}"]
+    assert table.column("num").to_pylist() == [1, 2, 3]
@@ -49,3 +49,69 @@ def test_memoized_func(mocker: MockerFixture) -> None:
     cache.get.return_value = 43
     result = decorated(self, "public", cache=True)
     assert result == 43
+
+
+def test_add_to_cache_index(mocker: MockerFixture) -> None:
+    """
+    Test that cache keys are indexed by datasource in a Redis set, which lives as
+    long as its longest lived key.
+    """
+    from superset.utils.cache import add_to_cache_index
+
+    cache = mocker.MagicMock()
+    cache.cache.key_prefix = "superset_"
+    client = cache.cache._write_client
+    pipe = client.pipeline.return_value
+
+    pipe.execute.return_value = [0, -2, 1]
+    add_to_cache_index(cache, "1__table", ["key"], 300)
+    pipe.sadd.assert_called_with("superset_cache_index_1__table", "key")
+    client.expire.assert_called_with("superset_cache_index_1__table", 300)
+
+    client.reset_mock()
+    pipe.execute.return_value = [1, 600, 1]
+    add_to_cache_index(cache, "1__table", ["key"], 300)
+    client.expire.assert_not_called()
+
+    pipe.execute.return_value = [1, 600, 1]
+    add_to_cache_index(cache, "1__table", ["key"], 0)
+    client.persist.assert_called_with("superset_cache_index_1__table")
+
+
+def test_add_to_cache_index_no_redis(mocker: MockerFixture) -> None:
+    """
+    Test that nothing is indexed when the cache isn't backed by Redis.
+    """
+    from superset.utils.cache import add_to_cache_index, invalidate_cache_index
+
+    cache = mocker.MagicMock()
+    cache.cache._write_client = None
+
+    add_to_cache_index(cache, "1__table", ["key"], 300)
+    assert invalidate_cache_index(cache, "1__table") == 0
+
+
+def test_invalidate_cache_index(mocker: MockerFixture) -> None:
+    """
+    Test that the indexed keys of a datasource are deleted in pipelined batches.
+    """
+    from superset.utils.cache import invalidate_cache_index
+
+    mocker.patch("superset.utils.cache.CACHE_INVALIDATION_BATCH_SIZE", 2)
+    cache = mocker.MagicMock()
+    cache.cache.key_prefix = "superset_"
+    client = cache.cache._write_client
+    client.sscan_iter.return_value = iter([b"a", b"b", b"c"])
+    pipe = client.pipeline.return_value
+
+    assert invalidate_cache_index(cache, "1__table") == 3
+
+    assert pipe.execute.call_count == 2
+    assert pipe.delete.call_args_list == [
+        mocker.call("superset_a", "superset_b"),
+        mocker.call("superset_c"),
+    ]
+    assert pipe.srem.call_args_list == [
+        mocker.call("superset_cache_index_1__table", "a", "b"),
+        mocker.call("superset_cache_index_1__table", "c"),
+    ]
@@ -15,6 +15,8 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import tracemalloc
+
 import pandas as pd
 import pyarrow as pa
 import pytest  # noqa: F401
@@ -95,3 +97,44 @@ def test_df_to_escaped_csv():
 
     df = pa.array([1, None]).to_pandas(integer_object_nulls=True).to_frame()
     assert csv.df_to_escaped_csv(df, encoding="utf8", index=False) == '0\n1\n""\n'
+
+
+def test_df_chunks_to_escaped_csv():
+    chunks = [
+        pd.DataFrame({"a": ["=func()", "b"]}),
+        pd.DataFrame({"a": ["c", "-value"]}, index=[5, 6]),
+    ]
+
+    result = "".join(csv.df_chunks_to_escaped_csv(iter(chunks), index=False))
+
+    assert result == "a\n'=func()\nb\nc\n'-value\n"
+
+
+def test_df_chunks_to_escaped_csv_memory():
+    """
+    Test that the memory used to stream a CSV is bounded by the chunk size rather
+    than by the size of the whole export.
+    """
+    chunk_size = 1000
+    num_chunks = 200
+
+    def chunks():
+        for i in range(num_chunks):
+            yield pd.DataFrame(
+                {
+                    "id": range(i * chunk_size, (i + 1) * chunk_size),
+                    "name": [f"name_{j}" for j in range(chunk_size)],
+                }
+            )
+
+    tracemalloc.start()
+    try:
+        size = 0
+        for data in csv.df_chunks_to_escaped_csv(chunks(), index=False):
+            size += len(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert size > 3_000_000
+    assert peak < size / 4
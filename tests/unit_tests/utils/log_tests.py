@@ -14,9 +14,13 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from pathlib import Path
+from unittest.mock import patch
 
+from pytest_mock import MockerFixture
+from sqlalchemy import create_engine
 
-from superset.utils.log import get_logger_from_status
+from superset.utils.log import BufferedDBEventLogger, get_logger_from_status
 
 
 def test_log_from_status_exception() -> None:
@@ -35,3 +39,46 @@ def test_log_from_status_info() -> None:
     (func, log_level) = get_logger_from_status(300)
     assert func.__name__ == "info"
     assert log_level == "info"
+
+
+def test_buffered_db_event_logger(mocker: MockerFixture, tmp_path: Path) -> None:
+    """
+    Test that the logs are written in batches on their own connection, dropping
+    those exceeding the queue size, and that the queue is drained on shutdown.
+    """
+    from superset.models.core import Log
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'superset.db'}")
+    Log.__table__.create(engine)
+    mocker.patch("superset.db", engine=engine)
+    stats_logger = mocker.patch("superset.utils.log.stats_logger_manager")
+
+    event_logger = BufferedDBEventLogger(
+        batch_size=2,
+        flush_interval=0.1,
+        max_queue_size=3,
+    )
+    with patch.object(event_logger, "_start"):
+        event_logger.log(
+            1,
+            "log",
+            None,
+            10,
+            None,
+            None,
+            records=[{"path": f"/{i}"} for i in range(4)],
+        )
+    assert event_logger.dropped == 1
+    stats_logger.instance.incr.assert_called_once_with("event_logger.dropped")
+
+    event_logger._start()
+    event_logger.shutdown()
+    assert not event_logger._thread.is_alive()
+    with engine.connect() as connection:
+        rows = connection.execute(Log.__table__.select()).fetchall()
+    assert [row.json for row in rows] == [
+        '{"path": "/0"}',
+        '{"path": "/1"}',
+        '{"path": "/2"}',
+    ]
+    assert all(row.user_id == 1 and row.dttm for row in rows)
@@ -0,0 +1,138 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from flask import Flask
+from pytest_mock import MockerFixture
+
+from superset.utils.profiler import RequestProfiler, span, StackSampler
+
+
+def make_app(**config: object) -> Flask:
+    app = Flask(__name__)
+    app.config.update(
+        {
+            "STATS_LOGGER": MagicMock(),
+            "PROFILING_SERVER_TIMING": False,
+            "PROFILING_SAMPLING_RATE": 0.0,
+            "PROFILING_SAMPLING_INTERVAL": 0.001,
+            "PROFILING_SAMPLING_DIR": "",
+            **config,
+        }
+    )
+    return app
+
+
+def test_span() -> None:
+    """
+    Test that the duration of the spans is sent to the stats logger.
+    """
+    app = make_app()
+
+    with app.app_context():
+        with span("fetch"):
+            pass
+
+    app.config["STATS_LOGGER"].timing.assert_called_once()
+    assert app.config["STATS_LOGGER"].timing.call_args[0][0] == "profiler.fetch"
+
+    # spans are no-ops outside of an app context
+    with span("fetch"):
+        pass
+
+
+def test_server_timing() -> None:
+    """
+    Test that the durations of the spans are returned in the `Server-Timing` header,
+    summed by stage.
+    """
+    app = make_app(PROFILING_SERVER_TIMING=True)
+    RequestProfiler().init_app(app)
+
+    @app.route("/")
+    def index() -> str:
+        for name in ("db_execute", "fetch", "db_execute"):
+            with span(name):
+                pass
+        return "OK"
+
+    response = app.test_client().get("/")
+    header = response.headers["Server-Timing"]
+    assert [metric.split(";")[0] for metric in header.split(", ")] == [
+        "db_execute",
+        "fetch",
+    ]
+
+
+def test_server_timing_disabled() -> None:
+    app = make_app()
+    RequestProfiler().init_app(app)
+    app.route("/")(lambda: "OK")
+
+    assert "Server-Timing" not in app.test_client().get("/").headers
+
+
+def test_sampling(tmp_path: Path) -> None:
+    """
+    Test that the stacks of the sampled requests are written as collapsed stacks.
+    """
+    app = make_app(PROFILING_SAMPLING_RATE=1.0, PROFILING_SAMPLING_DIR=str(tmp_path))
+    RequestProfiler().init_app(app)
+
+    def slow_view() -> str:
+        time.sleep(0.05)
+        return "OK"
+
+    app.route("/")(slow_view)
+    app.test_client().get("/")
+
+    (path,) = tmp_path.iterdir()
+    assert path.name.endswith("-slow_view.collapsed")
+    lines = path.read_text().splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert f"{__name__}:slow_view" in stack
+
+
+def test_sampling_same_millisecond(tmp_path: Path, mocker: MockerFixture) -> None:
+    """
+    Test that the requests sampled in the same millisecond are written to different
+    files.
+    """
+    app = make_app(PROFILING_SAMPLING_RATE=1.0, PROFILING_SAMPLING_DIR=str(tmp_path))
+    RequestProfiler().init_app(app)
+    app.route("/")(lambda: "OK")
+    mocker.patch("superset.utils.profiler.time.time", return_value=1700000000.0)
+
+    client = app.test_client()
+    client.get("/")
+    client.get("/")
+
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_stack_sampler_collapse() -> None:
+    import sys
+
+    def inner() -> str:
+        return StackSampler._collapse(sys._getframe())
+
+    assert inner().endswith(f"{__name__}:test_stack_sampler_collapse;{__name__}:inner")
@@ -0,0 +1,197 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any
+
+import pytest
+from flask import current_app, g
+from sqlalchemy import event
+from sqlalchemy.orm.session import Session
+
+from superset.utils.concurrency import (
+    database_concurrency_guard,
+    get_database_semaphore,
+    is_concurrent_task,
+    preload,
+    run_concurrently,
+)
+
+
+def test_run_concurrently_sequential() -> None:
+    """
+    Test that tasks run in the calling thread when concurrency is disabled.
+    """
+    threads: list[int] = []
+
+    def task() -> int:
+        threads.append(threading.get_ident())
+        return len(threads)
+
+    assert run_concurrently([task, task, task], max_workers=1) == [1, 2, 3]
+    assert set(threads) == {threading.get_ident()}
+
+
+def test_run_concurrently_order_and_parallelism() -> None:
+    """
+    Test that tasks run in parallel and that results are returned in order.
+    """
+
+    def make_task(value: int, delay: float):
+        def task() -> int:
+            time.sleep(delay)
+            return value
+
+        return task
+
+    start = time.perf_counter()
+    results = run_concurrently(
+        [make_task(1, 0.3), make_task(2, 0.1), make_task(3, 0.2)],
+        max_workers=3,
+    )
+    assert results == [1, 2, 3]
+    assert time.perf_counter() - start < 0.55
+
+
+def test_run_concurrently_propagates_context() -> None:
+    """
+    Test that the app context and `g` are available in the worker threads.
+    """
+    g.user = "admin"
+
+    def task() -> tuple[str, str]:
+        return current_app.name, g.user
+
+    results = run_concurrently([task, task], max_workers=2)
+    assert results == [(current_app.name, "admin")] * 2
+
+
+def test_run_concurrently_raises_first_error() -> None:
+    """
+    Test that the exception of the first failing task is re-raised.
+    """
+
+    def ok() -> int:
+        return 1
+
+    def fail(message: str):
+        def task() -> int:
+            raise ValueError(message)
+
+        return task
+
+    with pytest.raises(ValueError, match="first"):
+        run_concurrently([ok, fail("first"), fail("second")], max_workers=3)
+
+
+def test_run_concurrently_nested() -> None:
+    """
+    Test that the tasks of a nested fan-out run in the thread of their parent task.
+    """
+    threads: list[set[int]] = []
+
+    def nested_task() -> int:
+        return threading.get_ident()
+
+    def task() -> None:
+        threads.append(set(run_concurrently([nested_task, nested_task], max_workers=2)))
+        assert threads[-1] == {threading.get_ident()}
+
+    run_concurrently([task, task], max_workers=2)
+    assert len(threads) == 2
+
+
+def test_preload(session: Session) -> None:
+    """
+    Test that the preloaded instances can be read from the tasks without querying
+    through the session of the calling thread.
+    """
+    from superset.connectors.sqla.models import SqlaTable, SqlMetric, TableColumn
+    from superset.models.core import Database
+
+    engine = session.get_bind()
+    SqlaTable.metadata.create_all(engine)  # pylint: disable=no-member
+    table = SqlaTable(
+        table_name="my_table",
+        database=Database(database_name="my_database", sqlalchemy_uri="sqlite://"),
+        columns=[TableColumn(column_name="a")],
+        metrics=[SqlMetric(metric_name="count", expression="COUNT(*)")],
+    )
+    session.add(table)
+    session.commit()
+
+    threads: set[int] = set()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(*args: Any) -> None:
+        threads.add(threading.get_ident())
+
+    # the instances are expired by the commit
+    preload(table, "database", "columns", "metrics", "unknown")
+    assert threads == {threading.get_ident()}
+
+    threads.clear()
+
+    def task() -> tuple[str, str, list[str], list[str]]:
+        return (
+            table.table_name,
+            table.database.database_name,
+            [column.column_name for column in table.columns],
+            [metric.metric_name for metric in table.metrics],
+        )
+
+    results = run_concurrently([task, task], max_workers=2)
+    assert results == [("my_table", "my_database", ["a"], ["count"])] * 2
+    assert not threads
+
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    # instances not bound to a session are left untouched
+    preload(SqlaTable(table_name="transient"), "columns")
+    preload(None)
+
+
+def test_get_database_semaphore() -> None:
+    """
+    Test that semaphores are shared per database.
+    """
+    assert get_database_semaphore("db1", 2) is get_database_semaphore("db1", 2)
+    assert get_database_semaphore("db1", 2) is not get_database_semaphore("db2", 2)
+
+
+def test_database_concurrency_guard() -> None:
+    """
+    Test the guard only bounds queries run from concurrent tasks.
+    """
+    assert isinstance(database_concurrency_guard(1), nullcontext)
+    assert not is_concurrent_task()
+
+    def task() -> list[object]:
+        assert is_concurrent_task()
+        return [database_concurrency_guard(None), database_concurrency_guard(1)]
+
+    for unbounded, bounded in run_concurrently([task, task], max_workers=2):
+        assert isinstance(unbounded, nullcontext)
+        assert bounded is get_database_semaphore(1, 4)
+
+    current_app.config["DATABASE_MAX_CONCURRENT_QUERIES"] = None
+    try:
+        for _, bounded in run_concurrently([task, task], max_workers=2):
+            assert isinstance(bounded, nullcontext)
+    finally:
+        current_app.config["DATABASE_MAX_CONCURRENT_QUERIES"] = 4
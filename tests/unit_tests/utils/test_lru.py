@@ -0,0 +1,52 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from superset.utils.lru import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_lru_cache_getsizeof() -> None:
+    cache: LRUCache[str, str] = LRUCache(maxsize=10, getsizeof=len)
+    cache.set("a", "xxxx")
+    cache.set("b", "xxxx")
+    cache.set("a", "xxxxx")
+    assert cache.currsize == 9
+
+    cache.set("c", "xxxx")
+    assert "b" not in cache
+    assert "a" in cache
+    assert cache.currsize == 9
+
+    cache.set("d", "x" * 11)
+    assert "d" not in cache
+    assert len(cache) == 2
+
+    assert cache.pop("c") == "xxxx"
+    assert cache.currsize == 5